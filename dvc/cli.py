@@ -5,91 +5,57 @@ import os
 import sys
 
 from ._debug import add_debugging_flags
-from .command import (
-    add,
-    cache,
-    check_ignore,
-    checkout,
-    commit,
-    completion,
-    config,
-    daemon,
-    dag,
-    data_sync,
-    destroy,
-    diff,
-    experiments,
-    freeze,
-    gc,
-    get,
-    get_url,
-    git_hook,
-    imp,
-    imp_url,
-    init,
-    install,
-    live,
-    ls,
-    machine,
-    metrics,
-    move,
-    params,
-    plots,
-    remote,
-    remove,
-    repro,
-    root,
-    run,
-    stage,
-    unprotect,
-    update,
-    version,
-)
 from .command.base import fix_subparsers
 from .exceptions import DvcParserError
 
 logger = logging.getLogger(__name__)
 
-COMMANDS = [
-    init,
-    get,
-    get_url,
-    destroy,
-    add,
-    remove,
-    move,
-    unprotect,
-    run,
-    repro,
-    data_sync,
-    gc,
-    imp,
-    imp_url,
-    config,
-    checkout,
-    remote,
-    cache,
-    metrics,
-    params,
-    install,
-    root,
-    ls,
-    freeze,
-    dag,
-    daemon,
-    commit,
-    completion,
-    diff,
-    version,
-    update,
-    git_hook,
-    plots,
-    stage,
-    experiments,
-    check_ignore,
-    live,
-    machine,
-]
+# Modules in `dvc.command` along with the commands that each one adds, so
+# that only the module of the command that is being run has to be imported.
+COMMANDS = {
+    "init": ["init"],
+    "get": ["get"],
+    "get_url": ["get-url"],
+    "destroy": ["destroy"],
+    "add": ["add"],
+    "remove": ["remove"],
+    "move": ["move"],
+    "unprotect": ["unprotect"],
+    "run": ["run"],
+    "repro": ["repro"],
+    "data_sync": ["pull", "push", "fetch", "status"],
+    "gc": ["gc"],
+    "imp": ["import"],
+    "imp_url": ["import-url"],
+    "config": ["config"],
+    "checkout": ["checkout"],
+    "remote": ["remote"],
+    "cache": ["cache"],
+    "metrics": ["metrics"],
+    "params": ["params"],
+    "install": ["install"],
+    "root": ["root"],
+    "ls": ["list", "ls"],
+    "freeze": ["freeze", "unfreeze"],
+    "dag": ["dag"],
+    "daemon": ["daemon"],
+    "commit": ["commit"],
+    "completion": ["completion"],
+    "diff": ["diff"],
+    "version": ["version", "doctor"],
+    "update": ["update"],
+    "git_hook": ["git-hook"],
+    "plots": ["plots"],
+    "stage": ["stage"],
+    "experiments": ["experiments", "exp"],
+    "check_ignore": ["check-ignore"],
+    "live": ["live"],
+    "machine": ["machine"],
+}
+
+COMMAND_MODULES = {
+    cmd: module for module, cmds in COMMANDS.items() for cmd in cmds
+}
 
 
 def _find_parser(parser, cmd_cls):
@@ -107,12 +73,46 @@ def _find_parser(parser, cmd_cls):
             _find_parser(subparser, cmd_cls)
 
 
+def _find_command(parser, argv):
+    """Return the command in `argv`, skipping the values of the options of
+    the main `parser`."""
+    # pylint: disable=protected-access
+    options = parser._option_string_actions
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            return next(args, None)
+        if not arg.startswith("-"):
+            return arg
+        if "=" in arg:
+            continue
+        if arg in options:
+            actions = [options[arg]]
+        else:
+            # options can be abbreviated
+            actions = [
+                action
+                for option, action in options.items()
+                if arg.startswith("--") and option.startswith(arg)
+            ]
+        if len(actions) == 1 and actions[0].nargs != 0:
+            next(args, None)
+    return None
+
+
 class DvcParser(argparse.ArgumentParser):
     """Custom parser class for dvc CLI."""
 
+    # whether all of the commands were added to this parser
+    all_commands = True
+
     def error(self, message, cmd_cls=None):  # pylint: disable=arguments-differ
         logger.error(message)
-        _find_parser(self, cmd_cls)
+        parser = self
+        if cmd_cls is None and not self.all_commands:
+            # help message should list all of the commands
+            parser = get_main_parser()
+        _find_parser(parser, cmd_cls)
 
     def parse_args(self, args=None, namespace=None):
         # NOTE: overriding to provide a more granular help message.
@@ -156,7 +156,14 @@ def get_parent_parser():
     return parent_parser
 
 
-def get_main_parser():
+def get_main_parser(argv=None):
+    """Create the main parser.
+
+    If `argv` is given, only the parsers of the command in it are added,
+    which avoids importing all of the other commands.
+    """
+    from importlib import import_module
+
     parent_parser = get_parent_parser()
 
     # Main parser
@@ -209,7 +216,15 @@ def get_main_parser():
 
     fix_subparsers(subparsers)
 
-    for cmd in COMMANDS:
+    modules = list(COMMANDS)
+    if argv is not None:
+        cmd = _find_command(parser, argv)
+        if cmd in COMMAND_MODULES:
+            modules = [COMMAND_MODULES[cmd]]
+            parser.all_commands = False
+
+    for module in modules:
+        cmd = import_module(f".command.{module}", __package__)
         cmd.add_parser(subparsers, parent_parser)
 
     return parser
@@ -224,6 +239,8 @@ def parse_args(argv=None):
     Raises:
         dvc.exceptions.DvcParserError: raised for argument parsing errors.
     """
-    parser = get_main_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = get_main_parser(argv)
     args = parser.parse_args(argv)
     return args
@@ -38,6 +38,7 @@ class CmdDataPull(CmdDataBase):
                 force=self.args.force,
                 recursive=self.args.recursive,
                 run_cache=self.args.run_cache,
+                refresh_listing=self.args.refresh_listing,
                 glob=self.args.glob,
             )
             self.log_summary(stats)
@@ -64,6 +65,7 @@ class CmdDataPush(CmdDataBase):
                 with_deps=self.args.with_deps,
                 recursive=self.args.recursive,
                 run_cache=self.args.run_cache,
+                refresh_listing=self.args.refresh_listing,
                 glob=self.args.glob,
             )
             self.log_summary({"pushed": processed_files_count})
@@ -88,6 +90,7 @@ class CmdDataFetch(CmdDataBase):
                 with_deps=self.args.with_deps,
                 recursive=self.args.recursive,
                 run_cache=self.args.run_cache,
+                refresh_listing=self.args.refresh_listing,
             )
             self.log_summary({"fetched": processed_files_count})
         except DvcException:
@@ -122,6 +125,15 @@ def shared_parent_parser():
             ".dvc files, or stage names."
         ),
     ).complete = completion.DVC_FILE
+    parent_parser.add_argument(
+        "--refresh-listing",
+        action="store_true",
+        default=False,
+        help=(
+            "List the remote again, instead of trusting its listings "
+            "cached for 'listing_ttl' seconds."
+        ),
+    )
 
     return parent_parser
 
@@ -9,7 +9,11 @@ class CmdRepro(CmdBase):
     def run(self):
         from dvc.ui import ui
 
-        stages = self.repo.reproduce(**self._repro_kwargs)
+        stages = self.repo.reproduce(
+            jobs=self.args.jobs,
+            keep_going=self.args.keep_going,
+            **self._repro_kwargs,
+        )
         if len(stages) == 0:
             ui.write(CmdDataStatus.UP_TO_DATE_MSG)
         else:
@@ -166,4 +170,27 @@ def add_parser(subparsers, parent_parser):
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     add_arguments(repro_parser)
+    repro_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of stages to reproduce simultaneously. Output of stage "
+            "commands is shown once they finish, and they can't run other "
+            "DVC commands that need to lock the repo. "
+            "Defaults to 1."
+        ),
+        metavar="<number>",
+    )
+    repro_parser.add_argument(
+        "-k",
+        "--keep-going",
+        action="store_true",
+        default=False,
+        help=(
+            "Continue reproducing the stages that don't depend on the ones "
+            "that failed."
+        ),
+    )
     repro_parser.set_defaults(func=CmdRepro)
@@ -80,12 +80,16 @@ REMOTE_COMMON = {
     "jobs": All(Coerce(int), Range(1)),
     Optional("no_traverse"): Bool,  # obsoleted
     "verify": Bool,
+    "pack_threshold": All(Coerce(int), Range(1)),
+    "listing_ttl": All(Coerce(int), Range(0)),
 }
 LOCAL_COMMON = {
     "type": supported_cache_type,
     Optional("protected", default=False): Bool,  # obsoleted
     "shared": All(Lower, Choices("group")),
     Optional("slow_link_warning", default=True): Bool,
+    "chunking": Bool,
+    "pack_threshold": All(Coerce(int), Range(1)),
 }
 HTTP_COMMON = {
     "auth": All(Lower, Choices("basic", "digest", "custom")),
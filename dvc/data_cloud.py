@@ -12,6 +12,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _refresh_listing(odb: "ObjectDB"):
+    # NOTE: hashes found in cached listings are trusted to exist for up to
+    # `listing_ttl` seconds, even if they are removed from the remote by
+    # somebody else in the meantime.
+    if odb.listing_cache:
+        logger.debug("Clearing cached listings of '%s'", odb.path_info)
+        odb.listing_cache.clear()
+
+
 class DataCloud:
     """Class that manages dvc remotes.
 
@@ -68,6 +77,7 @@ class DataCloud:
         jobs: Optional[int] = None,
         remote: Optional[str] = None,
         odb: Optional["ObjectDB"] = None,
+        refresh_listing: bool = False,
     ):
         """Push data items in a cloud-agnostic way.
 
@@ -77,11 +87,15 @@ class DataCloud:
             remote: optional name of remote to push to.
                 By default remote from core.remote config option is used.
             odb: optional ODB to push to. Overrides remote.
+            refresh_listing: list the remote again, instead of using its
+                cached listings.
         """
         from dvc.objects.transfer import transfer
 
         if not odb:
             odb = self.get_remote_odb(remote, "push")
+        if refresh_listing:
+            _refresh_listing(odb)
         return transfer(
             self.repo.odb.local,
             odb,
@@ -97,6 +111,7 @@ class DataCloud:
         jobs: Optional[int] = None,
         remote: Optional[str] = None,
         odb: Optional["ObjectDB"] = None,
+        refresh_listing: bool = False,
     ):
         """Pull data items in a cloud-agnostic way.
 
@@ -106,11 +121,15 @@ class DataCloud:
             remote: optional name of remote to pull from.
                 By default remote from core.remote config option is used.
             odb: optional ODB to pull from. Overrides remote.
+            refresh_listing: list the remote again, instead of using its
+                cached listings.
         """
         from dvc.objects.transfer import transfer
 
         if not odb:
             odb = self.get_remote_odb(remote, "pull")
+        if refresh_listing:
+            _refresh_listing(odb)
         return transfer(
             odb,
             self.repo.odb.local,
@@ -128,6 +147,7 @@ class DataCloud:
         remote: Optional[str] = None,
         odb: Optional["ObjectDB"] = None,
         log_missing: bool = True,
+        refresh_listing: bool = False,
     ):
         """Check status of data items in a cloud-agnostic way.
 
@@ -140,11 +160,15 @@ class DataCloud:
             odb: optional ODB to check status from. Overrides remote.
             log_missing: log warning messages if file doesn't exist
                 neither in cache, neither in cloud.
+            refresh_listing: list the remote again, instead of using its
+                cached listings.
         """
         from dvc.objects.status import compare_status
 
         if not odb:
             odb = self.get_remote_odb(remote, "status")
+        if refresh_listing:
+            _refresh_listing(odb)
         return compare_status(
             self.repo.odb.local,
             odb,
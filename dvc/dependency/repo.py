@@ -101,6 +101,7 @@ class RepoDependency(Dependency):
     ) -> Tuple[Dict[Optional["ObjectDB"], Set["HashInfo"]], "HashFile"]:
         from dvc.config import NoRemoteError
         from dvc.exceptions import NoOutputOrStageError, PathMissingError
+        from dvc.objects.chunked import ChunkedFile
         from dvc.objects.stage import stage
         from dvc.objects.tree import Tree
 
@@ -147,7 +148,7 @@ class RepoDependency(Dependency):
 
             self._staged_objs[rev] = staged_obj
             used_obj_ids[staging].add(staged_obj.hash_info)
-            if isinstance(staged_obj, Tree):
+            if isinstance(staged_obj, (Tree, ChunkedFile)):
                 used_obj_ids[staging].update(
                     entry.hash_info for _, entry in staged_obj
                 )
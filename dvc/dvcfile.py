@@ -155,15 +155,35 @@ class FileMixin:
 
         return validate(d, cls.SCHEMA, path=fname)  # type: ignore[arg-type]
 
+    @property
+    def metafile_cache(self):
+        from dvc.fs.local import LocalFileSystem
+
+        # files are fingerprinted with `os.stat`
+        if isinstance(self.repo.fs, LocalFileSystem):
+            return self.repo.metafile_cache
+        return None
+
     def _load_yaml(self, **kwargs: Any) -> Tuple[Any, str]:
         from dvc.utils import strictyaml
 
-        return strictyaml.load(
+        # round-trip data is going to be modified and dumped back
+        cache = None if kwargs.get("round_trip") else self.metafile_cache
+        key = f"load:{os.path.abspath(self.path)}"
+        if cache:
+            loaded = cache.get(key)
+            if loaded is not None:
+                return loaded
+
+        loaded = strictyaml.load(
             self.path,
             self.SCHEMA,  # type: ignore[arg-type]
             self.repo.fs,
             **kwargs,
         )
+        if cache:
+            cache.set(key, [self.path], loaded)
+        return loaded
 
     def remove(self, force=False):  # pylint: disable=unused-argument
         with contextlib.suppress(FileNotFoundError):
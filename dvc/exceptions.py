@@ -162,6 +162,15 @@ class ReproductionError(DvcException):
         super().__init__(f"failed to reproduce '{dvc_file_name}'")
 
 
+class FailedStagesError(ReproductionError):
+    """Stages that failed to reproduce, while reproducing the rest (e.g.
+    with `keep_going`)."""
+
+    def __init__(self, stages):
+        self.stages = stages
+        super().__init__("', '".join(sorted(s.addressing for s in stages)))
+
+
 class BadMetricError(DvcException):
     def __init__(self, paths):
         super().__init__(
@@ -44,6 +44,7 @@ class AzureFileSystem(CallbackMixin, ObjectFSWrapper):
     PATH_CLS = CloudURLInfo
     PARAM_CHECKSUM = "etag"
     DETAIL_FIELDS = frozenset(("etag", "size"))
+    ASYNC_TRANSFER = True
     REQUIRES = {
         "adlfs": "adlfs",
         "knack": "knack",
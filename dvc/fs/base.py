@@ -4,13 +4,13 @@ import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partialmethod
 from multiprocessing import cpu_count
-from typing import Any, ClassVar, Dict, FrozenSet, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional
 
 from tqdm.utils import CallbackIOWrapper
 
 from dvc.exceptions import DvcException
+from dvc.fs._callback import DEFAULT_CALLBACK, FsspecCallback
 from dvc.path_info import URLInfo
-from dvc.progress import DEFAULT_CALLBACK, FsspecCallback
 from dvc.ui import ui
 from dvc.utils import tmp_fname
 from dvc.utils.fs import makedirs, move
@@ -138,6 +138,19 @@ class BaseFileSystem:
     def exists(self, path_info) -> bool:
         raise NotImplementedError
 
+    def exists_many(
+        self, path_infos, jobs=None, callback=DEFAULT_CALLBACK
+    ) -> List[bool]:
+        """Check which of the given paths exist.
+
+        Filesystems which are able to query many paths at once should
+        override this, by default `exists` is called for each of the paths
+        in a thread pool.
+        """
+        func = FsspecCallback.wrap_fn(callback, self.exists)
+        with ThreadPoolExecutor(max_workers=jobs or self.jobs) as executor:
+            return list(executor.map(func, path_infos))
+
     # pylint: disable=unused-argument
 
     def isdir(self, path_info):
@@ -222,6 +235,19 @@ class BaseFileSystem:
             return False
         return hash_.endswith(cls.CHECKSUM_DIR_SUFFIX)
 
+    @property
+    def async_fs(self):
+        """Underlying async filesystem which `put_file_async` and
+        `get_file_async` run on, if objects can be transferred through it
+        (see `dvc.objects.transfer`)."""
+        return None
+
+    async def put_file_async(self, from_file, to_info):
+        raise RemoteActionNotImplemented("put_file_async", self.scheme)
+
+    async def get_file_async(self, from_info, to_file):
+        raise RemoteActionNotImplemented("get_file_async", self.scheme)
+
     def upload(
         self,
         from_info,
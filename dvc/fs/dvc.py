@@ -1,3 +1,4 @@
+import io
 import logging
 import os
 import typing
@@ -6,11 +7,13 @@ from dvc.exceptions import OutputNotFoundError
 from dvc.path_info import PathInfo
 from dvc.utils import relpath
 
-from ..progress import DEFAULT_CALLBACK
+from ._callback import DEFAULT_CALLBACK
 from ._metadata import Metadata
 from .base import BaseFileSystem
 
 if typing.TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+    from dvc.objects.db.base import ObjectDB
     from dvc.output import Output
 
 
@@ -58,12 +61,16 @@ class DvcFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
         out.get_dir_cache(remote=remote)
         if out.obj is None:
             raise FileNotFoundError
-        obj = out.obj.trie.get(key)
+        obj = out.obj.get_entry(key)
         if obj:
             return obj.hash_info
         raise FileNotFoundError
 
-    def _get_fs_path(self, path: PathInfo, remote=None):
+    def _get_obj_info(
+        self, path: PathInfo, remote=None
+    ) -> typing.Tuple["ObjectDB", "HashInfo"]:
+        """Return the ODB (cache, or remote if not in cache) and the hash of
+        the file object at `path`."""
         try:
             outs = self._find_outs(path, strict=False)
         except OutputNotFoundError as exc:
@@ -83,27 +90,48 @@ class DvcFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
             from dvc.config import NoRemoteError
 
             try:
-                remote_odb = self.repo.cloud.get_remote_odb(remote)
+                odb = self.repo.cloud.get_remote_odb(remote)
             except NoRemoteError as exc:
                 raise FileNotFoundError from exc
-            if out.is_dir_checksum:
-                checksum = self._get_granular_hash(path, out).value
-            else:
-                checksum = out.hash_info.value
-            remote_info = remote_odb.hash_to_path_info(checksum)
-            return remote_odb.fs, remote_info
+        else:
+            odb = out.odb
 
+        hash_info = out.hash_info
         if out.is_dir_checksum:
-            checksum = self._get_granular_hash(path, out).value
-            cache_path = out.odb.hash_to_path_info(checksum).url
-        else:
-            cache_path = out.cache_path
-        return out.odb.fs, cache_path
+            hash_info = self._get_granular_hash(path, out)
+        if odb is not out.odb and not odb.exists(hash_info):
+            raise FileNotFoundError
+        return odb, hash_info
+
+    @staticmethod
+    def _get_fs_path(odb: "ObjectDB", hash_info: "HashInfo"):
+        """Return fs and path of the file object, or None if it is not
+        stored on its own (i.e. chunked file or packed object) and has to be
+        read with `open_obj()` instead."""
+        from dvc.objects.packed import PackedHashFile
+
+        if hash_info.ischunked or isinstance(
+            odb.get(hash_info), PackedHashFile
+        ):
+            return None
+        path_info = odb.hash_to_path_info(hash_info.value)
+        if odb.fs.scheme == "local":
+            return odb.fs, path_info.url
+        return odb.fs, path_info
 
     def open(  # type: ignore
         self, path: PathInfo, mode="r", encoding=None, **kwargs
     ):  # pylint: disable=arguments-renamed
-        fs, fspath = self._get_fs_path(path, **kwargs)
+        from dvc.objects import open_obj
+
+        odb, hash_info = self._get_obj_info(path, **kwargs)
+        fs_path = self._get_fs_path(odb, hash_info)
+        if fs_path is None:
+            fobj = open_obj(odb, hash_info)
+            if "b" in mode:
+                return fobj
+            return io.TextIOWrapper(fobj, encoding=encoding)
+        fs, fspath = fs_path
         return fs.open(fspath, mode=mode, encoding=encoding)
 
     def exists(self, path):  # pylint: disable=arguments-renamed
@@ -250,7 +278,7 @@ class DvcFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
         elif meta.part_of_output:
             (out,) = meta.outs
             key = path_info.relative_to(out.path_info).parts
-            obj = out.obj.trie.get(key)
+            obj = out.obj.get_entry(key)
             if obj:
                 ret["size"] = obj.size
                 ret[obj.hash_info.name] = obj.hash_info.value
@@ -260,7 +288,20 @@ class DvcFileSystem(BaseFileSystem):  # pylint:disable=abstract-method
     def get_file(
         self, from_info, to_file, callback=DEFAULT_CALLBACK, **kwargs
     ):
-        fs, path = self._get_fs_path(from_info)
+        from dvc.objects import open_obj
+        from dvc.utils.fs import copyfileobj
+
+        odb, hash_info = self._get_obj_info(from_info)
+        fs_path = self._get_fs_path(odb, hash_info)
+        if fs_path is None:
+            callback.set_size(hash_info.size)
+            with open_obj(odb, hash_info) as fsrc:
+                with open(to_file, "wb") as fdest:
+                    copyfileobj(fsrc, fdest)
+            callback.absolute_update(hash_info.size)
+            return
+
+        fs, path = fs_path
         fs.get_file(  # pylint: disable=protected-access
             path, to_file, callback=callback, **kwargs
         )
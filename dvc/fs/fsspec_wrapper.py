@@ -1,3 +1,4 @@
+import asyncio
 import os
 import shutil
 from functools import lru_cache
@@ -5,7 +6,7 @@ from functools import lru_cache
 from funcy import cached_property
 from tqdm.utils import CallbackIOWrapper
 
-from dvc.progress import DEFAULT_CALLBACK
+from dvc.fs._callback import DEFAULT_CALLBACK
 
 from .base import BaseFileSystem
 
@@ -13,6 +14,9 @@ from .base import BaseFileSystem
 # pylint: disable=no-member
 class FSSpecWrapper(BaseFileSystem):
     TRAVERSE_PREFIX_LEN = 2
+    # Whether put_file/get_file can be replaced by the coroutines of the
+    # underlying async filesystem (see `dvc.objects.transfer`).
+    ASYNC_TRANSFER = False
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -95,6 +99,40 @@ class FSSpecWrapper(BaseFileSystem):
     def exists(self, path_info) -> bool:
         return self.fs.exists(self._with_bucket(path_info))
 
+    def exists_many(self, path_infos, jobs=None, callback=DEFAULT_CALLBACK):
+        # NOTE: async filesystems (e.g. s3, gs, azure, http, ssh) are able to
+        # have all of the requests in flight at once on their event loop
+        # (i.e. HEAD requests or SFTP stats over the same session), rather
+        # than blocking one thread per path.
+        if not getattr(self.fs, "async_impl", False):
+            return super().exists_many(
+                path_infos, jobs=jobs, callback=callback
+            )
+
+        from fsspec.asyn import sync
+
+        paths = [self._with_bucket(path_info) for path_info in path_infos]
+        return sync(
+            self.fs.loop,
+            self._exists_many_async,
+            paths,
+            jobs or self.jobs,
+            callback,
+        )
+
+    async def _exists_many_async(self, paths, jobs, callback):
+        semaphore = asyncio.Semaphore(jobs)
+
+        async def _exists(path):
+            async with semaphore:
+                try:
+                    # pylint: disable=protected-access
+                    return await self.fs._exists(path)
+                finally:
+                    callback.relative_update()
+
+        return await asyncio.gather(*(_exists(path) for path in paths))
+
     def ls(self, path_info, detail=False):
         path = self._with_bucket(path_info)
         files = self.fs.ls(path, detail=detail)
@@ -150,6 +188,22 @@ class FSSpecWrapper(BaseFileSystem):
         with self.open(to_info, "wb") as fdest:
             shutil.copyfileobj(fobj, fdest, length=fdest.blocksize)
 
+    @property
+    def async_fs(self):
+        if self.ASYNC_TRANSFER and getattr(self.fs, "async_impl", False):
+            return self.fs
+        return None
+
+    async def put_file_async(self, from_file, to_info):
+        await self.fs._put_file(  # pylint: disable=protected-access
+            os.fspath(from_file), self._with_bucket(to_info)
+        )
+
+    async def get_file_async(self, from_info, to_file):
+        await self.fs._get_file(  # pylint: disable=protected-access
+            self._with_bucket(from_info), os.fspath(to_file)
+        )
+
 
 # pylint: disable=abstract-method
 class ObjectFSWrapper(FSSpecWrapper):
@@ -192,18 +246,32 @@ class ObjectFSWrapper(FSSpecWrapper):
             and entry["name"].endswith("/")
         )
 
+    def _find_pages(self, path, prefix=None):
+        """Iterate over pages of (bucket prefixed) paths of the files
+        inside `path`, as soon as each of them is listed.
+
+        Should be overridden for storages that can list objects page by
+        page, the whole listing is a single page otherwise.
+        """
+        if prefix:
+            yield self.fs.find(path, prefix=prefix)
+        else:
+            yield self.fs.find(path)
+
     def find(self, path_info, detail=False, prefix=None):
         if prefix:
             path = self._with_bucket(path_info.parent)
-            files = self.fs.find(
-                path, detail=detail, prefix=path_info.parts[-1]
-            )
+            kwargs = {"prefix": path_info.parts[-1]}
         else:
             path = self._with_bucket(path_info)
-            files = self.fs.find(path, detail=detail)
+            kwargs = {}
 
         if detail:
-            files = list(files.values())
+            files = self.fs.find(path, detail=True, **kwargs)
+            pages = iter([list(files.values())])
+        else:
+            pages = self._find_pages(path, **kwargs)
+        files = next(pages, [])
 
         # When calling find() on a file, it returns the same file in a list.
         # For object-based storages, the same behavior applies to empty
@@ -214,6 +282,8 @@ class ObjectFSWrapper(FSSpecWrapper):
             return None
 
         yield from self._strip_buckets(files, detail=detail)
+        for files in pages:
+            yield from self._strip_buckets(files, detail=detail)
 
 
 # pylint: disable=arguments-differ
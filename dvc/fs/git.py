@@ -5,7 +5,7 @@ from tqdm.utils import CallbackIOWrapper
 
 from dvc.utils import is_exec, relpath
 
-from ..progress import DEFAULT_CALLBACK
+from ._callback import DEFAULT_CALLBACK
 from .base import BaseFileSystem
 
 
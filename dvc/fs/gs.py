@@ -17,6 +17,7 @@ class GSFileSystem(CallbackMixin, ObjectFSWrapper):
     PARAM_CHECKSUM = "etag"
     DETAIL_FIELDS = frozenset(("etag", "size"))
     TRAVERSE_PREFIX_LEN = 2
+    ASYNC_TRANSFER = True
 
     def _prepare_credentials(self, **config):
         login_info = {"consistency": None}
@@ -5,13 +5,13 @@ import os
 import re
 import shutil
 import subprocess
-from collections import deque
+from collections import defaultdict, deque
 from contextlib import closing, contextmanager
 
 from tqdm.utils import CallbackIOWrapper
 
+from dvc.fs._callback import DEFAULT_CALLBACK
 from dvc.hash_info import HashInfo
-from dvc.progress import DEFAULT_CALLBACK
 from dvc.scheme import Schemes
 from dvc.utils import fix_env, tmp_fname
 
@@ -131,6 +131,28 @@ class HDFSFileSystem(BaseFileSystem):
             file_info = hdfs.get_file_info(path_info.path)
             return file_info.type != pyarrow.fs.FileType.NotFound
 
+    def exists_many(self, path_infos, jobs=None, callback=DEFAULT_CALLBACK):
+        import pyarrow.fs
+
+        path_infos = list(path_infos)
+        ret = [False] * len(path_infos)
+        # paths are looked up with a single get_file_info() call per
+        # connection, rather than with one call each
+        by_conn = defaultdict(list)
+        for i, path_info in enumerate(path_infos):
+            assert path_info.scheme == "hdfs"
+            conn = (path_info.host, path_info.port, path_info.user)
+            by_conn[conn].append(i)
+        for indexes in by_conn.values():
+            with self.hdfs(path_infos[indexes[0]]) as hdfs:
+                file_infos = hdfs.get_file_info(
+                    [path_infos[i].path for i in indexes]
+                )
+            for i, file_info in zip(indexes, file_infos):
+                ret[i] = file_info.type != pyarrow.fs.FileType.NotFound
+            callback.relative_update(len(indexes))
+        return ret
+
     def _walk(self, hdfs, root, topdown=True):
         import posixpath
 
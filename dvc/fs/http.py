@@ -38,6 +38,7 @@ class HTTPFileSystem(NoDirectoriesMixin, FSSpecWrapper):
     PARAM_CHECKSUM = "checksum"
     REQUIRES = {"aiohttp": "aiohttp", "aiohttp-retry": "aiohttp_retry"}
     CAN_TRAVERSE = False
+    ASYNC_TRANSFER = True
 
     SESSION_RETRIES = 5
     SESSION_BACKOFF_FACTOR = 0.1
@@ -5,8 +5,8 @@ from collections import defaultdict
 
 from funcy import cached_property, wrap_prop
 
+from dvc.fs._callback import DEFAULT_CALLBACK
 from dvc.path_info import CloudURLInfo
-from dvc.progress import DEFAULT_CALLBACK
 from dvc.scheme import Schemes
 
 from .fsspec_wrapper import ObjectFSWrapper
@@ -21,6 +21,7 @@ class BaseS3FileSystem(ObjectFSWrapper):
     REQUIRES = {"s3fs": "s3fs", "boto3": "boto3"}
     PARAM_CHECKSUM = "etag"
     DETAIL_FIELDS = frozenset(("etag", "size"))
+    ASYNC_TRANSFER = True
 
     _GRANTS = {
         "grant_full_control": "GrantFullControl",
@@ -161,6 +162,50 @@ class BaseS3FileSystem(ObjectFSWrapper):
 
         return _S3FileSystem(**self.fs_args)
 
+    async def _list_pages(self, bucket, prefix):
+        s3 = await self.fs.set_session()
+        paginator = s3.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=bucket, Prefix=prefix, **self.fs.req_kw
+        ):
+            # keys ending with "/" are directory markers, not files
+            yield [
+                f"{bucket}/{obj['Key']}"
+                for obj in page.get("Contents", [])
+                if not obj["Key"].endswith("/")
+            ]
+
+    def _find_pages(self, path, prefix=None):
+        # NOTE: s3fs collects all of the pages of a listing before returning
+        # it, which takes lots of memory (and time until the first of the
+        # files can be processed) for large buckets.
+        from fsspec.asyn import sync
+        from s3fs.errors import translate_boto_error
+
+        bucket, key, _ = self.fs.split_path(path)
+        key_prefix = prefix or ""
+        if key:
+            key_prefix = key.rstrip("/") + "/" + key_prefix
+
+        found = False
+        pages = self._list_pages(bucket, key_prefix)
+        try:
+            while True:
+                try:
+                    page = sync(self.fs.loop, pages.__anext__)
+                except StopAsyncIteration:
+                    break
+                except Exception as exc:  # pylint: disable=broad-except
+                    raise translate_boto_error(exc) from exc
+                found = found or bool(page)
+                yield page
+        finally:
+            sync(self.fs.loop, pages.aclose)
+
+        if not found and not prefix:
+            # `path` could be a file, which is what s3fs lists then
+            yield from super()._find_pages(path)
+
 
 def _translate_exceptions(func):
     @functools.wraps(func)
@@ -170,7 +215,7 @@ def _translate_exceptions(func):
         except Exception as exc:
             from s3fs.errors import translate_boto_error
 
-            raise translate_boto_error(exc)
+            raise translate_boto_error(exc) from exc
 
     return wrapper
 
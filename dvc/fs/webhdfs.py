@@ -8,9 +8,9 @@ from contextlib import contextmanager
 
 from funcy import cached_property, wrap_prop
 
+from dvc.fs._callback import DEFAULT_CALLBACK
 from dvc.hash_info import HashInfo
 from dvc.path_info import CloudURLInfo
-from dvc.progress import DEFAULT_CALLBACK
 from dvc.scheme import Schemes
 
 from .base import BaseFileSystem
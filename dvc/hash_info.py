@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 HASH_DIR_SUFFIX = ".dir"
+HASH_CHUNKED_SUFFIX = ".chunks"
 
 
 @dataclass
@@ -54,3 +55,9 @@ class HashInfo:
         if not self:
             return False
         return self.value.endswith(HASH_DIR_SUFFIX)
+
+    @property
+    def ischunked(self):
+        if not self:
+            return False
+        return self.value.endswith(HASH_CHUNKED_SUFFIX)
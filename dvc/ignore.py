@@ -26,6 +26,8 @@ class DvcIgnore:
 
 
 class DvcIgnorePatterns(DvcIgnore):
+    pattern_to_regex = staticmethod(GitWildMatchPattern.pattern_to_regex)
+
     def __init__(self, pattern_list, dirname):
         if pattern_list:
             if isinstance(pattern_list[0], str):
@@ -38,7 +40,7 @@ class DvcIgnorePatterns(DvcIgnore):
         self.prefix = self.dirname + os.sep
 
         self.regex_pattern_list = [
-            GitWildMatchPattern.pattern_to_regex(pattern_info.patterns)
+            self.pattern_to_regex(pattern_info.patterns)
             for pattern_info in pattern_list
         ]
 
@@ -65,7 +67,7 @@ class DvcIgnorePatterns(DvcIgnore):
 
         return cls(path_spec_lines, dirname)
 
-    def __call__(self, root: List[str], dirs: List[str], files: List[str]):
+    def __call__(self, root: str, dirs: List[str], files: List[str]):
         files = [f for f in files if not self.matches(root, f)]
         dirs = [d for d in dirs if not self.matches(root, d, True)]
 
@@ -271,21 +273,43 @@ class DvcIgnoreFilter:
         ignore_subrepos = kwargs.pop("ignore_subrepos", True)
         if fs.scheme == Schemes.LOCAL:
             for root, dirs, files in fs.walk(path_info, **kwargs):
-                dirs[:], files[:] = self(
-                    root, dirs, files, ignore_subrepos=ignore_subrepos
-                )
+                if isinstance(files, dict):
+                    dirs[:], fnames = self(
+                        root,
+                        dirs,
+                        list(files),
+                        ignore_subrepos=ignore_subrepos,
+                    )
+                    files = {fname: files[fname] for fname in fnames}
+                else:
+                    dirs[:], files[:] = self(
+                        root, dirs, files, ignore_subrepos=ignore_subrepos
+                    )
                 yield root, dirs, files
         else:
             yield from fs.walk(path_info, **kwargs)
 
     def walk_files(self, fs: BaseFileSystem, path_info: AnyPath, **kwargs):
         if fs.scheme == Schemes.LOCAL:
+            from dvc.fs.local import LocalFileSystem
+
+            detail = kwargs.get("detail", False)
             for root, _, files in self.walk(fs, path_info, **kwargs):
                 for file in files:
                     # NOTE: os.path.join is ~5.5 times slower
-                    yield PathInfo(f"{root}{os.sep}{file}")
+                    file_info = PathInfo(f"{root}{os.sep}{file}")
+                    if not detail:
+                        yield file_info
+                        continue
+
+                    try:
+                        yield file_info, LocalFileSystem.entry_info(
+                            files[file]
+                        )
+                    except FileNotFoundError:
+                        continue
         else:
-            yield from fs.walk_files(path_info)
+            yield from fs.walk_files(path_info, **kwargs)
 
     def _get_trie_pattern(
         self, dirname, dnames: Optional["List"] = None, ignore_subrepos=True
@@ -388,6 +412,182 @@ class DvcIgnoreFilter:
         )
 
 
+def _translate_segment(segment: str) -> Optional[str]:
+    """Translate a gitignore pattern segment (i.e. without slashes) into a
+    regex, or return None if it is invalid."""
+    regex = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == "\\":
+            if i == len(segment):
+                # a trailing backslash doesn't match anything
+                return None
+            regex.append(re.escape(segment[i]))
+            i += 1
+        elif char == "*":
+            regex.append("[^/]*")
+        elif char == "?":
+            regex.append("[^/]")
+        elif char == "[":
+            end = i
+            if end < len(segment) and segment[end] in "!^":
+                end += 1
+            if end < len(segment) and segment[end] == "]":
+                end += 1
+            end = segment.find("]", end)
+            if end == -1:
+                regex.append(re.escape(char))
+                continue
+            expr = segment[i:end].replace("\\", "\\\\")
+            if expr[:1] in ("!", "^"):
+                # like `*`, negated ranges never match a slash
+                expr = "^/" + expr[1:]
+            elif expr[:1] == "]":
+                expr = "\\" + expr
+            regex.append(f"[{expr}]")
+            i = end + 1
+        else:
+            regex.append(re.escape(char))
+    return "".join(regex)
+
+
+class GitIgnorePatterns(DvcIgnorePatterns):
+    """Patterns which match paths themselves rather than anything below
+    them, like git does.
+
+    Regexes from `pathspec` also match the contents of matching directories,
+    which would let negated patterns (e.g. `!data/**/`) re-include files in
+    ignored directories. Contents of ignored directories are never checked
+    while walking, so matching them is not needed for ignore patterns
+    either.
+    """
+
+    @staticmethod
+    def pattern_to_regex(pattern):
+        """Return a (regex, include) pair for the given gitignore pattern,
+        see `GitWildMatchPattern.pattern_to_regex`.
+
+        The regex matches paths relative to the directory of the pattern,
+        with a trailing slash for directories (see `DvcIgnorePatterns.ignore`).
+        """
+        if not pattern or pattern.startswith("#"):
+            return None, None
+
+        include = True
+        if pattern.startswith("!"):
+            include = False
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        # patterns without a slash (other than a trailing one) match at any
+        # level below the directory, the rest only relative to it
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            return None, None
+
+        regex = "" if anchored else "(?:.+/)?"
+        segments = pattern.split("/")
+        for i, segment in enumerate(segments):
+            last = i == len(segments) - 1
+            if segment == "**":
+                # any number of directories in between, or anything below
+                regex += ".+" if last else "(?:.+/)?"
+                continue
+            translated = _translate_segment(segment)
+            if translated is None:
+                return None, None
+            regex += translated if last else translated + "/"
+
+        if dir_only:
+            regex += "/"
+        return f"^{regex}$", include
+
+
+class GitIgnoreFilter:
+    """Gitignore rules of a git repo, compiled per directory.
+
+    Asking git whether each path is ignored means re-evaluating all of the
+    `.gitignore` files above it on every call. Instead, the patterns are
+    read once per directory and merged with the ones of its parent, the
+    same way as `.dvcignore` files are in `DvcIgnoreFilter`, so checking a
+    path is just a regex match. Ignored directories are expected to be
+    pruned while walking (see `GitIgnorePatterns`).
+    """
+
+    GITIGNORE_FILE = ".gitignore"
+
+    def __init__(
+        self,
+        fs: BaseFileSystem,
+        root_dir: str,
+        global_files: Optional[List[str]] = None,
+    ):
+        self.fs = fs
+        self.root_dir = root_dir
+        self.trie = PathStringTrie()
+
+        pattern_list: List[PatternInfo] = []
+        for path in global_files or []:
+            if self.fs.exists(path):
+                pattern_list.extend(
+                    GitIgnorePatterns.from_file(
+                        path, self.fs, path
+                    ).pattern_list
+                )
+        self.trie[root_dir] = GitIgnorePatterns(pattern_list, root_dir)
+        self._update(root_dir)
+
+    def _update(self, dirname: str) -> "GitIgnorePatterns":
+        old_pattern = self.trie.longest_prefix(dirname).value
+        path = os.path.join(dirname, self.GITIGNORE_FILE)
+        pattern = old_pattern
+        if self.fs.exists(path):
+            name = os.path.relpath(path, self.root_dir)
+            new_pattern = GitIgnorePatterns.from_file(path, self.fs, name)
+            pattern = GitIgnorePatterns(
+                *merge_patterns(
+                    old_pattern.pattern_list,
+                    old_pattern.dirname,
+                    new_pattern.pattern_list,
+                    new_pattern.dirname,
+                )
+            )
+        self.trie[dirname] = pattern
+        return pattern
+
+    def _get_pattern(self, dirname: str) -> Optional["GitIgnorePatterns"]:
+        pattern = self.trie.get(dirname)
+        if pattern is not None:
+            return pattern
+
+        prefix = self.trie.longest_prefix(dirname).key
+        if not prefix:
+            # outside of the repo
+            return None
+
+        dirs = list(
+            takewhile(
+                lambda path: path != prefix,
+                (parent.fspath for parent in PathInfo(dirname).parents),
+            )
+        )
+        dirs.reverse()
+        dirs.append(dirname)
+        for parent in dirs:
+            pattern = self._update(parent)
+        return pattern
+
+    def __call__(self, root: str, dirs: List[str], files: List[str]):
+        pattern = self._get_pattern(root)
+        if pattern:
+            dirs, files = pattern(root, dirs, files)
+        return dirs, files
+
+
 def init(path):
     dvcignore = os.path.join(path, DvcIgnore.DVCIGNORE_FILE)
     if os.path.exists(dvcignore):
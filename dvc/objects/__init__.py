@@ -1,6 +1,8 @@
 import logging
-from typing import TYPE_CHECKING, Iterator, Union
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Union
 
+from .chunked import ChunkedFile
+from .packed import PackedHashFile
 from .tree import Tree
 
 if TYPE_CHECKING:
@@ -13,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 
 def check(odb: "ObjectDB", obj: "HashFile", **kwargs):
-    if isinstance(obj, Tree):
+    if isinstance(obj, (Tree, ChunkedFile)):
         for _, entry in obj:
             odb.check(entry.hash_info, **kwargs)
 
@@ -23,12 +25,25 @@ def check(odb: "ObjectDB", obj: "HashFile", **kwargs):
 def load(odb: "ObjectDB", hash_info: "HashInfo") -> "HashFile":
     if hash_info.isdir:
         return Tree.load(odb, hash_info)
+    if hash_info.ischunked:
+        return ChunkedFile.load(odb, hash_info)
     return odb.get(hash_info)
 
 
+def open_obj(odb: "ObjectDB", hash_info: "HashInfo") -> BinaryIO:
+    """Open a file object from `odb` for reading in binary mode, wherever
+    its contents are stored (e.g. in chunks, or inside of a pack)."""
+    if hash_info.ischunked:
+        return ChunkedFile.load(odb, hash_info).open(odb)
+    obj = odb.get(hash_info)
+    if isinstance(obj, PackedHashFile):
+        return obj.open()
+    return obj.fs.open(obj.path_info, mode="rb")
+
+
 def iterobjs(
-    obj: Union["Tree", "HashFile"]
-) -> Iterator[Union["Tree", "HashFile"]]:
-    if isinstance(obj, Tree):
+    obj: Union["Tree", "ChunkedFile", "HashFile"]
+) -> Iterator[Union["Tree", "ChunkedFile", "HashFile"]]:
+    if isinstance(obj, (Tree, ChunkedFile)):
         yield from (entry_obj for _, entry_obj in obj)
     yield obj
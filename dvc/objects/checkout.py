@@ -1,4 +1,5 @@
 import logging
+import threading
 from itertools import chain
 
 from shortuuid import uuid
@@ -11,6 +12,7 @@ from dvc.exceptions import (
     DvcException,
 )
 from dvc.ignore import DvcIgnoreFilter
+from dvc.objects.chunked import ChunkedFile
 from dvc.objects.db.slow_link_detection import (  # type: ignore[attr-defined]
     slow_link_guard,
 )
@@ -22,6 +24,14 @@ from dvc.types import Optional
 
 logger = logging.getLogger(__name__)
 
+# number of files that are checked out by a worker at a time, and so the
+# granularity of progress updates
+BATCH_SIZE = 256
+
+# unsupported link types are removed from `cache.cache_types` while files
+# are being linked by the workers
+_link_types_lock = threading.Lock()
+
 
 def _remove(path_info, fs, in_cache, force=False):
     if not fs.exists(path_info):
@@ -58,8 +68,8 @@ def _verify_link(cache, path_info, link_type):
     cache.cache_type_confirmed = True
 
 
-def _do_link(cache, from_info, to_info, link_method):
-    if cache.fs.exists(to_info):
+def _do_link(cache, from_info, to_info, link_method, missing=False):
+    if not missing and cache.fs.exists(to_info):
         cache.fs.remove(to_info)  # broken symlink
 
     link_method(from_info, to_info)
@@ -70,27 +80,37 @@ def _do_link(cache, from_info, to_info, link_method):
 
 
 @slow_link_guard
-def _try_links(cache, from_info, to_info, link_types):
+def _try_links(cache, from_info, to_info, link_types, missing=False):
     while link_types:
-        link_method = getattr(cache.fs, link_types[0])
         try:
-            _do_link(cache, from_info, to_info, link_method)
-            _verify_link(cache, to_info, link_types[0])
+            link_type = link_types[0]
+        except IndexError:
+            break
+
+        link_method = getattr(cache.fs, link_type)
+        try:
+            _do_link(cache, from_info, to_info, link_method, missing=missing)
+            _verify_link(cache, to_info, link_type)
             return
 
         except DvcException as exc:
             logger.debug(
-                "Cache type '%s' is not supported: %s", link_types[0], exc
+                "Cache type '%s' is not supported: %s", link_type, exc
             )
-            del link_types[0]
+            with _link_types_lock:
+                if link_types and link_types[0] == link_type:
+                    del link_types[0]
+            # the link could have been created before failing to verify it
+            missing = False
 
     raise CacheLinkError([to_info])
 
 
-def _link(cache, from_info, to_info):
-    cache.makedirs(to_info.parent)
+def _link(cache, from_info, to_info, missing=False):
     try:
-        _try_links(cache, from_info, to_info, cache.cache_types)
+        _try_links(
+            cache, from_info, to_info, cache.cache_types, missing=missing
+        )
     except FileNotFoundError as exc:
         raise CheckoutError([str(to_info)]) from exc
 
@@ -119,20 +139,51 @@ def _cache_is_copy(cache, path_info):
     return cache.cache_types[0] == "copy"
 
 
+def _copy_out(cache, obj, path_info, fs):
+    """Write the contents of an object that can't be linked from the cache
+    (i.e. chunked file or packed object) into path_info.
+    """
+    from dvc.utils import tmp_fname
+    from dvc.utils.fs import copyfileobj
+
+    from . import open_obj
+
+    fs.makedirs(path_info.parent)
+    tmp_info = path_info.parent / tmp_fname(path_info.name)
+    try:
+        with fs.open(tmp_info, mode="wb") as fdest:
+            with open_obj(cache, obj.hash_info) as fsrc:
+                copyfileobj(fsrc, fdest)
+        fs.move(tmp_info, path_info)
+    except FileNotFoundError as exc:
+        raise CheckoutError([str(path_info)]) from exc
+    finally:
+        if fs.exists(tmp_info):
+            fs.remove(tmp_info)
+
+    logger.debug("Copied '%s' out of %s", path_info, obj)
+
+
 def _checkout_file(
-    path_info,
-    fs,
-    change,
-    cache,
-    force,
-    progress_callback=None,
-    relink=False,
-    state=None,
+    path_info, fs, change, cache, force, relink=False, missing=False
 ):
-    """The file is changed we need to checkout a new copy"""
+    """The file is changed we need to checkout a new copy.
+
+    `missing` tells that path_info is known not to exist (i.e. its parent
+    directory has just been created), so that there is no need to check.
+    """
     modified = False
     cache_info = cache.hash_to_path_info(change.new.obj.hash_info.value)
-    if change.old.obj:
+    if isinstance(change.new.obj, ChunkedFile) or cache.is_packed(
+        change.new.obj.hash_info
+    ):
+        # NOTE: relinking doesn't apply, workspace copies are left as is
+        if not (relink and change.old == change.new):
+            if change.old.obj:
+                _remove(path_info, fs, change.old.in_cache, force=force)
+            _copy_out(cache, change.new.obj, path_info, fs)
+            modified = True
+    elif change.old.obj:
         if relink:
             if fs.iscopy(path_info) and _cache_is_copy(cache, path_info):
                 cache.unprotect(path_info)
@@ -144,16 +195,108 @@ def _checkout_file(
             _remove(path_info, fs, change.old.in_cache, force=force)
             _link(cache, cache_info, path_info)
     else:
-        _link(cache, cache_info, path_info)
+        _link(cache, cache_info, path_info, missing=missing)
         modified = True
 
-    if state:
-        state.save(path_info, fs, change.new.obj.hash_info)
+    return modified
 
-    if progress_callback:
-        progress_callback(str(path_info))
 
-    return modified
+def _create_dirs(cache, fs, dirs):
+    """Create all of the directories that are going to be checked out into
+    at once, instead of doing it for each of the files.
+
+    Returns the directories which didn't exist before.
+    """
+    created = set()
+    for dir_info in sorted(dirs):
+        if dir_info.parent in created or not fs.exists(dir_info):
+            cache.makedirs(dir_info)
+            created.add(dir_info)
+    return created
+
+
+def _checkout_batch(batch, fs, cache, force, relink, new_dirs):
+    failed = []
+    saved = []
+    for path_info, change in batch:
+        try:
+            _checkout_file(
+                path_info,
+                fs,
+                change,
+                cache,
+                force,
+                relink=relink,
+                missing=path_info.parent in new_dirs,
+            )
+        except CheckoutError as exc:
+            failed.extend(exc.target_infos)
+        else:
+            saved.append((path_info, change.new.obj.hash_info))
+    return failed, saved
+
+
+def _checkout_files(
+    files, fs, cache, force, progress_callback, relink, new_dirs
+):
+    """Checkout files using a pool of workers, as it is mostly waiting for
+    the filesystem (e.g. to link lots of small files).
+
+    Returns (failed, saved), with the (path_info, hash_info) pairs of the
+    files that were checked out.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    failed = []
+    saved = []
+
+    def _update(batch, result):
+        failed.extend(result[0])
+        saved.extend(result[1])
+        if progress_callback:
+            progress_callback(str(batch[-1][0]), len(batch))
+
+    # files that might need to be removed after asking the user can't be
+    # checked out concurrently, neither can the first one, which confirms
+    # the cache type that is going to be used for all of them
+    serial, rest = [], []
+    for index, (path_info, change) in enumerate(files):
+        prompt_remove = (
+            not force and change.old.obj and not change.old.in_cache
+        )
+        if index == 0 or prompt_remove:
+            serial.append((path_info, change))
+        else:
+            rest.append((path_info, change))
+
+    for item in serial:
+        batch = [item]
+        _update(
+            batch, _checkout_batch(batch, fs, cache, force, relink, new_dirs)
+        )
+
+    batches = [
+        rest[i : i + BATCH_SIZE] for i in range(0, len(rest), BATCH_SIZE)
+    ]
+    if len(batches) <= 1:
+        for batch in batches:
+            _update(
+                batch,
+                _checkout_batch(batch, fs, cache, force, relink, new_dirs),
+            )
+        return failed, saved
+
+    with ThreadPoolExecutor(max_workers=cache.fs.jobs) as executor:
+        futures = [
+            executor.submit(
+                _checkout_batch, batch, fs, cache, force, relink, new_dirs
+            )
+            for batch in batches
+        ]
+        for batch, future in zip(batches, futures):
+            _update(batch, future.result())
+
+    return failed, saved
 
 
 def _diff(
@@ -206,7 +349,8 @@ def _checkout(
         )
         _remove(entry_path, fs, change.old.in_cache, force=force)
 
-    failed = []
+    dirs = set()
+    files = []
     for change in chain(diff.added, diff.modified):
         entry_path = (
             path_info.joinpath(*change.new.key)
@@ -214,22 +358,18 @@ def _checkout(
             else path_info
         )
         if isinstance(change.new.obj, Tree):
-            fs.makedirs(entry_path)
-            continue
+            dirs.add(entry_path)
+        else:
+            dirs.add(entry_path.parent)
+            files.append((entry_path, change))
 
-        try:
-            _checkout_file(
-                entry_path,
-                fs,
-                change,
-                cache,
-                force,
-                progress_callback,
-                relink,
-                state=state,
-            )
-        except CheckoutError as exc:
-            failed.extend(exc.target_infos)
+    new_dirs = _create_dirs(cache, fs, dirs)
+    failed, saved = _checkout_files(
+        files, fs, cache, force, progress_callback, relink, new_dirs
+    )
+
+    if state:
+        state.save_many(saved, fs)
 
     if failed:
         raise CheckoutError(failed)
@@ -0,0 +1,218 @@
+"""Content-defined chunking of large files.
+
+Files are split with normalized chunking, as in FastCDC [1]: a cut point is
+picked where a hash of the last bytes of the data matches a mask, so
+inserting or appending data to a file only changes the chunks around the
+modification and the rest of the chunks (and so the objects stored for them)
+are reused.
+
+Updating a rolling hash on every byte is way too slow in pure python, so
+candidate cut points are first looked up with `bytes.find()` for an anchor
+byte and only the window ending at each candidate is hashed (with crc32).
+
+[1] Xia, Wen, et al. "FastCDC: a Fast and Efficient Content-Defined
+    Chunking Approach for Data Deduplication." USENIX ATC 2016.
+"""
+import io
+import json
+import logging
+import zlib
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, Optional, Tuple
+
+from .errors import ObjectFormatError
+from .file import HashFile
+from .stage import get_file_hash
+
+if TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+
+    from .db.base import ObjectDB
+
+logger = logging.getLogger(__name__)
+
+CHUNK_MIN_SIZE = 2 ** 20
+CHUNK_AVG_SIZE = 2 ** 22
+CHUNK_MAX_SIZE = 2 ** 24
+
+# NOTE: changing any of these changes the cut points and so the chunk hashes
+_ANCHOR = b"\x9d"
+_ANCHOR_BITS = 8
+_WINDOW_SIZE = 48
+
+
+def _cut_point(data, min_size: int, avg_size: int, max_size: int) -> int:
+    size = min(len(data), max_size)
+    if size <= min_size:
+        return size
+
+    # Normalized chunking: stricter mask before the average size and a
+    # looser one after it, so that chunk sizes gather around avg_size.
+    bits = max(avg_size.bit_length() - 1 - _ANCHOR_BITS, 2)
+    mask_s = (1 << (bits + 2)) - 1
+    mask_l = (1 << (bits - 2)) - 1
+    normal = min(avg_size, size)
+
+    find = data.find
+    pos = find(_ANCHOR, min_size, size)
+    while pos != -1:
+        window = data[max(pos + 1 - _WINDOW_SIZE, 0) : pos + 1]
+        mask = mask_s if pos < normal else mask_l
+        if not zlib.crc32(window) & mask:
+            return pos + 1
+        pos = find(_ANCHOR, pos + 1, size)
+    return size
+
+
+def iter_chunks(
+    fobj,
+    min_size: Optional[int] = None,
+    avg_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Split the given binary file object into content-defined chunks."""
+    min_size = min_size or CHUNK_MIN_SIZE
+    avg_size = avg_size or CHUNK_AVG_SIZE
+    max_size = max_size or CHUNK_MAX_SIZE
+    assert 0 < min_size <= avg_size <= max_size
+
+    buf = b""
+    eof = False
+    while True:
+        while not eof and len(buf) < max_size:
+            data = fobj.read(max_size - len(buf))
+            if not data:
+                eof = True
+            buf += data
+        if not buf:
+            return
+
+        cut = _cut_point(buf, min_size, avg_size, max_size)
+        yield buf[:cut]
+        buf = buf[cut:]
+
+
+class _ChunksReader(io.RawIOBase):
+    def __init__(self, odb: "ObjectDB", chunks: Iterator["HashFile"]):
+        super().__init__()
+        self.odb = odb
+        self.chunks = chunks
+        self.fobj: Optional[BinaryIO] = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        from . import open_obj
+
+        while True:
+            if self.fobj is None:
+                chunk = next(self.chunks, None)
+                if chunk is None:
+                    return 0
+                self.fobj = open_obj(self.odb, chunk.hash_info)
+            data = self.fobj.read(len(b))
+            if data:
+                b[: len(data)] = data
+                return len(data)
+            self.fobj.close()
+            self.fobj = None
+
+    def close(self):
+        if self.fobj is not None:
+            self.fobj.close()
+            self.fobj = None
+        super().close()
+
+
+class ChunkedFile(HashFile):
+    """File object stored as a list of content-defined chunks.
+
+    The object itself is a manifest (similar to a `.dir` file) which lists
+    the hashes and sizes of the chunks, in order. Chunks are stored as
+    regular file objects in the same ODB.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._chunks: List["HashFile"] = []
+
+    def add(self, obj: "HashFile"):
+        self._chunks.append(obj)
+
+    def __iter__(self) -> Iterator[Tuple[int, "HashFile"]]:
+        offset = 0
+        for obj in self._chunks:
+            yield offset, obj
+            offset += obj.size
+
+    def open(self, odb: "ObjectDB") -> BinaryIO:
+        """Open the file for reading its chunks (from `odb`) one after
+        another."""
+        chunks = (obj for _, obj in self)
+        return io.BufferedReader(  # type: ignore[return-value]
+            _ChunksReader(odb, chunks)
+        )
+
+    def digest(self, hash_info: Optional["HashInfo"] = None):
+        from dvc.fs.memory import MemoryFileSystem
+        from dvc.hash_info import HASH_CHUNKED_SUFFIX
+        from dvc.path_info import CloudURLInfo
+        from dvc.utils import tmp_fname
+
+        memfs = MemoryFileSystem()
+        path_info = CloudURLInfo("memory://{}".format(tmp_fname("")))
+        with memfs.open(path_info, "wb") as fobj:
+            fobj.write(self.as_bytes())
+        self.fs = memfs
+        self.path_info = path_info
+        if hash_info:
+            self.hash_info = hash_info
+        else:
+            self.hash_info = get_file_hash(path_info, memfs, "md5")
+            assert self.hash_info.value
+            self.hash_info.value += HASH_CHUNKED_SUFFIX
+        self.hash_info.size = sum(obj.size for obj in self._chunks)
+
+    def as_list(self):
+        return [obj.hash_info.to_dict() for obj in self._chunks]
+
+    def as_bytes(self):
+        return json.dumps(self.as_list()).encode("utf-8")
+
+    @classmethod
+    def from_list(cls, lst):
+        from dvc.hash_info import HashInfo
+
+        chunked = cls(None, None, None)
+        for entry in lst:
+            hash_info = HashInfo.from_dict(entry)
+            if hash_info.size is None:
+                raise ValueError(f"chunk '{hash_info}' has no size")
+            chunked.add(HashFile(None, None, hash_info))
+        return chunked
+
+    @classmethod
+    def load(cls, odb, hash_info):
+        obj = odb.get(hash_info)
+
+        try:
+            with obj.fs.open(obj.path_info, "r") as fobj:
+                raw = json.load(fobj)
+            if not isinstance(raw, list):
+                raise ValueError("manifest is not a list")
+            chunked = cls.from_list(raw)
+        except ValueError as exc:
+            logger.error(
+                "chunked file manifest format error '%s' [skipping the file]",
+                obj.path_info,
+            )
+            raise ObjectFormatError(f"{obj} is corrupted") from exc
+
+        chunked.path_info = obj.path_info
+        chunked.fs = obj.fs
+        for _, chunk_obj in chunked:
+            chunk_obj.fs = obj.fs
+        chunked.hash_info = hash_info
+        chunked.hash_info.size = sum(obj.size for obj in chunked._chunks)
+
+        return chunked
@@ -1,12 +1,16 @@
 import itertools
 import logging
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from copy import copy
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 
+from dvc.hash_info import HASH_CHUNKED_SUFFIX
 from dvc.objects.errors import ObjectDBPermissionError, ObjectFormatError
 from dvc.objects.file import HashFile
+from dvc.objects.packed import PackedHashFile
 from dvc.progress import Tqdm
 
 if TYPE_CHECKING:
@@ -14,6 +18,10 @@ if TYPE_CHECKING:
     from dvc.hash_info import HashInfo
     from dvc.types import AnyPath, DvcPath
 
+    from .listing import ObjectDBListingCache, ObjectDBTimings
+    from .pack import PackIndexes
+    from .reference import _Reference
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +30,10 @@ class ObjectDB:
     DEFAULT_VERIFY = False
     DEFAULT_CACHE_TYPES = ["copy"]
     CACHE_MODE: Optional[int] = None
+    # Existence of objects is queried in batches which are meant to take
+    # about this many seconds, according to the measured time per object.
+    EXISTS_BATCH_TIME = 1
+    MAX_EXISTS_BATCH_SIZE = 10000
 
     def __init__(self, fs: "BaseFileSystem", path_info: "AnyPath", **config):
         from dvc.state import StateNoop
@@ -35,6 +47,21 @@ class ObjectDB:
         self.slow_link_warning = config.get("slow_link_warning", True)
         self.tmp_dir = config.get("tmp_dir")
         self.read_only = config.get("read_only", False)
+        self.chunking = config.get("chunking", False)
+        self.pack_threshold = config.get("pack_threshold")
+        self._packs: Optional["PackIndexes"] = None
+        self._packs_lock = threading.Lock()
+        self.listing_ttl = config.get("listing_ttl")
+        self._listing_cache: Optional["ObjectDBListingCache"] = None
+        # measured seconds per listed page and per object queried with
+        # `fs.exists_many()`, see `hashes_exist()`
+        self._list_time: Optional[float] = None
+        self._exists_time: Optional[float] = None
+        self._timings: Optional["ObjectDBTimings"] = None
+        self._timings_loaded = False
+        # file references of the objects staged for this ODB, shared by its
+        # staging ODBs (see `dvc.objects.stage._get_staging`)
+        self.staged_refs: Dict[str, "_Reference"] = {}
 
     @property
     def config(self):
@@ -45,6 +72,9 @@ class ObjectDB:
             "slow_link_warning": self.slow_link_warning,
             "tmp_dir": self.tmp_dir,
             "read_only": self.read_only,
+            "chunking": self.chunking,
+            "pack_threshold": self.pack_threshold,
+            "listing_ttl": self.listing_ttl,
         }
 
     def __eq__(self, other):
@@ -58,7 +88,11 @@ class ObjectDB:
         return hash((self.fs.scheme, self.path_info))
 
     def exists(self, hash_info: "HashInfo"):
-        return self.fs.exists(self.hash_to_path_info(hash_info.value))
+        if self._get_packed(hash_info):
+            return True
+        if self.fs.exists(self.hash_to_path_info(hash_info.value)):
+            return True
+        return self._get_packed(hash_info, load=True) is not None
 
     def move(self, from_info, to_info):
         self.fs.move(from_info, to_info)
@@ -68,6 +102,9 @@ class ObjectDB:
 
     def get(self, hash_info: "HashInfo"):
         """get raw object"""
+        packed = self._get_packed(hash_info)
+        if packed:
+            return packed
         return HashFile(
             # Prefer string path over PathInfo when possible due to performance
             self.hash_to_path(hash_info.value),
@@ -120,6 +157,148 @@ class ObjectDB:
         except (ObjectFormatError, FileNotFoundError):
             pass
 
+    def add_bytes(self, data: bytes, hash_info: "HashInfo"):
+        """Add an object from its (in-memory) contents."""
+        import io
+
+        from dvc.utils import tmp_fname
+
+        if self.exists(hash_info):
+            return
+
+        tmp_info = self.path_info / tmp_fname()
+        self.makedirs(tmp_info.parent)
+        self.fs.upload(io.BytesIO(data), tmp_info, no_progress_bar=True)
+        self.add(tmp_info, self.fs, hash_info, move=True)
+
+    @property
+    def packs(self) -> "PackIndexes":
+        """Indexes of the pack files in this ODB, loaded on first use."""
+        with self._packs_lock:
+            if self._packs is None:
+                self._packs = self._load_packs()
+            return self._packs
+
+    def _packs_known(self) -> bool:
+        """Whether packs should be looked at before loose objects.
+
+        Packs are looked for in every ODB, as objects could have been packed
+        by other clients (e.g. in a shared remote), but ODBs that don't pack
+        objects themselves only list them once some object is not found on
+        its own, so that the rest (e.g. most remotes) don't need an extra
+        listing.
+        """
+        return bool(self.pack_threshold) or self._packs is not None
+
+    def _load_packs(self) -> "PackIndexes":
+        from dvc.fs.base import RemoteActionNotImplemented
+
+        from .pack import INDEX_SUFFIX, PackIndex, PackIndexes, packs_path_info
+
+        packs = PackIndexes()
+        if not self.path_info:
+            return packs
+        packs_info = packs_path_info(self)
+        try:
+            if not self.fs.exists(packs_info):
+                return packs
+            paths = list(self.fs.walk_files(packs_info))
+        except (NotImplementedError, RemoteActionNotImplemented):
+            return packs
+
+        for path_info in paths:
+            if not path_info.name.endswith(INDEX_SUFFIX):
+                continue
+            name = path_info.name[: -len(INDEX_SUFFIX)]
+            try:
+                with self.fs.open(path_info, mode="rb") as fobj:
+                    packs.add(PackIndex.from_bytes(name, fobj.read()))
+            except (OSError, ObjectFormatError):
+                logger.debug("failed to load pack index '%s'", path_info)
+        return packs
+
+    def _get_packed(
+        self, hash_info: "HashInfo", load: bool = False
+    ) -> Optional["PackedHashFile"]:
+        from .pack import PACK_SUFFIX, packs_path_info
+
+        if not hash_info.value or not (load or self._packs_known()):
+            return None
+        found = self.packs.find(hash_info.value)
+        if not found:
+            return None
+        index, offset, length = found
+        path_info = packs_path_info(self) / (index.name + PACK_SUFFIX)
+        return PackedHashFile(path_info, self.fs, hash_info, offset, length)
+
+    def is_packed(self, hash_info: "HashInfo") -> bool:
+        return self._get_packed(hash_info, load=True) is not None
+
+    def add_pack(
+        self, objs: Iterable["HashFile"], verify: Optional[bool] = None
+    ):
+        """Add the given file objects to this ODB as a single pack."""
+        from .pack import write_pack
+
+        if self.read_only:
+            raise ObjectDBPermissionError("Cannot add to read-only ODB")
+        if verify is None:
+            verify = self.verify
+
+        index = write_pack(self, objs, verify=verify)
+        if index:
+            with self._packs_lock:
+                if self._packs is not None:
+                    self._packs.add(index)
+        return index
+
+    def _index_name(self) -> str:
+        import hashlib
+
+        return hashlib.sha256(str(self.path_info).encode("utf-8")).hexdigest()
+
+    @property
+    def listing_cache(self) -> Optional["ObjectDBListingCache"]:
+        """Cache of remote listings, when enabled with `listing_ttl`.
+
+        Hashes found in cached listings are trusted to exist for up to
+        `listing_ttl` seconds (see `ObjectDBListingCache`).
+        """
+        from .listing import ObjectDBListingCache
+
+        if not (self.listing_ttl and self.tmp_dir):
+            return None
+        if self._listing_cache is None:
+            self._listing_cache = ObjectDBListingCache(
+                self.tmp_dir, self._index_name(), self.listing_ttl
+            )
+        return self._listing_cache
+
+    @property
+    def timings(self) -> Optional["ObjectDBTimings"]:
+        """Times measured in earlier runs, see `hashes_exist()`."""
+        from .listing import ObjectDBTimings
+
+        if not self.tmp_dir:
+            return None
+        if self._timings is None:
+            self._timings = ObjectDBTimings(self.tmp_dir, self._index_name())
+        return self._timings
+
+    def _load_times(self):
+        if self._timings_loaded:
+            return
+        self._timings_loaded = True
+        timings = self.timings
+        if timings:
+            self._list_time = self._list_time or timings.get("list")
+            self._exists_time = self._exists_time or timings.get("exists")
+
+    def _save_time(self, key: str, value: float):
+        timings = self.timings
+        if timings:
+            timings.set(key, value)
+
     def hash_to_path_info(self, hash_) -> "DvcPath":
         return self.path_info / hash_[0:2] / hash_[2:]
 
@@ -171,8 +350,10 @@ class ObjectDB:
             obj.check(self, check_hash=check_hash)
         except ObjectFormatError:
             logger.warning("corrupted cache file '%s'.", obj.path_info)
-            with suppress(FileNotFoundError):
-                self.fs.remove(obj.path_info)
+            # NOTE: a pack holds other (valid) objects too
+            if not isinstance(obj, PackedHashFile):
+                with suppress(FileNotFoundError):
+                    self.fs.remove(obj.path_info)
             raise
 
         if check_hash:
@@ -190,17 +371,28 @@ class ObjectDB:
         else:
             path_info = self.path_info
             prefix = False
+        from dvc.fs.base import RemoteActionNotImplemented
+
+        try:
+            # NOTE: listed as plain paths (rather than `PathInfo`s), which
+            # is all it takes to get hashes out of them
+            paths = self.fs.find(path_info, prefix=prefix)
+        except RemoteActionNotImplemented:
+            paths = (
+                file_info.path
+                for file_info in self.fs.walk_files(path_info, prefix=prefix)
+            )
         if progress_callback:
-            for file_info in self.fs.walk_files(path_info, prefix=prefix):
+            for path in paths:
                 progress_callback()
-                yield file_info.path
+                yield path
         else:
-            yield from self.fs.walk_files(path_info, prefix=prefix)
+            yield from paths
 
     def _path_to_hash(self, path):
-        parts = self.fs.PATH_CLS(path).parts[-2:]
+        parts = path.rsplit(self.fs.sep, 2)[-2:]
 
-        if not (len(parts) == 2 and parts[0] and len(parts[0]) == 2):
+        if not (len(parts) == 2 and len(parts[0]) == 2 and parts[1]):
             raise ValueError(f"Bad cache file path '{path}'")
 
         return "".join(parts)
@@ -218,6 +410,8 @@ class ObjectDB:
                 logger.debug(
                     "'%s' doesn't look like a cache file, skipping", path
                 )
+        for index in self.packs.values():
+            yield from index.hashes(prefix)
 
     def _hashes_with_limit(self, limit, prefix=None, progress_callback=None):
         count = 0
@@ -260,14 +454,29 @@ class ObjectDB:
             def update(n=1):
                 pbar.update(n * total_prefixes)
 
-            if max_hashes:
-                hashes = self._hashes_with_limit(
-                    max_hashes / total_prefixes, prefix, update
+            listing_cache = self.listing_cache
+            cached = listing_cache.get(prefix) if listing_cache else None
+            started = time.perf_counter()
+            if cached is not None:
+                remote_hashes = set(cached)
+            elif max_hashes:
+                limit = max_hashes / total_prefixes
+                remote_hashes = set(
+                    self._hashes_with_limit(limit, prefix, update)
                 )
+                if listing_cache and len(remote_hashes) <= limit:
+                    listing_cache.set(prefix, remote_hashes)
             else:
-                hashes = self.list_hashes(prefix, update)
+                remote_hashes = set(self.list_hashes(prefix, update))
+                if listing_cache:
+                    listing_cache.set(prefix, remote_hashes)
+            if cached is None:
+                pages = -(-len(remote_hashes) // self.fs.LIST_OBJECT_PAGE_SIZE)
+                self._list_time = (time.perf_counter() - started) / max(
+                    1, pages
+                )
+                self._save_time("list", self._list_time)
 
-            remote_hashes = set(hashes)
             if remote_hashes:
                 remote_size = total_prefixes * len(remote_hashes)
             else:
@@ -319,12 +528,22 @@ class ObjectDB:
             unit="file",
         ) as pbar:
 
+            listing_cache = self.listing_cache
+
             def list_with_update(prefix):
-                return list(
+                if listing_cache:
+                    cached = listing_cache.get(prefix)
+                    if cached is not None:
+                        pbar.update(len(cached))
+                        return cached
+                hashes = list(
                     self.list_hashes(
                         prefix=prefix, progress_callback=pbar.update
                     )
                 )
+                if listing_cache:
+                    listing_cache.set(prefix, hashes)
+                return hashes
 
             with ThreadPoolExecutor(
                 max_workers=jobs or self.fs.jobs
@@ -356,6 +575,7 @@ class ObjectDB:
         pass
 
     def gc(self, used, jobs=None, cache_odb=None, shallow=True):
+        from ..chunked import ChunkedFile
         from ..tree import Tree
 
         if self.read_only:
@@ -370,15 +590,30 @@ class ObjectDB:
                 used_hashes.update(
                     entry_obj.hash_info.value for _, entry_obj in tree
                 )
+            elif hash_info.ischunked and not shallow:
+                chunked = ChunkedFile.load(cache_odb, hash_info)
+                used_hashes.update(
+                    entry_obj.hash_info.value for _, entry_obj in chunked
+                )
+
+        def _is_manifest(hash_):
+            return self.fs.is_dir_hash(hash_) or hash_.endswith(
+                HASH_CHUNKED_SUFFIX
+            )
+
+        packed_hashes = set()
+        for index in self.packs.values():
+            packed_hashes.update(index.hashes())
 
         removed = False
-        # hashes must be sorted to ensure we always remove .dir files first
+        # hashes must be sorted to ensure we always remove .dir files (and
+        # chunked file manifests) first
         for hash_ in sorted(
             self.all(jobs, str(self.path_info)),
-            key=self.fs.is_dir_hash,
+            key=_is_manifest,
             reverse=True,
         ):
-            if hash_ in used_hashes:
+            if hash_ in used_hashes or hash_ in packed_hashes:
                 continue
             path_info = self.hash_to_path_info(hash_)
             if self.fs.is_dir_hash(hash_):
@@ -388,35 +623,102 @@ class ObjectDB:
             self.fs.remove(path_info)
             removed = True
 
+        removed = self._gc_packs(used_hashes) or removed
+        if removed and self.listing_cache:
+            self.listing_cache.clear()
         return removed
 
+    def _gc_packs(self, used_hashes):
+        from .pack import INDEX_SUFFIX, PACK_SUFFIX, packs_path_info
+
+        # NOTE: packs are immutable, so only the ones that don't hold any
+        # used objects can be removed. Partially used packs are kept as is.
+        removed = False
+        packs = self.packs
+        for name, index in list(packs.items()):
+            if any(hash_ in used_hashes for hash_ in index.hashes()):
+                continue
+            packs_info = packs_path_info(self)
+            # index goes first, so that the pack is never used without it
+            self.fs.remove(packs_info / (name + INDEX_SUFFIX))
+            self.fs.remove(packs_info / (name + PACK_SUFFIX))
+            with self._packs_lock:
+                packs.remove(name)
+            removed = True
+        return removed
+
+    def _exists_batch_size(self, jobs):
+        if not self._exists_time:
+            return jobs
+        size = int(self.EXISTS_BATCH_TIME / self._exists_time)
+        return max(jobs, min(size, self.MAX_EXISTS_BATCH_SIZE))
+
     def list_hashes_exists(self, hashes, jobs=None, name=None):
         """Return list of the specified hashes which exist in this fs.
-        Hashes will be queried individually.
+        Hashes will be queried in batches with `fs.exists_many()`.
         """
         logger.debug(f"Querying {len(hashes)} hashes via object_exists")
+        self._load_times()
+        jobs = jobs or self.fs.jobs
+        hashes = list(hashes)
+        ret = []
         with Tqdm(
             desc="Querying "
             + ("cache in " + name if name else "remote cache"),
             total=len(hashes),
             unit="file",
         ) as pbar:
+            callback = pbar.as_callback()
+            start = 0
+            while start < len(hashes):
+                # NOTE: the first batch is only as large as the number of
+                # jobs (unless querying has been timed in an earlier run),
+                # the following ones are sized from how long it took
+                batch = hashes[start : start + self._exists_batch_size(jobs)]
+                start += len(batch)
+                started = time.perf_counter()
+                in_remote = self.fs.exists_many(
+                    [self.hash_to_path_info(hash_) for hash_ in batch],
+                    jobs=jobs,
+                    callback=callback,
+                )
+                self._exists_time = (time.perf_counter() - started) / len(
+                    batch
+                )
+                ret.extend(itertools.compress(batch, in_remote))
+        if self._exists_time:
+            self._save_time("exists", self._exists_time)
+        return ret
 
-            def exists_with_progress(path_info):
-                ret = self.fs.exists(path_info)
-                pbar.update_msg(str(path_info))
-                return ret
+    def hashes_exist(self, hashes, jobs=None, name=None):
+        """Check if the given hashes are stored in the remote.
 
-            with ThreadPoolExecutor(
-                max_workers=jobs or self.fs.jobs
-            ) as executor:
-                path_infos = map(self.hash_to_path_info, hashes)
-                in_remote = executor.map(exists_with_progress, path_infos)
-                ret = list(itertools.compress(hashes, in_remote))
+        Packed objects are known from the pack indexes, so only the rest
+        are queried (see `_hashes_exist()`).
+
+        Returns:
+            A list with hashes that were found in the remote
+        """
+        hashes = set(hashes)
+        ret = []
+        if self._packs_known():
+            ret = [hash_ for hash_ in hashes if self.packs.has(hash_)]
+            hashes.difference_update(ret)
+            if not hashes:
                 return ret
 
-    def hashes_exist(self, hashes, jobs=None, name=None):
-        """Check if the given hashes are stored in the remote.
+        found = self._hashes_exist(hashes, jobs, name)
+        ret.extend(found)
+        if len(found) < len(hashes) and not self._packs_known():
+            ret.extend(
+                hash_
+                for hash_ in hashes.difference(found)
+                if self.packs.has(hash_)
+            )
+        return ret
+
+    def _hashes_exist(self, hashes, jobs=None, name=None):
+        """Check if the given (loose) objects are stored in the remote.
 
         There are two ways of performing this check:
 
@@ -426,16 +728,16 @@ class ObjectDB:
             threads according to prefix (i.e. entries starting with, "00...",
             "01...", and so on) and a progress bar will be displayed.
 
-        - Exists method: For each given hash, run the `exists`
-            method and filter the hashes that aren't on the remote.
-            This is done in parallel threads.
+        - Exists method: For each given hash, check whether it exists
+            with `fs.exists_many()` (in batches) and filter the hashes that
+            aren't on the remote.
             It also shows a progress bar when performing the check.
 
         The reason for such an odd logic is that most of the remotes
         take much shorter time to just retrieve everything they have under
         a certain prefix (e.g. s3, gs, ssh, hdfs). Other remotes that can
         check if particular file exists much quicker, use their own
-        implementation of hashes_exist (see ssh, local).
+        implementation of _hashes_exist (see ssh, local).
 
         Which method to use will be automatically determined after estimating
         the size of the remote cache, and comparing the estimated size with
@@ -443,15 +745,27 @@ class ObjectDB:
         a small subset of cache entries (i.e. entries starting with "00...").
         Based on the number of entries in that subset, the size of the full
         cache can be estimated, since the cache is evenly distributed according
-        to hash.
+        to hash. Once both methods have been timed against the remote (in
+        this or an earlier run, see `timings`), the measured time per listed
+        page and per queried hash is used to weigh them against each other.
 
         Returns:
             A list with hashes that were found in the remote
         """
         # Remotes which do not use traverse prefix should override
-        # hashes_exist() (see ssh, local)
+        # _hashes_exist() (see ssh, local)
         assert self.fs.TRAVERSE_PREFIX_LEN >= 2
 
+        listing_cache = self.listing_cache
+        if listing_cache:
+            listed, hashes = listing_cache.lookup(
+                hashes, self.fs.TRAVERSE_PREFIX_LEN
+            )
+            if not hashes:
+                return list(listed)
+            if listed:
+                return list(listed) + self._hashes_exist(hashes, jobs, name)
+
         # During the tests, for ensuring that the traverse behavior
         # is working we turn on this option. It will ensure the
         # list_hashes_traverse() is called.
@@ -468,11 +782,23 @@ class ObjectDB:
         remote_size, remote_hashes = self._estimate_remote_size(hashes, name)
 
         traverse_pages = remote_size / self.fs.LIST_OBJECT_PAGE_SIZE
-        # For sufficiently large remotes, traverse must be weighted to account
-        # for performance overhead from large lists/sets.
-        # From testing with S3, for remotes with 1M+ files, object_exists is
-        # faster until len(hashes) is at least 10k~100k
-        if remote_size > self.fs.TRAVERSE_THRESHOLD_SIZE:
+        self._load_times()
+        if self._list_time and self._exists_time:
+            # Both listing and existence queries have already been timed
+            # against this remote, so the number of objects worth querying
+            # individually is how many of them can be queried in the time
+            # that traversing (in parallel) is expected to take.
+            traverse_weight = (
+                traverse_pages
+                * self._list_time
+                / (jobs or self.fs.jobs)
+                / self._exists_time
+            )
+        elif remote_size > self.fs.TRAVERSE_THRESHOLD_SIZE:
+            # For sufficiently large remotes, traverse must be weighted to
+            # account for performance overhead from large lists/sets.
+            # From testing with S3, for remotes with 1M+ files,
+            # object_exists is faster until len(hashes) is at least 10k~100k
             traverse_weight = (
                 traverse_pages * self.fs.TRAVERSE_WEIGHT_MULTIPLIER
             )
@@ -490,7 +816,13 @@ class ObjectDB:
             )
 
         logger.debug(f"Querying '{len(hashes)}' hashes via traverse")
-        remote_hashes = set(
-            self.list_hashes_traverse(remote_size, remote_hashes, jobs, name)
-        )
-        return list(hashes & set(remote_hashes))
+        # NOTE: the remote listing can be much larger than `hashes` (e.g.
+        # 100M entries would take several GBs as a set of strings), so it is
+        # intersected as it is being fetched instead of being collected.
+        found = set()
+        for hash_ in self.list_hashes_traverse(
+            remote_size, remote_hashes, jobs, name
+        ):
+            if hash_ in hashes:
+                found.add(hash_)
+        return list(found)
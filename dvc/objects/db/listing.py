@@ -0,0 +1,169 @@
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..errors import ObjectDBError
+
+if TYPE_CHECKING:
+    from dvc.types import StrPath
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectDBListingCache:
+    """Cache of (prefix) listings of a remote ODB.
+
+    Traversing a large remote means listing thousands of prefixes, which is
+    done for every status/push/pull. Listings are kept for `ttl` seconds so
+    that repeated runs can reuse them instead. Hashes which are pushed by us
+    are added to the cached listings, but hashes which are removed from the
+    remote by anybody else will only be noticed once the listing expires.
+
+    That is, hashes found in a cached listing are trusted to exist on the
+    remote for up to `ttl` (`listing_ttl` remote option) seconds. Listings
+    can be dropped earlier with `clear()` (e.g. `--refresh-listing` option
+    of status/push/pull/fetch), to re-list the remote on the next query.
+    """
+
+    LISTING_SUFFIX = ".listing"
+    INDEX_DIR = "index"
+
+    def __init__(self, tmp_dir: "StrPath", name: str, ttl: int):
+        from diskcache import Cache
+
+        from dvc.utils.fs import makedirs
+
+        self.listing_dir = os.path.join(
+            tmp_dir, self.INDEX_DIR, name + self.LISTING_SUFFIX
+        )
+        makedirs(self.listing_dir, exist_ok=True)
+        self.cache = Cache(self.listing_dir)
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(prefix: Optional[str]) -> str:
+        return prefix or ""
+
+    def get(self, prefix: Optional[str] = None) -> Optional[List[str]]:
+        """Return cached listing for `prefix`, unless it has expired."""
+        entry = self.cache.get(self._key(prefix))
+        if entry is None:
+            return None
+        listed_at, hashes = entry
+        if time.time() - listed_at > self.ttl:
+            logger.debug("Listing of prefix '%s' has expired", prefix)
+            return None
+        return hashes
+
+    def lookup(
+        self, hashes: Iterable[str], max_prefix_len: int
+    ) -> Tuple[Set[str], Set[str]]:
+        """Check `hashes` against the cached listings.
+
+        Returns a tuple of hashes found in the listings and hashes which
+        could not be checked because their prefixes aren't (freshly) cached.
+        """
+        listings: Dict[str, Optional[Set[str]]] = {}
+
+        def _listing(key):
+            if key not in listings:
+                hashes = self.get(key)
+                listings[key] = set(hashes) if hashes is not None else None
+            return listings[key]
+
+        found: Set[str] = set()
+        unknown: Set[str] = set()
+        for hash_ in hashes:
+            for i in range(max_prefix_len + 1):
+                listing = _listing(hash_[:i])
+                if listing is not None:
+                    if hash_ in listing:
+                        found.add(hash_)
+                    break
+            else:
+                unknown.add(hash_)
+        return found, unknown
+
+    def set(self, prefix: Optional[str], hashes: Iterable[str]):
+        from diskcache import Timeout
+
+        try:
+            self.cache[self._key(prefix)] = (time.time(), list(hashes))
+        except Timeout as exc:
+            raise ObjectDBError("Failed to update ODB listing cache") from exc
+
+    def update(self, hashes: Iterable[str]):
+        """Add hashes which are now known to exist to the cached listings
+        of their prefixes (without extending their expiration)."""
+        from diskcache import Timeout
+
+        by_key: Dict[str, List[str]] = {}
+        keys = set(self.cache.iterkeys())
+        for hash_ in hashes:
+            for i in range(len(hash_)):
+                key = hash_[:i]
+                if key in keys:
+                    by_key.setdefault(key, []).append(hash_)
+                    if key:
+                        # a hash is only ever listed under a single prefix
+                        break
+
+        try:
+            with self.cache.transact():
+                for key, new in by_key.items():
+                    entry = self.cache.get(key)
+                    if entry is None:
+                        continue
+                    listed_at, existing = entry
+                    self.cache[key] = (
+                        listed_at,
+                        list(set(existing).union(new)),
+                    )
+        except Timeout as exc:
+            raise ObjectDBError("Failed to update ODB listing cache") from exc
+
+    def clear(self):
+        """Clear all listings (to force re-listing the remote later)."""
+        from diskcache import Timeout
+
+        try:
+            self.cache.clear()
+        except Timeout as exc:
+            raise ObjectDBError("Failed to clear ODB listing cache") from exc
+
+
+class ObjectDBTimings:
+    """Measured times of querying a remote ODB, e.g. per listed page.
+
+    Times are kept between runs, so that `ObjectDB.hashes_exist` can weigh
+    listing the remote against querying objects from the start. They are
+    only ever replaced by newer measurements.
+    """
+
+    TIMINGS_SUFFIX = ".timings"
+    INDEX_DIR = ObjectDBListingCache.INDEX_DIR
+
+    def __init__(self, tmp_dir: "StrPath", name: str):
+        from diskcache import Cache
+
+        from dvc.utils.fs import makedirs
+
+        self.timings_dir = os.path.join(
+            tmp_dir, self.INDEX_DIR, name + self.TIMINGS_SUFFIX
+        )
+        makedirs(self.timings_dir, exist_ok=True)
+        self.cache = Cache(self.timings_dir)
+
+    def get(self, key: str) -> Optional[float]:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: float):
+        from diskcache import Timeout
+
+        try:
+            self.cache[key] = value
+        except Timeout:
+            # NOTE: times are only used as hints, measuring them again is
+            # better than failing
+            logger.debug("Failed to save '%s' time of ODB", key)
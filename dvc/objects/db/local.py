@@ -61,7 +61,7 @@ class LocalObjectDB(ObjectDB):
         # being ~5.5 times faster.
         return f"{self.cache_path}{os.sep}{hash_[0:2]}{os.sep}{hash_[2:]}"
 
-    def hashes_exist(
+    def _hashes_exist(
         self, hashes, jobs=None, name=None
     ):  # pylint: disable=unused-argument
         ret = []
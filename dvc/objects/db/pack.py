@@ -0,0 +1,303 @@
+"""Pack files for small objects.
+
+Storing each small object as a separate file means one inode per object in
+the local cache and one request per object on cloud remotes. Instead, small
+objects can be appended to a single pack file, git-style:
+
+    <odb>/packs/<name>.pack - contents of the objects, one after another
+    <odb>/packs/<name>.idx  - sorted (digest, offset, length) entries
+
+The index is always written after the pack, so that a pack is only ever
+used once it is complete. Pack names are derived from the index, so the
+same set of objects always results in the same pack.
+"""
+import hashlib
+import logging
+import struct
+import tempfile
+from collections.abc import Mapping
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from dvc.path_info import PathInfo
+
+from ..errors import ObjectFormatError
+from ..packed import PackedHashFile
+
+if TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+    from dvc.types import DvcPath
+
+    from ..file import HashFile
+    from .base import ObjectDB
+
+logger = logging.getLogger(__name__)
+
+PACK_DIR = "packs"
+PACK_SUFFIX = ".pack"
+INDEX_SUFFIX = ".idx"
+# larger objects are always stored on their own
+PACK_MAX_OBJECT_SIZE = 2 ** 20
+
+_INDEX_MAGIC = b"DVCIDX1\n"
+_ENTRY = struct.Struct(">16sQQ")
+_DIGEST_SIZE = 16
+
+
+def packs_path_info(odb: "ObjectDB") -> "DvcPath":
+    return cast("DvcPath", odb.path_info) / PACK_DIR
+
+
+def _to_digest(hash_: str) -> Optional[bytes]:
+    try:
+        digest = bytes.fromhex(hash_)
+    except ValueError:
+        return None
+    return digest if len(digest) == _DIGEST_SIZE else None
+
+
+def is_packable(hash_info: "HashInfo", size: Optional[int]) -> bool:
+    """Only small plain md5 objects (i.e. no .dir or chunked file manifests)
+    are packed."""
+    return (
+        size is not None
+        and size <= PACK_MAX_OBJECT_SIZE
+        and hash_info.name == "md5"
+        and hash_info.value is not None
+        and _to_digest(hash_info.value) is not None
+    )
+
+
+class PackIndex:
+    def __init__(self, name: str, entries: bytes):
+        assert len(entries) % _ENTRY.size == 0
+        self.name = name
+        self._entries = entries
+
+    def __len__(self):
+        return len(self._entries) // _ENTRY.size
+
+    def __contains__(self, hash_):
+        return self.find(hash_) is not None
+
+    def _digest(self, i: int) -> bytes:
+        pos = i * _ENTRY.size
+        return self._entries[pos : pos + _DIGEST_SIZE]
+
+    def _bisect(self, digest: bytes) -> int:
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._digest(mid) < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, hash_: str) -> Optional[Tuple[int, int]]:
+        """Return (offset, length) of the object in the pack file."""
+        digest = _to_digest(hash_)
+        if digest is None:
+            return None
+        i = self._bisect(digest)
+        if i < len(self) and self._digest(i) == digest:
+            _, offset, length = _ENTRY.unpack_from(
+                self._entries, i * _ENTRY.size
+            )
+            return offset, length
+        return None
+
+    def hashes(self, prefix: Optional[str] = None) -> Iterator[str]:
+        start = 0
+        if prefix:
+            start = self._bisect(
+                bytes.fromhex(prefix.ljust(2 * _DIGEST_SIZE, "0"))
+            )
+        for i in range(start, len(self)):
+            hash_ = self._digest(i).hex()
+            if prefix and not hash_.startswith(prefix):
+                return
+            yield hash_
+
+    def digests(self) -> Iterator[bytes]:
+        for i in range(len(self)):
+            yield self._digest(i)
+
+    def to_bytes(self) -> bytes:
+        return _INDEX_MAGIC + self._entries
+
+    @classmethod
+    def from_bytes(cls, name: str, data: bytes) -> "PackIndex":
+        if not data.startswith(_INDEX_MAGIC):
+            raise ObjectFormatError(f"pack index '{name}' is corrupted")
+        entries = data[len(_INDEX_MAGIC) :]
+        if len(entries) % _ENTRY.size:
+            raise ObjectFormatError(f"pack index '{name}' is truncated")
+        return cls(name, entries)
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, int, int]]) -> "PackIndex":
+        packed = sorted(
+            _ENTRY.pack(bytes.fromhex(hash_), offset, length)
+            for hash_, offset, length in entries
+        )
+        data = b"".join(packed)
+        return cls(hashlib.md5(data).hexdigest(), data)
+
+
+class PackIndexes(Mapping):
+    """Indexes of all of the packs in an ODB, by pack name.
+
+    Looking a hash up in every index one by one would take time proportional
+    to the number of packs, so (similarly to git's multi-pack-index) digests
+    of all packed objects are mapped to the pack holding them. The mapping is
+    only built on the first lookup, and is kept up to date as packs are
+    added and removed.
+    """
+
+    def __init__(self, indexes: Iterable[PackIndex] = ()):
+        self._indexes: Dict[str, PackIndex] = {
+            index.name: index for index in indexes
+        }
+        self._lookup: Optional[Dict[bytes, PackIndex]] = None
+
+    def __getitem__(self, name: str) -> PackIndex:
+        return self._indexes[name]
+
+    def __iter__(self):
+        return iter(self._indexes)
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def _index_lookup(self) -> Dict[bytes, PackIndex]:
+        if self._lookup is None:
+            lookup: Dict[bytes, PackIndex] = {}
+            for index in self._indexes.values():
+                lookup.update(dict.fromkeys(index.digests(), index))
+            self._lookup = lookup
+        return self._lookup
+
+    def add(self, index: PackIndex):
+        self._indexes[index.name] = index
+        if self._lookup is not None:
+            self._lookup.update(dict.fromkeys(index.digests(), index))
+
+    def remove(self, name: str):
+        self._indexes.pop(name)
+        # NOTE: other packs might hold the same objects too
+        self._lookup = None
+
+    def find(self, hash_: str) -> Optional[Tuple[PackIndex, int, int]]:
+        """Return the index of the pack holding the object, and (offset,
+        length) of the object in that pack."""
+        if not self._indexes:
+            return None
+        digest = _to_digest(hash_)
+        if digest is None:
+            return None
+        index = self._index_lookup().get(digest)
+        if index is None:
+            return None
+        found = index.find(hash_)
+        assert found
+        return (index, *found)
+
+    def has(self, hash_: str) -> bool:
+        return self.find(hash_) is not None
+
+
+def read_object(obj: "HashFile") -> bytes:
+    if isinstance(obj, PackedHashFile):
+        return obj.read_bytes()
+    assert obj.fs
+    with obj.fs.open(obj.path_info, mode="rb") as fobj:
+        return fobj.read()
+
+
+def write_pack(
+    odb: "ObjectDB", objs: Iterable["HashFile"], verify: bool = False
+) -> Optional[PackIndex]:
+    """Write the given objects into a new pack in `odb`.
+
+    The pack is assembled in a local temporary directory and then uploaded
+    with its index, so that adding it to a remote ODB only takes two
+    requests.
+    """
+    from dvc.fs.local import LocalFileSystem
+    from dvc.fs.utils import transfer
+
+    local_fs = LocalFileSystem()
+    entries = []
+    seen = set()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_pack = PathInfo(tmp_dir) / "pack"
+        with open(tmp_pack, "wb") as fobj:
+            offset = 0
+            for obj in objs:
+                hash_ = obj.hash_info.value
+                assert hash_
+                if hash_ in seen:
+                    continue
+                data = read_object(obj)
+                if verify and hashlib.md5(data).hexdigest() != hash_:
+                    logger.error("'%s' is corrupted, not packing it", obj)
+                    continue
+                fobj.write(data)
+                entries.append((hash_, offset, len(data)))
+                seen.add(hash_)
+                offset += len(data)
+        if not entries:
+            return None
+
+        index = PackIndex.build(entries)
+        tmp_index = PathInfo(tmp_dir) / "idx"
+        with open(tmp_index, "wb") as fobj:
+            fobj.write(index.to_bytes())
+
+        packs_info = packs_path_info(odb)
+        odb.makedirs(packs_info)
+        for tmp_info, suffix in (
+            (tmp_pack, PACK_SUFFIX),
+            (tmp_index, INDEX_SUFFIX),
+        ):
+            path_info = packs_info / (index.name + suffix)
+            transfer(local_fs, tmp_info, odb.fs, path_info, move=True)
+            odb.protect(path_info)
+
+    logger.debug(
+        "Packed %d objects into '%s' in '%s'",
+        len(index),
+        index.name,
+        odb.path_info,
+    )
+    return index
+
+
+def copy_pack(src: "ObjectDB", dest: "ObjectDB", index: PackIndex):
+    """Copy a whole pack (with its index) from one ODB to another."""
+    from dvc.fs.local import LocalFileSystem
+    from dvc.fs.utils import transfer
+
+    src_info = packs_path_info(src)
+    dest_info = packs_path_info(dest)
+    dest.makedirs(dest_info)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_index = PathInfo(tmp_dir) / "idx"
+        with open(tmp_index, "wb") as fobj:
+            fobj.write(index.to_bytes())
+        pack_info = dest_info / (index.name + PACK_SUFFIX)
+        transfer(
+            src.fs, src_info / (index.name + PACK_SUFFIX), dest.fs, pack_info
+        )
+        dest.protect(pack_info)
+        index_info = dest_info / (index.name + INDEX_SUFFIX)
+        transfer(LocalFileSystem(), tmp_index, dest.fs, index_info, move=True)
+        dest.protect(index_info)
@@ -1,11 +1,18 @@
-import io
 import logging
-import os
-from typing import TYPE_CHECKING, Dict
-
-from dvc.scheme import Schemes
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from ..errors import ObjectFormatError
+from ..file import HashFile
+from ..packed import PackedHashFile
 from ..reference import ReferenceHashFile
 from .base import ObjectDB
 
@@ -17,40 +24,172 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _Reference(NamedTuple):
+    path_info: "AnyPath"
+    fs: "BaseFileSystem"
+    hash_info: "HashInfo"
+    checksum: Optional[str]
+    # only set for references to a slice of the file (e.g. chunks)
+    offset: Optional[int] = None
+    length: Optional[int] = None
+
+
 class ReferenceObjectDB(ObjectDB):
     """Reference ODB.
 
-    File objects are stored as ReferenceHashFiles which reference paths outside
-    of the staging ODB fs. Tree objects are stored natively.
+    File objects are kept in memory of this process, as references to paths
+    (or to slices of files, see `add_slice`) outside of the staging ODB fs.
+    Tree objects and chunked file manifests are stored natively.
+
+    References are kept in `refs` if it is given, to be shared with other
+    staging ODBs for as long as it exists (see `dvc.objects.stage`).
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        refs: Optional[Dict[str, _Reference]] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
-        self._fs_cache: Dict[tuple, "BaseFileSystem"] = {}
-        self._obj_cache: Dict["HashInfo", "ReferenceHashFile"] = {}
+        self._refs: Dict[str, _Reference] = {} if refs is None else refs
+        # references that were added or checked through this ODB, so that
+        # they don't need to be checked again (and are still there if other
+        # ODBs sharing `refs` remove them in the meantime)
+        self._checked: Dict[str, _Reference] = {}
+        # trees whose files are yet to be referenced, see
+        # `add_tree_references`
+        self._trees: List[Tuple["DvcPath", "BaseFileSystem", "HashInfo"]] = []
+        self._trees_lock = threading.Lock()
+
+    def __eq__(self, other):
+        # NOTE: staging ODBs of different ODBs (e.g. of the same cache dir in
+        # other repos) don't have the same references
+        return super().__eq__(other) and self._refs is getattr(
+            other, "_refs", None
+        )
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def exists(self, hash_info: "HashInfo"):
+        if hash_info.isdir or hash_info.ischunked:
+            return super().exists(hash_info)
+        assert hash_info.value
+        if hash_info.value in self._checked:
+            return True
+        self._add_trees()
+        return (
+            hash_info.value in self._checked or hash_info.value in self._refs
+        )
 
     def get(self, hash_info: "HashInfo"):
-        if hash_info.isdir:
+        if hash_info.isdir or hash_info.ischunked:
             return super().get(hash_info)
+        assert hash_info.value
+        ref = self._checked.get(hash_info.value)
+        if not ref:
+            self._add_trees()
+            ref = self._checked.get(hash_info.value)
+        if ref:
+            return self._ref_file(ref)
+
         try:
-            return self._obj_cache[hash_info]
+            ref = self._refs[hash_info.value]
         except KeyError:
-            pass
-        path_info = self.hash_to_path(hash_info.value)
-        try:
-            with self.fs.open(path_info, "rb") as fobj:
-                ref_file = ReferenceHashFile.from_bytes(
-                    fobj.read(), fs_cache=self._fs_cache
-                )
-        except OSError:
             raise FileNotFoundError
+        ref_file = ReferenceHashFile(
+            ref.path_info, ref.fs, ref.hash_info, checksum=ref.checksum
+        )
         try:
             ref_file.check(self, check_hash=False)
         except ObjectFormatError:
-            self.fs.remove(path_info)
+            self._refs.pop(hash_info.value, None)
             raise
-        self._obj_cache[hash_info] = ref_file
-        return ref_file
+        self._checked[hash_info.value] = ref
+        return self._ref_file(ref)
+
+    def add(
+        self,
+        path_info: "AnyPath",
+        fs: "BaseFileSystem",
+        hash_info: "HashInfo",
+        move: bool = True,
+        verify: Optional[bool] = None,
+    ):
+        if hash_info.isdir or hash_info.ischunked:
+            return super().add(path_info, fs, hash_info, move, verify)
+        # NOTE: an existing reference might be to another path with the same
+        # contents (e.g. staged by a stage running in parallel), which could
+        # be moved to cache by the time that this one is transferred, so the
+        # given path is always referenced through this ODB.
+        self._add_file(
+            fs, path_info, self.hash_to_path_info(hash_info.value), hash_info
+        )
+
+    def add_slice(
+        self,
+        path_info: "AnyPath",
+        fs: "BaseFileSystem",
+        hash_info: "HashInfo",
+        offset: int,
+        length: int,
+        checksum: Optional[str] = None,
+    ):
+        """Reference `length` bytes at `offset` of the given file as a file
+        object, which is read into memory when it is transferred."""
+        assert hash_info.value
+        assert not (hash_info.isdir or hash_info.ischunked)
+        checksum = checksum or fs.checksum(path_info)
+        ref = _Reference(path_info, fs, hash_info, checksum, offset, length)
+        self._refs[hash_info.value] = ref
+        self._checked[hash_info.value] = ref
+
+    def add_tree_references(
+        self,
+        path_info: "DvcPath",
+        fs: "BaseFileSystem",
+        hash_info: "HashInfo",
+    ):
+        """Reference the files inside `path_info` as entries of the tree,
+        which has to be staged already.
+
+        Files are only referenced once any file object is looked up, since
+        that takes a stat of every one of them.
+        """
+        assert hash_info.isdir
+        with self._trees_lock:
+            self._trees.append((path_info, fs, hash_info))
+
+    def _add_trees(self):
+        from .. import load
+        from ..tree import Tree
+
+        if not self._trees:
+            return
+        with self._trees_lock:
+            while self._trees:
+                path_info, fs, hash_info = self._trees[-1]
+                try:
+                    tree = load(self, hash_info)
+                    assert isinstance(tree, Tree)
+                    for key, entry in tree:
+                        self.add(path_info.joinpath(*key), fs, entry.hash_info)
+                finally:
+                    # NOTE: only popped now, so that lookups in other
+                    # threads wait for the references to be added
+                    self._trees.pop()
+
+    @staticmethod
+    def _ref_file(ref: _Reference) -> HashFile:
+        if ref.offset is not None:
+            assert ref.length is not None
+            return PackedHashFile(
+                ref.path_info, ref.fs, ref.hash_info, ref.offset, ref.length
+            )
+        return ReferenceHashFile(
+            ref.path_info, ref.fs, ref.hash_info, checksum=ref.checksum
+        )
 
     def _add_file(
         self,
@@ -60,25 +199,21 @@ class ReferenceObjectDB(ObjectDB):
         hash_info: "HashInfo",
         move: bool = False,
     ):
-        self.makedirs(to_info.parent)
-        if hash_info.isdir:
+        if hash_info.isdir or hash_info.ischunked:
             return super()._add_file(
                 from_fs, from_info, to_info, hash_info, move
             )
+        assert hash_info.value
         ref_file = ReferenceHashFile(from_info, from_fs, hash_info)
-        self._obj_cache[hash_info] = ref_file
-        ref_fobj = io.BytesIO(ref_file.to_bytes())
-        ref_fobj.seek(0)
-        try:
-            self.fs.upload(ref_fobj, to_info)
-        except OSError as exc:
-            if isinstance(exc, FileExistsError) or (
-                os.name == "nt"
-                and exc.__context__
-                and isinstance(exc.__context__, FileExistsError)
-            ):
-                logger.debug("'%s' file already exists, skipping", to_info)
-            else:
-                raise
-        if from_fs.scheme != Schemes.LOCAL:
-            self._fs_cache[ReferenceHashFile.config_tuple(from_fs)] = from_fs
+        ref = _Reference(from_info, from_fs, hash_info, ref_file.checksum)
+        self._refs[hash_info.value] = ref
+        self._checked[hash_info.value] = ref
+
+    def remove_references(self, hash_infos: Iterable["HashInfo"]):
+        """Forget file objects, e.g. once they have been transferred and the
+        references point to files that are gone (or have changed)."""
+        for hash_info in hash_infos:
+            if hash_info.isdir or hash_info.ischunked or not hash_info.value:
+                continue
+            self._refs.pop(hash_info.value, None)
+            self._checked.pop(hash_info.value, None)
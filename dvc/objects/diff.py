@@ -1,7 +1,18 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 if TYPE_CHECKING:
+    from dvc.hash_info import HashInfo
+
     from .file import HashFile
 
 ADD = "add"
@@ -57,79 +68,196 @@ class Change:
         return self.typ != UNCHANGED
 
 
-@dataclass
+Row = Tuple[Tuple[str], Optional["HashFile"], Optional["HashFile"]]
+
+
+class Changes:
+    """Changes of one type, stored as (key, old object, new object) rows.
+
+    Diffing large directories results in lots of (mostly unchanged)
+    entries, so `Change` instances are only created while iterating.
+    """
+
+    def __init__(self, in_cache: Set["HashInfo"]):
+        self.rows: List[Row] = []
+        self._in_cache = in_cache
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __bool__(self):
+        return bool(self.rows)
+
+    def __iter__(self) -> Iterator[Change]:
+        for key, old, new in self.rows:
+            yield Change(
+                old=TreeEntry(self._obj_in_cache(old), key, old),
+                new=TreeEntry(self._obj_in_cache(new), key, new),
+            )
+
+    def _obj_in_cache(self, obj):
+        return bool(obj) and obj.hash_info in self._in_cache
+
+    def extend(self, other: "Changes"):
+        assert other._in_cache is self._in_cache
+        self.rows.extend(other.rows)
+
+
 class DiffResult:
-    added: List[Change] = field(default_factory=list, compare=True)
-    modified: List[Change] = field(default_factory=list, compare=True)
-    deleted: List[Change] = field(default_factory=list, compare=True)
-    unchanged: List[Change] = field(default_factory=list, compare=True)
+    def __init__(self):
+        # objects (of the diffed entries) that are known to be in cache
+        self.in_cache: Set["HashInfo"] = set()
+        self.added = Changes(self.in_cache)
+        self.modified = Changes(self.in_cache)
+        self.deleted = Changes(self.in_cache)
+        self.unchanged = Changes(self.in_cache)
 
     def __bool__(self):
         return bool(self.added or self.modified or self.deleted)
 
 
 ROOT = ("",)
+# minimal number of objects for each of the workers checking cache
+CHECK_BATCH_SIZE = 1000
 
 
-def diff(
-    old: Optional["HashFile"], new: Optional["HashFile"], cache
-) -> DiffResult:
+def _entries(obj):
+    from operator import itemgetter
+
     from .tree import Tree
 
-    if old is None and new is None:
-        return DiffResult()
+    if not obj:
+        return []
 
-    def _get_keys(obj):
-        if not obj:
-            return []
-        return [ROOT] + (
-            [key for key, _ in obj] if isinstance(obj, Tree) else []
+    entries = [(ROOT, obj)]
+    if isinstance(obj, Tree):
+        # entries without hashes are as good as missing
+        entries.extend(
+            sorted((entry for entry in obj if entry[1]), key=itemgetter(0))
         )
+    return entries
+
+
+def _merge_walk(old_entries, new_entries) -> Iterator[Row]:
+    i = j = 0
+    while i < len(old_entries) and j < len(new_entries):
+        old_key, old_obj = old_entries[i]
+        new_key, new_obj = new_entries[j]
+        if old_key == new_key:
+            yield old_key, old_obj, new_obj
+            i += 1
+            j += 1
+        elif old_key < new_key:
+            yield old_key, old_obj, None
+            i += 1
+        else:
+            yield new_key, None, new_obj
+            j += 1
 
-    old_keys = set(_get_keys(old))
-    new_keys = set(_get_keys(new))
+    for key, obj in old_entries[i:]:
+        yield key, obj, None
+    for key, obj in new_entries[j:]:
+        yield key, None, obj
 
-    def _get_obj(obj, key):
-        if not obj or key == ROOT:
-            return obj
 
-        return obj.get(key)
+def _find_in_cache(objs: Iterable["HashFile"], cache) -> Set["HashInfo"]:
+    """Return hash infos of the objects that are in cache.
 
-    def _in_cache(obj, cache):
-        from . import check
-        from .errors import ObjectFormatError
+    Each object is only checked once, no matter how many entries (or
+    trees) it is used by.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import chain
 
-        if not obj:
-            return False
+    from . import check
+    from .errors import ObjectFormatError
+    from .tree import Tree
+
+    trees: Dict["HashInfo", "Tree"] = {}
+    unique: Dict["HashInfo", "HashFile"] = {}
+    for obj in objs:
+        if isinstance(obj, Tree):
+            trees[obj.hash_info] = obj
+            for _, entry in obj:
+                unique.setdefault(entry.hash_info, entry)
+        else:
+            unique.setdefault(obj.hash_info, obj)
 
+    def _in_cache(obj):
         try:
-            check(cache, obj)
+            if isinstance(obj, Tree):
+                cache.check(obj.hash_info)
+            else:
+                check(cache, obj)
             return True
         except (FileNotFoundError, ObjectFormatError):
             return False
 
+    def _check_many(objs):
+        return [obj.hash_info for obj in objs if _in_cache(obj)]
+
+    objs = list(unique.values())
+    jobs = max(1, min(cache.fs.jobs, len(objs) // CHECK_BATCH_SIZE))
+    size = max(1, -(-len(objs) // jobs))
+    parts = [objs[i : i + size] for i in range(0, len(objs), size)]
+    if len(parts) <= 1:
+        found = set(chain.from_iterable(map(_check_many, parts)))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            found = set(chain.from_iterable(executor.map(_check_many, parts)))
+
+    for hash_info, tree in trees.items():
+        if all(entry.hash_info in found for _, entry in tree) and _in_cache(
+            tree
+        ):
+            found.add(hash_info)
+    return found
+
+
+def diff(
+    old: Optional["HashFile"], new: Optional["HashFile"], cache
+) -> DiffResult:
+    from .tree import Tree
+
     ret = DiffResult()
-    for key in old_keys | new_keys:
-        old_obj = _get_obj(old, key)
-        new_obj = _get_obj(new, key)
+    if old is None and new is None:
+        return ret
+
+    # Cache is checked (which also removes corrupted objects from it) for
+    # the files that are going to be checked out, for the ones that are
+    # going to be removed (see `objects.checkout`), and for the unchanged
+    # ones, which are considered to be modified if they are missing from
+    # cache. Trees are checked only if they could be removed, as all of
+    # their entries are diffed anyway.
+    to_check: List["HashFile"] = []
+    unchanged: List[Row] = []
+    for row in _merge_walk(_entries(old), _entries(new)):
+        _, old_obj, new_obj = row
+        if new_obj is None:
+            assert old_obj
+            ret.deleted.rows.append(row)
+            to_check.append(old_obj)
+        elif old_obj is None:
+            ret.added.rows.append(row)
+            if not isinstance(new_obj, Tree):
+                to_check.append(new_obj)
+        elif old_obj.hash_info != new_obj.hash_info:
+            ret.modified.rows.append(row)
+            if not isinstance(new_obj, Tree):
+                to_check.extend([old_obj, new_obj])
+        elif isinstance(new_obj, Tree):
+            ret.unchanged.rows.append(row)
+        else:
+            unchanged.append(row)
+            to_check.append(new_obj)
 
-        change = Change(
-            old=TreeEntry(_in_cache(old_obj, cache), key, old_obj),
-            new=TreeEntry(_in_cache(new_obj, cache), key, new_obj),
-        )
+    ret.in_cache.update(_find_in_cache(to_check, cache))
 
-        if change.typ == ADD:
-            ret.added.append(change)
-        elif change.typ == MODIFY:
-            ret.modified.append(change)
-        elif change.typ == DELETE:
-            ret.deleted.append(change)
+    for row in unchanged:
+        _, _, new_obj = row
+        assert new_obj
+        if new_obj.hash_info in ret.in_cache:
+            ret.unchanged.rows.append(row)
         else:
-            assert change.typ == UNCHANGED
-            if not change.new.in_cache and not isinstance(
-                change.new.obj, Tree
-            ):
-                ret.modified.append(change)
-            else:
-                ret.unchanged.append(change)
+            ret.modified.rows.append(row)
     return ret
@@ -0,0 +1,76 @@
+import errno
+import hashlib
+import io
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from .errors import ObjectFormatError
+from .file import HashFile
+
+if TYPE_CHECKING:
+    from dvc.fs.base import BaseFileSystem
+    from dvc.hash_info import HashInfo
+    from dvc.types import AnyPath
+
+    from .db.base import ObjectDB
+
+logger = logging.getLogger(__name__)
+
+
+class PackedHashFile(HashFile):
+    """File object stored at `offset` inside of a pack file (see
+    `dvc.objects.db.pack`).
+
+    Packed objects are small, so they are read into memory as a whole.
+    """
+
+    def __init__(
+        self,
+        path_info: "AnyPath",
+        fs: "BaseFileSystem",
+        hash_info: "HashInfo",
+        offset: int,
+        length: int,
+        **kwargs,
+    ):
+        super().__init__(path_info, fs, hash_info, **kwargs)
+        self.offset = offset
+        self.length = length
+
+    def __str__(self):
+        return (
+            f"packed object {self.hash_info} -> "
+            f"{self.path_info}[{self.offset}:{self.offset + self.length}]"
+        )
+
+    def read_bytes(self) -> bytes:
+        assert self.fs
+        with self.fs.open(self.path_info, mode="rb") as fobj:
+            fobj.seek(self.offset)
+            data = fobj.read(self.length)
+        if len(data) != self.length:
+            raise ObjectFormatError(f"{self} is truncated")
+        return data
+
+    def open(self):
+        return io.BytesIO(self.read_bytes())
+
+    def check(self, odb: "ObjectDB", check_hash: bool = True):
+        assert self.fs
+        if not self.fs.exists(self.path_info):
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), self.path_info
+            )
+        if not check_hash:
+            return
+
+        actual = hashlib.md5(self.read_bytes()).hexdigest()
+        logger.trace(  # type: ignore[attr-defined]
+            "packed cache '%s' expected '%s' actual '%s'",
+            self,
+            self.hash_info,
+            actual,
+        )
+        if actual != self.hash_info.value:
+            raise ObjectFormatError(f"{self} is corrupted")
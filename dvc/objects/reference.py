@@ -1,7 +1,6 @@
 import errno
 import logging
 import os
-import pickle
 from typing import TYPE_CHECKING, Optional
 
 from .errors import ObjectFormatError
@@ -18,11 +17,6 @@ logger = logging.getLogger(__name__)
 
 
 class ReferenceHashFile(HashFile):
-    PARAM_PATH = "path"
-    PARAM_HASH = "hash"
-    PARAM_CHECKSUM = "checksum"
-    PARAM_FS_CONFIG = "fs_config"
-
     def __init__(
         self,
         path_info: "AnyPath",
@@ -51,72 +45,3 @@ class ReferenceHashFile(HashFile):
     def _get_checksum(self) -> str:
         assert self.fs
         return self.fs.checksum(self.path_info)
-
-    def to_bytes(self):
-        from dvc.fs.repo import RepoFileSystem
-        from dvc.path_info import PathInfo
-
-        # NOTE: dumping reference FS's this way is insecure, as the
-        # fully parsed remote FS config will include credentials
-        #
-        # ReferenceHashFiles should currently only be serialized in
-        # memory and not to disk
-        path_info = self.path_info
-        if isinstance(self.fs, RepoFileSystem):
-            path_info = PathInfo(path_info).relative_to(self.fs.root_dir)
-
-        dict_ = {
-            self.PARAM_PATH: path_info,
-            self.PARAM_HASH: self.hash_info,
-            self.PARAM_CHECKSUM: self.checksum,
-            self.PARAM_FS_CONFIG: self.config_tuple(self.fs),
-        }
-        try:
-            return pickle.dumps(dict_)
-        except pickle.PickleError as exc:
-            raise ObjectFormatError(f"Could not pickle {self}") from exc
-
-    @classmethod
-    def from_bytes(cls, data: bytes, fs_cache: Optional[dict] = None):
-        from dvc.fs import get_fs_cls
-        from dvc.fs.repo import RepoFileSystem
-
-        try:
-            dict_ = pickle.loads(data)
-        except pickle.PickleError as exc:
-            raise ObjectFormatError("ReferenceHashFile is corrupted") from exc
-
-        try:
-            path_info = dict_[cls.PARAM_PATH]
-            hash_info = dict_[cls.PARAM_HASH]
-        except KeyError as exc:
-            raise ObjectFormatError("ReferenceHashFile is corrupted") from exc
-
-        scheme, config_pairs = dict_.get(cls.PARAM_FS_CONFIG)
-        fs = fs_cache.get((scheme, config_pairs)) if fs_cache else None
-        if not fs:
-            config = dict(config_pairs)
-            if RepoFileSystem.PARAM_REPO_URL in config:
-                fs = RepoFileSystem(**config)
-                path_info = fs.root_dir / path_info
-            else:
-                fs_cls = get_fs_cls(config, scheme=path_info.scheme)
-                fs = fs_cls(**config)
-        return ReferenceHashFile(
-            path_info,
-            fs,
-            hash_info,
-            checksum=dict_.get(cls.PARAM_CHECKSUM),
-        )
-
-    @staticmethod
-    def config_tuple(fs: "BaseFileSystem"):
-        return (
-            fs.scheme,
-            tuple(
-                (key, value)
-                for key, value in sorted(
-                    fs.config.items(), key=lambda item: item[0]
-                )
-            ),
-        )
@@ -2,8 +2,7 @@ import hashlib
 import logging
 import os
 import pathlib
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from itertools import islice
 from typing import TYPE_CHECKING, Dict, Tuple
 
 from dvc.exceptions import DvcIgnoreInCollectedDirError
@@ -11,6 +10,7 @@ from dvc.hash_info import HashInfo
 from dvc.ignore import DvcIgnore
 from dvc.progress import Tqdm
 from dvc.utils import file_md5
+from dvc.utils.threadpool import ThreadPoolExecutor
 
 from .db.reference import ReferenceObjectDB
 from .file import HashFile
@@ -41,8 +41,9 @@ def _upload_file(path_info, fs, odb, upload_odb):
     return path_info, odb.get(stream.hash_info)
 
 
-def _get_file_hash(path_info, fs, name):
-    info = fs.info(path_info)
+def _get_file_hash(path_info, fs, name, info=None):
+    if info is None:
+        info = fs.info(path_info)
     if name in info:
         assert not info[name].endswith(".dir")
         return HashInfo(name, info[name], size=info["size"])
@@ -52,47 +53,95 @@ def _get_file_hash(path_info, fs, name):
         return func(path_info)
 
     if name == "md5":
-        return HashInfo(
-            name, file_md5(path_info, fs), size=fs.getsize(path_info)
-        )
+        size = info["size"]
+        return HashInfo(name, file_md5(path_info, fs, size=size), size=size)
 
     raise NotImplementedError
 
 
-def get_file_hash(path_info, fs, name, state=None):
+def get_file_hashes(path_infos, fs, name, state=None, infos=None):
+    """Return (path_info, hash_info) pairs for the specified files.
+
+    State is queried and updated once for the whole batch rather than once
+    per file. `infos` can map path infos to the file info obtained while
+    walking (see `LocalFileSystem.walk_files`) to avoid stat'ing them again.
+    """
+    infos = infos or {}
     if state:
-        hash_info = state.get(  # pylint: disable=assignment-from-none
-            path_info, fs
+        cached = state.get_many(path_infos, fs, infos=infos)
+    else:
+        cached = ((path_info, None) for path_info in path_infos)
+
+    hashes = []
+    computed = []
+    for path_info, hash_info in cached:
+        if not hash_info or hash_info.ischunked:
+            hash_info = _get_file_hash(
+                path_info, fs, name, info=infos.get(path_info)
+            )
+            computed.append((path_info, hash_info))
+        hashes.append((path_info, hash_info))
+
+    if state and computed:
+        assert not any(
+            hash_info.isdir or hash_info.ischunked for _, hash_info in computed
         )
-        if hash_info:
-            return hash_info
+        state.save_many(computed, fs, infos=infos)
 
-    hash_info = _get_file_hash(path_info, fs, name)
+    return hashes
 
-    if state:
-        assert ".dir" not in hash_info.value
-        state.save(path_info, fs, hash_info)
 
+def get_file_hash(path_info, fs, name, state=None):
+    ((_, hash_info),) = get_file_hashes([path_info], fs, name, state=state)
     return hash_info
 
 
-def _get_file_obj(
-    path_info, fs, name, odb=None, upload_odb=None, dry_run=False
+def _get_file_objs(
+    path_infos, fs, name, odb=None, upload_odb=None, dry_run=False, infos=None
 ):
     state = odb.state if odb else None
-    hash_info = get_file_hash(path_info, fs, name, state=state)
-    if upload_odb and not dry_run:
-        assert odb and name == "md5"
-        return _upload_file(path_info, fs, odb, upload_odb)
+    hashes = get_file_hashes(path_infos, fs, name, state=state, infos=infos)
 
-    if dry_run:
-        obj = HashFile(path_info, fs, hash_info)
-    else:
-        odb.add(path_info, fs, hash_info, move=False)
-        obj = odb.get(hash_info)
+    objs = []
+    for path_info, hash_info in hashes:
+        if upload_odb and not dry_run:
+            assert odb and name == "md5"
+            objs.append(_upload_file(path_info, fs, odb, upload_odb))
+            continue
+
+        if dry_run:
+            obj = HashFile(path_info, fs, hash_info)
+        else:
+            odb.add(path_info, fs, hash_info, move=False)
+            obj = odb.get(hash_info)
+        objs.append((path_info, obj))
+    return objs
+
+
+def _get_file_obj(path_info, fs, name, **kwargs):
+    ((_, obj),) = _get_file_objs([path_info], fs, name, **kwargs)
     return path_info, obj
 
 
+# NOTE: files are hashed in chunks so that state lookups and updates can be
+# done in a single transaction per chunk rather than per file. Chunks start
+# out small, so that a directory with few large files is still hashed by all
+# of the workers, and grow as the walk goes on.
+_MAX_CHUNK_SIZE = 1000
+
+
+def _chunks(iterable, jobs):
+    it = iter(iterable)
+    size = 1
+    while True:
+        for _ in range(jobs):
+            chunk = list(islice(it, size))
+            if not chunk:
+                return
+            yield chunk
+        size = min(_MAX_CHUNK_SIZE, size * 2)
+
+
 def _build_objects(
     path_info,
     fs,
@@ -102,27 +151,36 @@ def _build_objects(
     no_progress_bar=False,
     **kwargs,
 ):
+    from dvc.fs.local import LocalFileSystem
+
+    # NOTE: local files are stat'ed only once, while walking, and their
+    # info is passed down to the state and the hashing functions.
+    walk_kwargs = {"detail": True} if isinstance(fs, LocalFileSystem) else {}
     if dvcignore:
-        walk_iterator = dvcignore.walk_files(fs, path_info)
+        walk_iterator = dvcignore.walk_files(fs, path_info, **walk_kwargs)
     else:
-        walk_iterator = fs.walk_files(path_info)
+        walk_iterator = fs.walk_files(path_info, **walk_kwargs)
+    if not walk_kwargs:
+        walk_iterator = ((path_info, None) for path_info in walk_iterator)
+
+    def worker(chunk):
+        path_infos = [path_info for path_info, _ in chunk]
+        infos = dict(chunk) if walk_kwargs else None
+        return _get_file_objs(path_infos, fs, name, infos=infos, **kwargs)
+
+    jobs = jobs if jobs is not None else fs.hash_jobs
     with Tqdm(
         unit="md5",
         desc="Computing file/dir hashes (only done once)",
         disable=no_progress_bar,
     ) as pbar:
-        worker = pbar.wrap_fn(
-            partial(
-                _get_file_obj,
-                fs=fs,
-                name=name,
-                **kwargs,
-            )
-        )
-        with ThreadPoolExecutor(
-            max_workers=jobs if jobs is not None else fs.hash_jobs
-        ) as executor:
-            yield from executor.map(worker, walk_iterator)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # NOTE: the walk is consumed lazily, as the workers get to it
+            for objs in executor.imap_unordered(
+                worker, _chunks(walk_iterator, jobs)
+            ):
+                pbar.update(len(objs))
+                yield from objs
 
 
 def _iter_objects(path_info, fs, name, **kwargs):
@@ -160,9 +218,9 @@ def _get_tree_obj(path_info, fs, fs_info, name, odb=None, **kwargs):
             # NOTE: loaded entries are naive objects with hash_infos but no
             # path_info. For staging trees, obj.path_info should be relative
             # to the staging src `path_info` and src fs
-            for key, entry in tree:
-                entry.fs = fs
-                entry.path_info = path_info.joinpath(*key)
+            tree.set_entries_location(fs, path_info)
+            if not kwargs.get("dry_run"):
+                _stage_references(odb, hash_info, path_info, fs)
             return tree
         except FileNotFoundError:
             pass
@@ -186,6 +244,62 @@ def _get_tree_obj(path_info, fs, fs_info, name, odb=None, **kwargs):
     return tree
 
 
+def _use_chunking(odb, name, details):
+    from .chunked import CHUNK_MAX_SIZE
+
+    # NOTE: smaller files would end up being a single chunk anyway
+    return bool(
+        odb
+        and odb.chunking
+        and name == "md5"
+        and details["type"] != "directory"
+        and details.get("size", 0) > CHUNK_MAX_SIZE
+    )
+
+
+def _get_chunked_obj(path_info, fs, details, name, odb=None, dry_run=False):
+    from .chunked import ChunkedFile, iter_chunks
+
+    chunked = ChunkedFile(None, None, None)
+    checksum = fs.checksum(path_info)
+    offset = 0
+    with Tqdm(
+        desc=f"Chunking '{path_info.name}'",
+        total=details["size"],
+        bytes=True,
+    ) as pbar:
+        with fs.open(path_info, mode="rb") as fobj:
+            for data in iter_chunks(fobj):
+                hash_info = HashInfo(
+                    name, hashlib.md5(data).hexdigest(), size=len(data)
+                )
+                # NOTE: chunks are staged as references to slices of the
+                # file, so that staging large files doesn't require keeping
+                # them in memory, and they are only read again when (and if)
+                # they are transferred.
+                if not dry_run:
+                    odb.add_slice(
+                        path_info,
+                        fs,
+                        hash_info,
+                        offset,
+                        len(data),
+                        checksum=checksum,
+                    )
+                chunked.add(HashFile(None, None, hash_info))
+                offset += len(data)
+                pbar.update(len(data))
+
+    chunked.digest()
+    odb.add(chunked.path_info, chunked.fs, chunked.hash_info, move=True)
+    raw = odb.get(chunked.hash_info)
+    if odb.fs != chunked.fs:
+        chunked.fs.remove(chunked.path_info)
+    chunked.fs = raw.fs
+    chunked.path_info = raw.path_info
+    return chunked
+
+
 _url_cache: Dict[str, str] = {}
 
 
@@ -208,7 +322,8 @@ def _make_staging_url(path_info: "AnyPath"):
 def _get_staging(odb: "ObjectDB") -> "ObjectDB":
     """Return an ODB that can be used for staging objects.
 
-    Staging will be a reference ODB stored in the the global memfs.
+    Staging will be a reference ODB stored in the the global memfs, which
+    keeps file references in `odb`, so that they are gone along with it.
     """
 
     from dvc.fs.memory import MemoryFileSystem
@@ -216,28 +331,64 @@ def _get_staging(odb: "ObjectDB") -> "ObjectDB":
     fs = MemoryFileSystem()
     path_info = _make_staging_url(odb.path_info)
     state = odb.state
-    return ReferenceObjectDB(fs, path_info, state=state)
+    return ReferenceObjectDB(fs, path_info, state=state, refs=odb.staged_refs)
 
 
-def _load_from_state(odb, staging, path_info, fs, name):
+def _stage_references(staging, hash_info, path_info, fs):
+    # NOTE: staging might already reference other files with the same
+    # contents (e.g. outputs of another stage, or its dependencies), which
+    # must not be the ones checked and moved to cache for this path.
+    if hash_info.ischunked:
+        return
+    if hash_info.isdir:
+        staging.add_tree_references(path_info, fs, hash_info)
+    else:
+        staging.add(path_info, fs, hash_info)
+
+
+def _check_chunks(odb, staging, obj):
+    # NOTE: the manifest might have been staged on a dry run, or its chunks
+    # might have been gc'ed since, in which case the file needs to be
+    # chunked (and its chunks staged) again.
+    for _, entry in obj:
+        if not (
+            odb.exists(entry.hash_info) or staging.exists(entry.hash_info)
+        ):
+            logger.debug("chunk '%s' of '%s' is missing", entry, obj)
+            raise FileNotFoundError
+
+
+def _load_from_state(
+    odb, staging, path_info, fs, name, dry_run=False, chunked=False
+):
     from . import check, load
+    from .chunked import ChunkedFile
     from .errors import ObjectFormatError
     from .tree import Tree
 
     state = odb.state
-    hash_info = state.get(path_info, fs)
+    hash_info = state.get(path_info, fs, chunked=chunked)
     if hash_info:
         for odb_ in (odb, staging):
             if odb_.exists(hash_info):
                 try:
+                    if odb_ is staging and not dry_run:
+                        _stage_references(staging, hash_info, path_info, fs)
                     obj = load(odb_, hash_info)
-                    check(odb_, obj, check_hash=False)
+                    if isinstance(obj, ChunkedFile):
+                        odb_.check(obj.hash_info, check_hash=False)
+                        if not dry_run:
+                            _check_chunks(odb, staging, obj)
+                    elif odb_ is staging and isinstance(obj, Tree):
+                        # NOTE: entries are the files inside `path_info`,
+                        # which are only referenced once they are needed
+                        odb_.check(obj.hash_info, check_hash=False)
+                    else:
+                        check(odb_, obj, check_hash=False)
                     if isinstance(obj, Tree):
                         obj.hash_info.nfiles = len(obj)
-                        for key, entry in obj:
-                            entry.fs = fs
-                            entry.path_info = path_info.joinpath(*key)
-                    else:
+                        obj.set_entries_location(fs, path_info)
+                    elif not isinstance(obj, ChunkedFile):
                         obj.fs = fs
                         obj.path_info = path_info
                     assert obj.hash_info.name == name
@@ -274,6 +425,7 @@ def stage(
     name: str,
     upload: bool = False,
     dry_run: bool = False,
+    chunking: bool = True,
     **kwargs,
 ) -> Tuple["ObjectDB", "HashFile"]:
     """Stage (prepare) objects from the given path for addition to an ODB.
@@ -288,14 +440,26 @@ def stage(
     If upload is True, files will be uploaded to a temporary path on the dest
     ODB filesystem, and staged objects will reference the uploaded path rather
     than the original source path.
+
+    If chunking is False, large files are not chunked even if the dest ODB
+    has chunking enabled (e.g. when only the md5 of a dependency is needed).
     """
     assert path_info and path_info.scheme == fs.scheme
 
     details = fs.info(path_info)
     staging = _get_staging(odb)
+    chunked = chunking and not upload and _use_chunking(odb, name, details)
     if odb:
         try:
-            return _load_from_state(odb, staging, path_info, fs, name)
+            return _load_from_state(
+                odb,
+                staging,
+                path_info,
+                fs,
+                name,
+                dry_run=dry_run,
+                chunked=chunked,
+            )
         except FileNotFoundError:
             pass
 
@@ -313,6 +477,11 @@ def stage(
         logger.debug("staged tree '%s'", obj)
         if name != "md5":
             obj = _stage_external_tree_info(odb, obj, name)
+    elif chunked:
+        obj = _get_chunked_obj(
+            path_info, fs, details, name, odb=staging, dry_run=dry_run
+        )
+        logger.debug("staged chunked file '%s'", obj)
     else:
         _, obj = _get_file_obj(
             path_info,
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Dict, Iterable, NamedTuple, Optional, Set
 from dvc.hash_info import HashInfo
 from dvc.scheme import Schemes
 
+from .chunked import ChunkedFile
 from .tree import Tree
 
 if TYPE_CHECKING:
@@ -107,6 +108,10 @@ def status(
                     hash_infos[entry.hash_info.value] = entry.hash_info
             if index:
                 dir_objs[hash_info.value] = tree
+        elif hash_info.ischunked and not shallow:
+            chunked = ChunkedFile.load(cache_odb, hash_info)
+            for _, entry in chunked:
+                hash_infos[entry.hash_info.value] = entry.hash_info
         hash_infos[hash_info.value] = hash_info
 
     if odb.fs.scheme == Schemes.MEMORY:
@@ -1,18 +1,25 @@
+import asyncio
 import errno
 import logging
 from functools import partial, wraps
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Set
 
-from funcy import split
+from funcy import lsplit, split
 
 from dvc.progress import Tqdm
+from dvc.scheme import Schemes
 from dvc.utils.threadpool import ThreadPoolExecutor
 
+from .packed import PackedHashFile
+
 if TYPE_CHECKING:
     from dvc.hash_info import HashInfo
+    from dvc.types import DvcPath
 
+    from .chunked import ChunkedFile
     from .db.base import ObjectDB
     from .db.index import ObjectDBIndexBase
+    from .file import HashFile
     from .tree import Tree
 
 logger = logging.getLogger(__name__)
@@ -52,6 +59,21 @@ def find_tree_by_obj_id(
     return None
 
 
+def find_chunked_by_obj_id(
+    odbs: Iterable[Optional["ObjectDB"]], obj_id: "HashInfo"
+) -> Optional["ChunkedFile"]:
+    from .chunked import ChunkedFile
+    from .errors import ObjectFormatError
+
+    for odb in odbs:
+        if odb is not None:
+            try:
+                return ChunkedFile.load(odb, obj_id)
+            except (FileNotFoundError, ObjectFormatError):
+                pass
+    return None
+
+
 def _do_transfer(
     src: "ObjectDB",
     dest: "ObjectDB",
@@ -66,10 +88,34 @@ def _do_transfer(
     from dvc.exceptions import FileTransferError
 
     dir_ids, file_ids = split(lambda hash_info: hash_info.isdir, obj_ids)
+    chunked_ids, file_ids = split(
+        lambda hash_info: hash_info.ischunked, file_ids
+    )
     total_fails = 0
     succeeded_dir_objs = []
     all_file_ids = set(file_ids)
 
+    for chunked_hash in chunked_ids:
+        chunked_obj = find_chunked_by_obj_id([cache_odb, src], chunked_hash)
+        assert chunked_obj
+
+        # NOTE: chunks need to be transferred before the manifest, so that
+        # the manifest is never available without its chunks.
+        chunk_ids = {entry.hash_info for _, entry in chunked_obj}
+        bound_chunk_ids = all_file_ids & chunk_ids
+        all_file_ids -= chunk_ids
+
+        chunk_fails = sum(processor(bound_chunk_ids))
+        if chunk_fails:
+            logger.error(
+                "failed to transfer chunks of '%s', "
+                "aborting manifest transfer",
+                chunked_obj.hash_info,
+            )
+            total_fails += chunk_fails + 1
+        elif not chunk_ids.intersection(missing_ids):
+            total_fails += sum(processor([chunked_obj.hash_info]))
+
     for dir_hash in dir_ids:
         dir_obj = find_tree_by_obj_id([cache_odb, src], dir_hash)
         assert dir_obj
@@ -112,6 +158,8 @@ def _do_transfer(
     if total_fails:
         if src_index:
             src_index.clear()
+        if src.listing_cache:
+            src.listing_cache.clear()
         raise FileTransferError(total_fails)
 
     # index successfully pushed dirs
@@ -127,6 +175,218 @@ def _do_transfer(
             dest_index.update([dir_obj.hash_info.value], file_hashes)
 
 
+def _object_size(obj: "HashFile") -> Optional[int]:
+    if obj.hash_info.size is not None:
+        return obj.hash_info.size
+    if isinstance(obj, PackedHashFile):
+        return obj.length
+    if obj.fs and obj.fs.scheme == Schemes.LOCAL:
+        try:
+            return obj.fs.getsize(obj.path_info)
+        except OSError:
+            return None
+    return None
+
+
+def _transfer_packs(
+    src: "ObjectDB",
+    dest: "ObjectDB",
+    obj_ids: Set["HashInfo"],
+    verify: bool = False,
+    move: bool = False,
+) -> Set["HashInfo"]:
+    """Transfer small objects in packs rather than one by one.
+
+    Returns the IDs of the objects that were transferred.
+    """
+    from .db.pack import copy_pack, is_packable
+
+    done: Set["HashInfo"] = set()
+    # NOTE: objects could be packed in src even if it doesn't pack objects
+    # itself (e.g. by another client), so that `src.get()` has to know its
+    # packs before anything is transferred.
+    src_packs = src.packs
+    # objects are unpacked one by one into ODBs without packing enabled
+    if not dest.pack_threshold:
+        return done
+
+    # Copy whole source packs when most of their objects are needed, it is
+    # just two requests either way.
+    for index in list(src_packs.values()):
+        wanted = {
+            hash_info for hash_info in obj_ids if hash_info.value in index
+        }
+        if wanted and 2 * len(wanted) >= len(index):
+            logger.debug(
+                "Copying pack '%s' (%d/%d objects needed)",
+                index.name,
+                len(wanted),
+                len(index),
+            )
+            copy_pack(src, dest, index)
+            done.update(wanted)
+    if done:
+        # pylint: disable=protected-access
+        dest._packs = None
+
+    objs = []
+    for hash_info in obj_ids - done:
+        if hash_info.isdir or hash_info.ischunked:
+            continue
+        obj = src.get(hash_info)
+        if is_packable(hash_info, _object_size(obj)):
+            objs.append(obj)
+    if len(objs) < dest.pack_threshold:
+        return done
+
+    index = dest.add_pack(objs, verify=verify)
+    if not index:
+        return done
+    # objects that failed verification are left to be transferred (and
+    # reported) one by one
+    objs = [obj for obj in objs if obj.hash_info.value in index]
+    done.update(obj.hash_info for obj in objs)
+    if move:
+        # uploaded temporary files (see `stage(upload=True)`) are not needed
+        # anymore, but sources outside of the dest ODB are left alone.
+        for obj in objs:
+            if (
+                not isinstance(obj, PackedHashFile)
+                and obj.fs
+                and obj.fs.scheme == dest.fs.scheme
+                and obj.path_info.isin(dest.path_info)
+            ):
+                obj.fs.remove(obj.path_info)
+    return done
+
+
+# Number of objects transferred concurrently through the async filesystem
+# (unless `jobs` is specified). Unlike threads, these are just coroutines,
+# so we are only bounded by the number of open connections/files.
+ASYNC_JOBS = 128
+
+
+def _async_funcs(src: "ObjectDB", dest: "ObjectDB", verify: bool = False):
+    """Return the remote fs along with the coroutine which transfers a single
+    object through it and the (sync) function which completes the transfer
+    afterwards, if the objects can be transferred asynchronously."""
+    from dvc.fs.fsspec_wrapper import ObjectFSWrapper
+    from dvc.utils import tmp_fname
+
+    if (
+        src.fs.scheme == Schemes.LOCAL
+        # object storages don't need parent directories to be created
+        and isinstance(dest.fs, ObjectFSWrapper)
+        and dest.fs.async_fs
+        and not verify
+    ):
+
+        async def put(obj: "HashFile") -> None:
+            to_info = dest.hash_to_path_info(obj.hash_info.value)
+            await dest.fs.put_file_async(obj.path_info, to_info)
+
+        return dest.fs, put, None
+
+    if dest.fs.scheme == Schemes.LOCAL and src.fs.async_fs:
+
+        async def get(obj: "HashFile") -> "DvcPath":
+            tmp_info = dest.path_info / tmp_fname()
+            await src.fs.get_file_async(obj.path_info, tmp_info)
+            return tmp_info
+
+        def add(obj: "HashFile", tmp_info: "DvcPath") -> None:
+            dest.add(
+                tmp_info, dest.fs, obj.hash_info, move=True, verify=verify
+            )
+
+        dest.makedirs(dest.path_info)
+        return src.fs, get, add
+
+    return None
+
+
+def _handle_async_exc(obj: "HashFile", exc: BaseException) -> int:
+    # NOTE: see `_log_exceptions`
+    # pylint: disable=no-member
+    if isinstance(exc, OSError) and exc.errno == errno.EMFILE:
+        raise exc
+    logger.error("failed to transfer '%s'", obj.hash_info, exc_info=exc)
+    return 1
+
+
+async def _run_async(
+    func: Callable, objs: List["HashFile"], jobs: int, callback: Callable
+) -> List[Any]:
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def _wrapped(obj):
+        async with semaphore:
+            try:
+                return await func(obj)
+            except Exception as exc:  # pylint: disable=broad-except
+                return exc
+            finally:
+                callback()
+
+    return await asyncio.gather(*(_wrapped(obj) for obj in objs))
+
+
+def _get_async_processor(
+    src: "ObjectDB",
+    dest: "ObjectDB",
+    processor: Callable,
+    pbar: "Tqdm",
+    jobs: Optional[int] = None,
+    verify: bool = False,
+    move: bool = False,
+) -> Optional[Callable]:
+    """Return processor which transfers objects between local and async
+    (fsspec) filesystems by running their coroutines on the fsspec loop,
+    rather than by running one thread per object.
+
+    Objects which can't be transferred that way (i.e. packed objects) are
+    still passed on to the given `processor`.
+    """
+    from fsspec.asyn import sync
+
+    funcs = None if move else _async_funcs(src, dest, verify=verify)
+    if not funcs:
+        return None
+    remote_fs, func, finalize = funcs
+
+    def async_processor(obj_ids: Iterable["HashInfo"]) -> List[int]:
+        objs = [src.get(hash_info) for hash_info in obj_ids]
+        packed, objs = lsplit(
+            lambda obj: isinstance(obj, PackedHashFile), objs
+        )
+        fails = list(processor(obj.hash_info for obj in packed))
+        if not objs:
+            return fails
+
+        results = sync(
+            remote_fs.async_fs.loop,
+            _run_async,
+            func,
+            objs,
+            jobs or ASYNC_JOBS,
+            pbar.update,
+        )
+        for obj, result in zip(objs, results):
+            if isinstance(result, BaseException):
+                fails.append(_handle_async_exc(obj, result))
+                continue
+            try:
+                if finalize:
+                    finalize(obj, result)
+                fails.append(0)
+            except Exception as exc:  # pylint: disable=broad-except
+                fails.append(_handle_async_exc(obj, exc))
+        remote_fs.async_fs.invalidate_cache()
+        return fails
+
+    return async_processor
+
+
 def transfer(
     src: "ObjectDB",
     dest: "ObjectDB",
@@ -140,6 +400,7 @@ def transfer(
 
     Returns the number of successfully transferred objects
     """
+    from .db.reference import ReferenceObjectDB
     from .status import compare_status
 
     logger.debug(
@@ -156,17 +417,49 @@ def transfer(
 
     def func(hash_info: "HashInfo") -> None:
         obj = src.get(hash_info)
+        if isinstance(obj, PackedHashFile):
+            return dest.add_bytes(obj.read_bytes(), obj.hash_info)
         return dest.add(
             obj.path_info, obj.fs, obj.hash_info, verify=verify, move=move
         )
 
     total = len(status.new)
-    jobs = jobs or dest.fs.jobs
     with Tqdm(total=total, unit="file", desc="Transferring") as pbar:
-        with ThreadPoolExecutor(max_workers=jobs) as executor:
+        packed = _transfer_packs(
+            src, dest, status.new, verify=verify, move=move
+        )
+        pbar.update(len(packed))
+        with ThreadPoolExecutor(max_workers=jobs or dest.fs.jobs) as executor:
             wrapped_func = pbar.wrap_fn(_log_exceptions(func))
-            processor = partial(executor.imap_unordered, wrapped_func)
+            processor: Callable = partial(
+                executor.imap_unordered, wrapped_func
+            )
+            processor = (
+                _get_async_processor(
+                    src,
+                    dest,
+                    processor,
+                    pbar,
+                    jobs=jobs,
+                    verify=verify,
+                    move=move,
+                )
+                or processor
+            )
             _do_transfer(
-                src, dest, status.new, status.missing, processor, **kwargs
+                src,
+                dest,
+                status.new - packed,
+                status.missing,
+                processor,
+                **kwargs,
             )
+    if dest.listing_cache:
+        dest.listing_cache.update(
+            hash_info.value for hash_info in status.new if hash_info.value
+        )
+    if move and isinstance(src, ReferenceObjectDB):
+        # staged files have been moved to dest, there is nothing left for
+        # the references to point to
+        src.remove_references(status.new)
     return total
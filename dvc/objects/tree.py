@@ -1,7 +1,8 @@
 import json
 import logging
 import posixpath
-from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 from funcy import cached_property
 
@@ -10,28 +11,169 @@ from .file import HashFile
 from .stage import get_file_hash
 
 if TYPE_CHECKING:
+    from dvc.fs.base import BaseFileSystem
     from dvc.hash_info import HashInfo
+    from dvc.types import DvcPath
 
 logger = logging.getLogger(__name__)
 
 
+class _Entries:
+    """Entries of a tree loaded from a `.dir` object.
+
+    Keys are kept sorted, so that entries could be looked up by bisecting
+    them, and md5 values are packed into a single bytes object. Directories
+    with millions of files would otherwise take gigabytes of memory for a
+    `HashFile` (and a `HashInfo`) per entry, so objects are only created
+    when entries are accessed.
+    """
+
+    DIGEST_SIZE = 16
+
+    def __init__(
+        self,
+        name: str,
+        keys: List[Tuple[str, ...]],
+        digests: Optional[bytes] = None,
+        values: Optional[List[str]] = None,
+    ):
+        self.name = name
+        self.keys = keys
+        self.digests = digests
+        self.values = values
+        self.fs: Optional["BaseFileSystem"] = None
+        self.path_info: Optional["DvcPath"] = None
+
+    @classmethod
+    def from_items(cls, name: str, items: List[Tuple[Tuple[str, ...], str]]):
+        from operator import itemgetter
+
+        items.sort(key=itemgetter(0))
+        keys = [key for key, _ in items]
+        values = [value for _, value in items]
+        digests = cls._pack(values)
+        if digests is not None:
+            return cls(name, keys, digests=digests)
+        return cls(name, keys, values=values)
+
+    @classmethod
+    def _pack(cls, values: List[str]) -> Optional[bytes]:
+        if any(len(value) != 2 * cls.DIGEST_SIZE for value in values):
+            return None
+        joined = "".join(values)
+        try:
+            digests = bytes.fromhex(joined)
+        except ValueError:
+            return None
+        # values have to come out exactly as they were (e.g. lowercase)
+        if digests.hex() != joined:
+            return None
+        return digests
+
+    def __len__(self):
+        return len(self.keys)
+
+    def value(self, index: int) -> str:
+        if self.digests is None:
+            assert self.values is not None
+            return self.values[index]
+        start = index * self.DIGEST_SIZE
+        return self.digests[start : start + self.DIGEST_SIZE].hex()
+
+    def obj(self, index: int) -> HashFile:
+        from dvc.hash_info import HashInfo
+
+        key = self.keys[index]
+        path_info = None
+        if self.path_info is not None:
+            path_info = self.path_info.joinpath(*key)
+        return HashFile(
+            path_info, self.fs, HashInfo(self.name, self.value(index))
+        )
+
+    def items(self) -> Iterator[Tuple[Tuple[str, ...], HashFile]]:
+        for index, key in enumerate(self.keys):
+            yield key, self.obj(index)
+
+    def hashes(self) -> Iterator[Tuple[Tuple[str, ...], str, str]]:
+        for index, key in enumerate(self.keys):
+            yield key, self.name, self.value(index)
+
+    def find(self, key: Tuple[str, ...]) -> Optional[int]:
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return index
+        return None
+
+    def prefix_range(self, prefix: Tuple[str, ...]) -> Tuple[int, int]:
+        """Return range of the entries inside prefix."""
+        if not prefix:
+            return 0, len(self.keys)
+        # no string sorts between `name` and `name + "\0"`, so every key
+        # inside prefix sorts before the latter
+        end = prefix[:-1] + (prefix[-1] + "\0",)
+        return bisect_left(self.keys, prefix), bisect_left(self.keys, end)
+
+    def slice(self, start: int, stop: int, depth: int = 0) -> "_Entries":
+        """Return entries in range, with first `depth` parts of their keys
+        stripped."""
+        keys = self.keys[start:stop]
+        if depth:
+            keys = [key[depth:] for key in keys]
+        digests = values = None
+        if self.digests is not None:
+            digests = self.digests[
+                start * self.DIGEST_SIZE : stop * self.DIGEST_SIZE
+            ]
+        else:
+            assert self.values is not None
+            values = self.values[start:stop]
+        entries = _Entries(self.name, keys, digests=digests, values=values)
+        entries.fs = self.fs
+        if self.path_info is not None and depth:
+            first = self.keys[start]
+            entries.path_info = self.path_info.joinpath(*first[:depth])
+        else:
+            entries.path_info = self.path_info
+        return entries
+
+
 class Tree(HashFile):
     PARAM_RELPATH = "relpath"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._dict: Dict[Tuple[str], "HashFile"] = {}
+        # set instead of `_dict` for trees loaded from `.dir` objects
+        self._entries: Optional[_Entries] = None
 
     @cached_property
     def trie(self):
         from pygtrie import Trie
 
-        return Trie(self._dict)
+        return Trie(self.as_dict())
 
     def add(self, key, obj):
+        if self._entries is not None:
+            self._dict = self.as_dict()
+            self._entries = None
         self.__dict__.pop("trie", None)
         self._dict[key] = obj
 
+    def set_entries_location(
+        self, fs: "BaseFileSystem", path_info: Optional["DvcPath"] = None
+    ):
+        """Point entries to the files inside `path_info` on `fs`."""
+        if self._entries is not None:
+            self._entries.fs = fs
+            self._entries.path_info = path_info
+            return
+
+        for key, obj in self._dict.items():
+            obj.fs = fs
+            if path_info is not None:
+                obj.path_info = path_info.joinpath(*key)
+
     def digest(self, hash_info: Optional["HashInfo"] = None):
         from dvc.fs.memory import MemoryFileSystem
         from dvc.path_info import CloudURLInfo
@@ -56,12 +198,19 @@ class Tree(HashFile):
         self.hash_info.nfiles = len(self)
 
     def __len__(self):
+        if self._entries is not None:
+            return len(self._entries)
         return len(self._dict)
 
     def __iter__(self):
-        yield from self._dict.items()
+        if self._entries is not None:
+            yield from self._entries.items()
+        else:
+            yield from self._dict.items()
 
     def as_dict(self):
+        if self._entries is not None:
+            return dict(self._entries.items())
         return self._dict.copy()
 
     def as_list(self):
@@ -73,14 +222,22 @@ class Tree(HashFile):
                 {
                     # NOTE: not using hash_info.to_dict() because we don't want
                     # size/nfiles fields at this point.
-                    obj.hash_info.name: obj.hash_info.value,
+                    name: value,
                     self.PARAM_RELPATH: posixpath.sep.join(parts),
                 }
-                for parts, obj in self._dict.items()  # noqa: B301
+                for parts, name, value in self._iter_hashes()
             ),
             key=itemgetter(self.PARAM_RELPATH),
         )
 
+    def _iter_hashes(self):
+        if self._entries is not None:
+            yield from self._entries.hashes()
+            return
+
+        for parts, obj in self._dict.items():  # noqa: B301
+            yield parts, obj.hash_info.name, obj.hash_info.value
+
     def as_bytes(self):
         return json.dumps(self.as_list(), sort_keys=True).encode("utf-8")
 
@@ -89,6 +246,21 @@ class Tree(HashFile):
         from dvc.hash_info import HashInfo
 
         tree = cls(None, None, None)
+        names = set()
+        items = []
+        for _entry in lst:
+            entry = _entry.copy()
+            relpath = entry.pop(cls.PARAM_RELPATH)
+            if len(entry) != 1:
+                break
+            ((name, value),) = entry.items()
+            names.add(name)
+            items.append((tuple(relpath.split(posixpath.sep)), value))
+        else:
+            if len(names) == 1:
+                tree._entries = _Entries.from_items(names.pop(), items)
+                return tree
+
         for _entry in lst:
             entry = _entry.copy()
             relpath = entry.pop(cls.PARAM_RELPATH)
@@ -118,8 +290,7 @@ class Tree(HashFile):
         tree = cls.from_list(raw)
         tree.path_info = obj.path_info
         tree.fs = obj.fs
-        for _, entry_obj in tree:
-            entry_obj.fs = obj.fs
+        tree.set_entries_location(obj.fs)
         tree.hash_info = hash_info
 
         return tree
@@ -134,6 +305,11 @@ class Tree(HashFile):
         Returns an empty tree if no object exists at the specified prefix.
         """
         tree = Tree(self.path_info, self.fs, self.hash_info)
+        if self._entries is not None:
+            start, stop = self._entries.prefix_range(prefix)
+            tree._entries = self._entries.slice(start, stop)
+            return tree
+
         try:
             for key, obj in self.trie.items(prefix):
                 tree.add(key, obj)
@@ -146,12 +322,20 @@ class Tree(HashFile):
 
         Returns None if no object exists at the specified prefix.
         """
-        obj = self._dict.get(prefix)
+        obj = self.get_entry(prefix)
         if obj:
             return obj
 
         tree = Tree(None, None, None)
         depth = len(prefix)
+        if self._entries is not None:
+            start, stop = self._entries.prefix_range(prefix)
+            if start == stop:
+                return None
+            tree._entries = self._entries.slice(start, stop, depth=depth)
+            tree.digest()
+            return tree
+
         try:
             for key, obj in self.trie.items(prefix):
                 tree.add(key[depth:], obj)
@@ -160,6 +344,17 @@ class Tree(HashFile):
         tree.digest()
         return tree
 
+    def get_entry(self, key: Tuple[str]) -> Optional[HashFile]:
+        """Return entry (i.e. file object) with the specified key in this
+        tree, if there is one."""
+        if self._entries is None:
+            return self._dict.get(key)
+
+        index = self._entries.find(key)
+        if index is None:
+            return None
+        return self._entries.obj(index)
+
 
 def _get_dir_size(odb, tree):
     try:
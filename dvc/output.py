@@ -24,7 +24,7 @@ from .fs.local import LocalFileSystem
 from .fs.s3 import S3FileSystem
 from .hash_info import HashInfo
 from .istextfile import istextfile
-from .objects import Tree
+from .objects import ChunkedFile, Tree
 from .objects.errors import ObjectFormatError
 from .objects.stage import stage as ostage
 from .objects.transfer import transfer as otransfer
@@ -34,6 +34,7 @@ from .utils.fs import path_isin
 
 if TYPE_CHECKING:
     from .objects.db.base import ObjectDB
+    from .objects.file import HashFile
 
 logger = logging.getLogger(__name__)
 
@@ -422,6 +423,7 @@ class Output:
             name,
             dvcignore=self.dvcignore,
             dry_run=not self.use_cache,
+            chunking=self.use_cache,
         )
         return obj.hash_info
 
@@ -894,6 +896,32 @@ class Output:
             obj = obj.filter(prefix)
         return obj
 
+    def _collect_used_chunked_cache(
+        self, remote=None, jobs=None, **kwargs
+    ) -> Optional["HashFile"]:
+        """Fetch chunked file manifest and return used object for this out.
+
+        Falls back to the raw manifest object if it can't be loaded, so that
+        the manifest itself is still collected.
+        """
+        try:
+            self.odb.check(self.hash_info, check_hash=False)
+        except FileNotFoundError:
+            if self.remote:
+                remote = self.remote
+            try:
+                self.repo.cloud.pull(
+                    [self.hash_info], jobs=jobs, remote=remote
+                )
+            except DvcException:
+                logger.debug(f"failed to pull cache for '{self}'")
+
+        try:
+            obj = self.get_obj()
+        except ObjectFormatError:
+            obj = None
+        return obj or self.odb.get(self.hash_info)
+
     def get_used_objs(
         self, **kwargs
     ) -> Dict[Optional["ObjectDB"], Set["HashInfo"]]:
@@ -924,8 +952,11 @@ class Output:
             logger.warning(msg)
             return {}
 
+        obj: Optional["HashFile"]
         if self.is_dir_checksum:
             obj = self._collect_used_dir_cache(**kwargs)
+        elif self.hash_info.ischunked:
+            obj = self._collect_used_chunked_cache(**kwargs)
         else:
             obj = self.get_obj(filter_info=kwargs.get("filter_info"))
             if not obj:
@@ -949,6 +980,10 @@ class Output:
             for key, entry_obj in obj:
                 entry_obj.hash_info.obj_name = self.fs.sep.join([name, *key])
                 oids.add(entry_obj.hash_info)
+        elif isinstance(obj, ChunkedFile):
+            for _, entry_obj in obj:
+                entry_obj.hash_info.obj_name = name
+                oids.add(entry_obj.hash_info)
         return oids
 
     def get_used_external(
@@ -1,4 +1,5 @@
 import logging
+import os
 from collections.abc import Mapping, Sequence
 from copy import deepcopy
 from typing import (
@@ -8,6 +9,7 @@ from typing import (
     List,
     NamedTuple,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -152,6 +154,12 @@ class DataResolver:
         # we use `tracked_vars` to keep a dictionary of used variables
         # by the interpolated entries.
         self.tracked_vars: Dict[str, Mapping] = {}
+        # files that the resolved data depends on, i.e. the ones loaded from
+        # `vars` and the default params file (even if it does not exist yet)
+        self.imports: Set[str] = {
+            os.path.abspath(wdir / DEFAULT_PARAMS_FILE),
+            *self.context.imports,
+        }
 
         stages_data = d.get(STAGES_KWD, {})
         # we wrap the definitions into ForeachDefinition and EntryDefinition,
@@ -212,6 +220,34 @@ class DataResolver:
     def track_vars(self, name: str, vars_) -> None:
         self.tracked_vars[name] = vars_
 
+    def track_imports(self, imports: Mapping) -> None:
+        self.imports.update(imports)
+
+
+class ResolvedData:
+    """Data resolved by `DataResolver` for all of the stages, which can be
+    used in its place (e.g. when it was cached)."""
+
+    def __init__(self, stages: DictStr, tracked_vars: Dict[str, Mapping]):
+        self.stages = stages
+        self.tracked_vars = tracked_vars
+
+    @classmethod
+    def from_resolver(cls, resolver: DataResolver) -> "ResolvedData":
+        return cls(resolver.resolve()[STAGES_KWD], resolver.tracked_vars)
+
+    def resolve_one(self, name: str):
+        if name not in self.stages:
+            raise EntryNotFound(f"Could not find '{name}'")
+        # stages are modified while being loaded
+        return {name: deepcopy(self.stages[name])}
+
+    def has_key(self, key: str):
+        return key in self.stages
+
+    def get_keys(self):
+        return list(self.stages)
+
 
 class EntryDefinition:
     def __init__(
@@ -274,6 +310,7 @@ class EntryDefinition:
             context.load_from_vars(fs, vars_, wdir, stage_name=name)
         except VarsAlreadyLoaded as exc:
             format_and_raise(exc, f"'{self.where}.{name}.vars'", self.relpath)
+        self.resolver.track_imports(context.imports)
 
         logger.trace(  # type: ignore[attr-defined]
             "Context during resolution of stage %s:\n%s", name, context
@@ -246,6 +246,22 @@ class Repo:
 
         return Index(self)
 
+    @cached_property
+    def used_objs_cache(self):
+        from dvc.repo.used_cache import UsedObjsCache
+
+        if not self.tmp_dir:
+            return None
+        return UsedObjsCache(self.tmp_dir)
+
+    @cached_property
+    def metafile_cache(self):
+        from dvc.repo.metafile_cache import MetafileCache
+
+        if not self.tmp_dir:
+            return None
+        return MetafileCache(self.tmp_dir)
+
     @staticmethod
     def open(url, *args, **kwargs):
         if url is None:
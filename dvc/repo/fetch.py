@@ -21,6 +21,7 @@ def fetch(
     all_commits=False,
     run_cache=False,
     revs=None,
+    refresh_listing=False,
 ):
     """Download data items from a cloud and imported repositories
 
@@ -55,7 +56,7 @@ def fetch(
 
     try:
         if run_cache:
-            self.stage_cache.pull(remote)
+            self.stage_cache.pull(remote, jobs=jobs)
     except DownloadError as exc:
         failed += exc.amount
 
@@ -70,6 +71,7 @@ def fetch(
             jobs=jobs,
             remote=remote,
             odb=odb,
+            refresh_listing=refresh_listing,
         )
         downloaded += d
         failed += f
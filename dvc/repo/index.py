@@ -1,3 +1,4 @@
+import os
 from contextlib import suppress
 from typing import (
     TYPE_CHECKING,
@@ -170,6 +171,11 @@ class Index:
 
         from dvc.utils.collections import ensure_list
 
+        if not targets and self._can_cache_used_objs():
+            return self._cached_used_objs(
+                remote=remote, force=force, jobs=jobs
+            )
+
         used: "ObjectContainer" = defaultdict(set)
         collect_targets: Sequence[Optional[str]] = (None,)
         if targets:
@@ -192,6 +198,163 @@ class Index:
                 used[odb].update(objs)
         return used
 
+    def _can_cache_used_objs(self) -> bool:
+        from dvc.fs.git import GitFileSystem
+
+        # NOTE: only git revisions are immutable, workspace files can change
+        # without us noticing.
+        return (
+            isinstance(self.fs, GitFileSystem)
+            and self.repo.used_objs_cache is not None
+            and "stages" not in self.__dict__
+        )
+
+    def _sha(self, path: str) -> Optional[str]:
+        if not self.fs.exists(path):
+            return None
+        return self.fs.info(path)["sha"]
+
+    def _metafile_key(self, path: str) -> str:
+        from dvc.dvcfile import PIPELINE_FILE, PIPELINE_LOCK
+        from dvc.utils import relpath
+
+        sha = self.fs.info(path)["sha"]
+        lock_sha = None
+        if os.path.basename(path) == PIPELINE_FILE:
+            lock_sha = self._sha(
+                os.path.join(os.path.dirname(path), PIPELINE_LOCK)
+            )
+        return self.repo.used_objs_cache.key(
+            relpath(path, self.repo.root_dir), sha, lock_sha
+        )
+
+    def _metafile_imports(
+        self, path: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """Return git blob SHAs (or None for missing files) of the files
+        that the stages in the given metafile are interpolated from, see
+        `DataResolver.imports`.
+
+        Returns None if these are not known, in which case the metafile
+        should not be cached.
+        """
+        from dvc.dvcfile import PIPELINE_FILE, PipelineFile
+        from dvc.utils import relpath
+
+        if os.path.basename(path) != PIPELINE_FILE:
+            return {}
+        loader = PipelineFile(self.repo, path).stages
+        imports = getattr(loader.resolver, "imports", None)
+        if imports is None:
+            return None
+        return {
+            relpath(import_path, self.repo.root_dir): self._sha(import_path)
+            for import_path in imports
+        }
+
+    def _imports_changed(self, imports: Dict[str, Optional[str]]) -> bool:
+        return any(
+            self._sha(os.path.join(self.repo.root_dir, path)) != sha
+            for path, sha in imports.items()
+        )
+
+    def _collect_metafile_used_objs(self, path: str, **kwargs):
+        """Return (output paths, used objects, is cacheable) for the stages
+        in the given metafile."""
+        from collections import defaultdict
+
+        from dvc.exceptions import DvcException
+        from dvc.utils import relpath
+
+        try:
+            stages = self.stage_collector.load_file(path)
+        except DvcException as exc:
+            onerror = self.repo.stage_collection_error_handler
+            if not onerror:
+                raise
+            onerror(relpath(path), exc)
+            return [], {}, False
+
+        used: "ObjectContainer" = defaultdict(set)
+        cacheable = True
+        for stage in stages:
+            if stage.is_repo_import or any(
+                out.use_cache and (out.remote or not out.hash_info)
+                for out in stage.outs
+            ):
+                # depends on other repos/remotes or logs warnings
+                cacheable = False
+            for odb, objs in stage.get_used_objs(**kwargs).items():
+                used[odb].update(objs)
+
+        if cacheable and set(used) - {None}:
+            cacheable = False
+        if cacheable:
+            # trees which couldn't be loaded (i.e. missing .dir files) are
+            # not expanded yet, see `Output._collect_used_dir_cache()`
+            odb = self.repo.odb.local
+            assert odb
+            cacheable = all(
+                odb.exists(hash_info)
+                for hash_info in used.get(None, ())
+                if hash_info.isdir or hash_info.ischunked
+            )
+
+        outs = [
+            out.fspath
+            for stage in stages
+            for out in stage.outs
+            if out.scheme == "local"
+        ]
+        return outs, used, cacheable
+
+    def _cached_used_objs(self, **kwargs) -> "ObjectContainer":
+        """Collect used objects for all of the stages in a git revision,
+        reusing the ones cached for unchanged metafiles.
+
+        Walks the repo like `StageLoad.collect_repo()`, but without parsing
+        the metafiles which are in the cache.
+        """
+        from collections import defaultdict
+
+        from dvc.dvcfile import is_valid_filename
+
+        cache = self.repo.used_objs_cache
+        root_dir = self.repo.root_dir
+        used: "ObjectContainer" = defaultdict(set)
+        outs: Set[str] = set()
+        for root, dirs, files in self.repo.dvcignore.walk(self.fs, root_dir):
+            for fname in filter(is_valid_filename, files):
+                path = os.path.join(root, fname)
+                key = self._metafile_key(path)
+                cached = cache.get(key)
+                if cached is not None and not self._imports_changed(cached[2]):
+                    file_outs, objs, _ = cached
+                    outs.update(
+                        os.path.join(root_dir, out) for out in file_outs
+                    )
+                    used[None].update(objs)
+                    continue
+
+                (
+                    file_outs,
+                    file_used,
+                    cacheable,
+                ) = self._collect_metafile_used_objs(path, **kwargs)
+                outs.update(file_outs)
+                for odb, objs in file_used.items():
+                    used[odb].update(objs)
+                imports = self._metafile_imports(path) if cacheable else None
+                if imports is not None:
+                    cache.set(
+                        key,
+                        (os.path.relpath(out, root_dir) for out in file_outs),
+                        file_used.get(None, ()),
+                        imports,
+                    )
+            dirs[:] = [d for d in dirs if os.path.join(root, d) not in outs]
+        return used
+
     # Following methods help us treat the collection as a set-like structure
     # and provides faux-immutability.
     # These methods do not preserve stages order.
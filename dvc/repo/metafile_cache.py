@@ -0,0 +1,95 @@
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from dvc.types import StrPath
+
+logger = logging.getLogger(__name__)
+
+Fingerprint = Optional[Tuple[int, int, int]]
+
+
+class MetafileCache:
+    """Persistent cache of data loaded from DVC metafiles.
+
+    Parsing YAML, validating it and interpolating `dvc.yaml` files is what
+    most of the time to collect stages in large repos is spent on. Loaded
+    data is kept along with fingerprints (mtime, size and inode) of the
+    files it was loaded from (e.g. `dvc.yaml` and `params.yaml`), so that
+    only the files which have changed since need to be loaded again.
+    """
+
+    CACHE_DIR = "metafiles"
+    # a file could be modified again without its mtime changing, if it has
+    # only just been modified, so such files are not cached until later
+    RACY_WINDOW = 2
+
+    def __init__(self, tmp_dir: "StrPath"):
+        from diskcache import Cache
+
+        from dvc.utils.fs import makedirs
+
+        self.cache_dir = os.path.join(tmp_dir, self.CACHE_DIR)
+        makedirs(self.cache_dir, exist_ok=True)
+        self.cache = Cache(self.cache_dir)
+
+    @staticmethod
+    def fingerprint(path: "StrPath") -> Fingerprint:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _is_racy(self, fingerprints: Iterable[Fingerprint]) -> bool:
+        now = time.time()
+        return any(
+            fp and now - fp[0] / 10 ** 9 < self.RACY_WINDOW
+            for fp in fingerprints
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return data cached for `key`, unless any of the files it was
+        loaded from have changed since."""
+        from diskcache import Timeout
+
+        from dvc import __version__
+
+        try:
+            entry = self.cache.get(key)
+        except Timeout:
+            return None
+        if entry is None:
+            return None
+        version, fingerprints, value = entry
+        if version != __version__:
+            return None
+        for path, fp in fingerprints.items():
+            if self.fingerprint(path) != fp:
+                logger.trace(  # type: ignore[attr-defined]
+                    "'%s' has changed, not using cached '%s'", path, key
+                )
+                return None
+        return value
+
+    def set(self, key: str, paths: Iterable["StrPath"], value: Any):
+        """Cache data for `key` that was loaded from `paths`.
+
+        Paths that don't exist are fingerprinted as well, so that the data
+        is loaded again once they are created.
+        """
+        from diskcache import Timeout
+
+        from dvc import __version__
+
+        fingerprints: Dict[str, Fingerprint] = {
+            os.fspath(path): self.fingerprint(path) for path in paths
+        }
+        if self._is_racy(fingerprints.values()):
+            return
+        try:
+            self.cache[key] = (__version__, fingerprints, value)
+        except Timeout:
+            logger.debug("failed to cache '%s'", key)
@@ -20,6 +20,7 @@ def pull(
     all_commits=False,
     run_cache=False,
     glob=False,
+    refresh_listing=False,
 ):
     if isinstance(targets, str):
         targets = [targets]
@@ -36,6 +37,7 @@ def pull(
         with_deps=with_deps,
         recursive=recursive,
         run_cache=run_cache,
+        refresh_listing=refresh_listing,
     )
     stats = self.checkout(
         targets=expanded_targets,
@@ -18,8 +18,11 @@ def push(
     run_cache=False,
     revs=None,
     glob=False,
+    refresh_listing=False,
 ):
-    used_run_cache = self.stage_cache.push(remote) if run_cache else []
+    used_run_cache = (
+        self.stage_cache.push(remote, jobs=jobs) if run_cache else []
+    )
 
     if isinstance(targets, str):
         targets = [targets]
@@ -45,7 +48,13 @@ def push(
         if odb and odb.read_only:
             continue
         try:
-            pushed += self.cloud.push(obj_ids, jobs, remote=remote, odb=odb)
+            pushed += self.cloud.push(
+                obj_ids,
+                jobs,
+                remote=remote,
+                odb=odb,
+                refresh_listing=refresh_listing,
+            )
         except FileTransferError as exc:
             raise UploadError(exc.amount)
     return pushed
@@ -1,8 +1,9 @@
 import logging
+import threading
 import typing
 from functools import partial
 
-from dvc.exceptions import DvcException, ReproductionError
+from dvc.exceptions import DvcException, FailedStagesError, ReproductionError
 from dvc.repo.scm_context import scm_context
 
 from . import locked
@@ -12,6 +13,9 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# stages that are reproduced concurrently could share the same dvcfile
+_dump_lock = threading.Lock()
+
 
 def _reproduce_stage(stage, **kwargs):
     def _run_callback(repro_callback):
@@ -53,7 +57,8 @@ def _dump_stage(stage):
     from ..dvcfile import Dvcfile
 
     dvcfile = Dvcfile(stage.repo, stage.path)
-    dvcfile.dump(stage, update_pipeline=False)
+    with _dump_lock:
+        dvcfile.dump(stage, update_pipeline=False)
 
 
 def _track_stage(stage):
@@ -136,7 +141,14 @@ def reproduce(
 
 
 def _reproduce_stages(
-    G, stages, downstream=False, single_item=False, on_unchanged=None, **kwargs
+    G,
+    stages,
+    downstream=False,
+    single_item=False,
+    on_unchanged=None,
+    jobs=1,
+    keep_going=False,
+    **kwargs,
 ):
     r"""Derive the evaluation of the given node for the given graph.
 
@@ -172,16 +184,36 @@ def _reproduce_stages(
                  A                                       E
 
     The derived evaluation of _downstream_ B would be: [B, D, E]
+
+    With `jobs` > 1, stages are reproduced concurrently as soon as all of
+    the stages they depend on have been, e.g. B and C in the example above.
+
+    With `keep_going`, stages that fail to reproduce don't stop the ones
+    which don't depend on them from being reproduced.
     """
     steps = _get_steps(G, stages, downstream, single_item)
 
     force_downstream = kwargs.pop("force_downstream", False)
+    if jobs > 1 and not any(
+        kwargs.get(opt) for opt in ("dry", "interactive", "checkpoint_func")
+    ):
+        result, unchanged = _reproduce_parallel(
+            G, steps, jobs, keep_going, force_downstream, **kwargs
+        )
+        if on_unchanged is not None:
+            on_unchanged(unchanged)
+        return result
+
     result = []
     unchanged = []
+    failed, skipped = set(), set()
     # `ret` is used to add a cosmetic newline.
     ret = []
     checkpoint_func = kwargs.pop("checkpoint_func", None)
     for stage in steps:
+        if stage in skipped:
+            continue
+
         if ret:
             logger.info("")
 
@@ -210,13 +242,137 @@ def _reproduce_stages(
         except CheckpointKilledError:
             raise
         except Exception as exc:
-            raise ReproductionError(stage.relpath) from exc
+            if not keep_going:
+                raise ReproductionError(stage.relpath) from exc
+            logger.exception("failed to reproduce '%s'", stage.addressing)
+            _fail_stage(G, stage, steps, failed, skipped)
+            ret = []
 
+    _raise_failed(failed)
     if on_unchanged is not None:
         on_unchanged(unchanged)
     return result
 
 
+def _reproduce_parallel(
+    G, steps, jobs, keep_going, force_downstream, **kwargs
+):
+    import heapq
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    # commands are run while other stages are being saved, so the repo lock
+    # is kept, and their output is printed only once they are done
+    kwargs.update(capture_output=True, unlock_repo=False)
+    dependents, remaining = _get_dependents(G, steps)
+    # stages are started in the order of steps once they are ready, i.e.
+    # once all of the stages that they depend on are done
+    order = {stage: i for i, stage in enumerate(steps)}
+    ready = [order[stage] for stage in steps if not remaining[stage]]
+    forced, failed, skipped = set(), set(), set()
+    result, unchanged = [], []
+    running = {}
+    error = None
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while running or (ready and not error):
+            while ready and not error and len(running) < jobs:
+                stage = steps[heapq.heappop(ready)]
+                if stage in skipped:
+                    continue
+                stage_kwargs = dict(kwargs)
+                if force_downstream and stage in forced:
+                    stage_kwargs["force"] = True
+                future = executor.submit(
+                    _reproduce_stage, stage, **stage_kwargs
+                )
+                running[future] = stage
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                try:
+                    ret = future.result()
+                except Exception as exc:  # noqa, pylint: disable=broad-except
+                    if not keep_going:
+                        # let the stages that are already running finish
+                        error = error or (stage, exc)
+                        continue
+                    logger.exception(
+                        "failed to reproduce '%s'", stage.addressing
+                    )
+                    _fail_stage(G, stage, steps, failed, skipped)
+                    continue
+
+                if ret:
+                    result.extend(ret)
+                else:
+                    unchanged.append(stage)
+                for dependent in dependents[stage]:
+                    if ret or stage in forced:
+                        forced.add(dependent)
+                    remaining[dependent] -= 1
+                    if not remaining[dependent]:
+                        heapq.heappush(ready, order[dependent])
+
+    if error:
+        failed_stage, cause = error
+        raise ReproductionError(failed_stage.relpath) from cause
+    _raise_failed(failed)
+    return result, unchanged
+
+
+def _get_dependents(G, steps):
+    """Return the steps that directly depend on each of the steps, and the
+    number of steps that each of them directly depends on.
+
+    Dependencies through stages that aren't steps themselves (e.g. with
+    `single_item`) are followed, so that stages are still reproduced after
+    the ones they (indirectly) depend on.
+    """
+    step_set = set(steps)
+    dependents = {stage: [] for stage in steps}
+    counts = {}
+    for stage in steps:
+        deps, seen = set(), set()
+        stack = list(G.successors(stage))
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if node in step_set:
+                deps.add(node)
+            else:
+                stack.extend(G.successors(node))
+        counts[stage] = len(deps)
+        for dep in deps:
+            dependents[dep].append(stage)
+    return dependents, counts
+
+
+def _fail_stage(G, stage, steps, failed, skipped):
+    """Mark the stage as failed, and the steps depending on it as skipped."""
+    import networkx as nx
+
+    failed.add(stage)
+    dependents = nx.ancestors(G, stage)
+    for dependent in steps:
+        if dependent in dependents and dependent not in skipped:
+            skipped.add(dependent)
+            logger.warning(
+                "Skipping '%s' as its dependencies failed to reproduce",
+                dependent.addressing,
+            )
+
+
+def _raise_failed(failed):
+    if failed:
+        raise FailedStagesError(failed)
+
+
 def _get_steps(G, stages, downstream, single_item):
     import networkx as nx
 
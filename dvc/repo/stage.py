@@ -3,7 +3,7 @@ import logging
 import os
 import typing
 from contextlib import suppress
-from functools import partial, wraps
+from functools import wraps
 from typing import (
     Callable,
     Iterable,
@@ -452,32 +452,28 @@ class StageLoad:
         """
         from dvc.dvcfile import is_valid_filename
         from dvc.fs.local import LocalFileSystem
+        from dvc.ignore import GitIgnoreFilter
+        from dvc.scm.git import Git
 
         scm = self.repo.scm
         sep = os.sep
         outs: Set[str] = set()
 
-        is_local_fs = isinstance(self.fs, LocalFileSystem)
-
-        def is_ignored(path):
-            # apply only for the local fs
-            return is_local_fs and scm.is_ignored(path)
-
-        def is_dvcfile_and_not_ignored(root, file):
-            return is_valid_filename(file) and not is_ignored(
-                f"{root}{sep}{file}"
+        gitignore = None
+        # apply gitignore only for the local fs
+        if isinstance(self.fs, LocalFileSystem) and isinstance(scm, Git):
+            gitignore = GitIgnoreFilter(
+                self.fs, scm.root_dir, scm.global_ignore_files
             )
 
-        def is_out_or_ignored(root, directory):
-            dir_path = f"{root}{sep}{directory}"
-            # trailing slash needed to check if a directory is gitignored
-            return dir_path in outs or is_ignored(f"{dir_path}{sep}")
-
         for root, dirs, files in self.repo.dvcignore.walk(
             self.fs, self.repo.root_dir
         ):
-            dvcfile_filter = partial(is_dvcfile_and_not_ignored, root)
-            for file in filter(dvcfile_filter, files):
+            dvcfiles = [file for file in files if is_valid_filename(file)]
+            if gitignore:
+                dirs[:], dvcfiles = gitignore(root, dirs, dvcfiles)
+
+            for file in dvcfiles:
                 file_path = os.path.join(root, file)
                 try:
                     new_stages = self.load_file(file_path)
@@ -494,7 +490,7 @@ class StageLoad:
                     for out in stage.outs
                     if out.scheme == "local"
                 )
-            dirs[:] = [d for d in dirs if not is_out_or_ignored(root, d)]
+            dirs[:] = [d for d in dirs if f"{root}{sep}{d}" not in outs]
 
     def collect_repo(self, onerror: Callable[[str, Exception], None] = None):
         return list(self._collect_repo(onerror))
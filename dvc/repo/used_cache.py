@@ -0,0 +1,94 @@
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from dvc.hash_info import HashInfo
+
+if TYPE_CHECKING:
+    from dvc.types import StrPath
+
+logger = logging.getLogger(__name__)
+
+
+class UsedObjsCache:
+    """Persistent cache of objects used by DVC metafiles in git revisions.
+
+    Entries are keyed by the path of the metafile along with the git blob
+    SHAs of the metafile (and its lock file), so that collecting used objects
+    for lots of revisions (e.g. `gc --all-commits`) only needs to parse the
+    metafiles which have actually changed between them. The SHAs of the
+    files that `dvc.yaml` is interpolated from (e.g. `params.yaml`) are kept
+    in the entries, and need to be checked by the caller.
+    """
+
+    CACHE_DIR = "used_objs"
+
+    def __init__(self, tmp_dir: "StrPath"):
+        from diskcache import Cache
+
+        from dvc.utils.fs import makedirs
+
+        self.cache_dir = os.path.join(tmp_dir, self.CACHE_DIR)
+        makedirs(self.cache_dir, exist_ok=True)
+        self.cache = Cache(self.cache_dir)
+
+    @staticmethod
+    def key(path: str, sha: str, lock_sha: Optional[str] = None) -> str:
+        return f"{path}:{sha}:{lock_sha or ''}"
+
+    def get(
+        self, key: str
+    ) -> Optional[Tuple[List[str], Set[HashInfo], Dict[str, Optional[str]]]]:
+        """Return (output paths, used object IDs, imported files SHAs) cached
+        for the metafile.
+
+        Fresh HashInfo instances are returned on each call, since callers
+        are free to modify them (see `Repo.used_objs`).
+        """
+        from diskcache import Timeout
+
+        try:
+            entry = self.cache.get(key)
+        except Timeout:
+            return None
+        if entry is None or len(entry) != 3:
+            return None
+        outs, objs, imports = entry
+        return (
+            outs,
+            {
+                HashInfo(
+                    name, value, size=size, nfiles=nfiles, obj_name=obj_name
+                )
+                for name, value, size, nfiles, obj_name in objs
+            },
+            imports,
+        )
+
+    def set(
+        self,
+        key: str,
+        outs: Iterable[str],
+        objs: Iterable[HashInfo],
+        imports: Optional[Dict[str, Optional[str]]] = None,
+    ):
+        from diskcache import Timeout
+
+        entry = (
+            list(outs),
+            [
+                (
+                    hash_info.name,
+                    hash_info.value,
+                    hash_info.size,
+                    hash_info.nfiles,
+                    hash_info.obj_name,
+                )
+                for hash_info in objs
+            ],
+            imports or {},
+        )
+        try:
+            self.cache[key] = entry
+        except Timeout:
+            logger.debug("failed to cache used objects for '%s'", key)
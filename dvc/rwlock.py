@@ -1,6 +1,7 @@
 import json
 import os
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict
 from contextlib import contextmanager
 
 from voluptuous import Invalid, Optional, Required, Schema
@@ -18,6 +19,13 @@ SCHEMA = Schema(
 )
 
 
+# All threads of a process (e.g. `repro --jobs`) lock paths with the same
+# info, so the rwlock file is only edited by one thread at a time and paths
+# are only released by the last of the threads that are holding them.
+_mutex = threading.Lock()
+_holders: Counter = Counter()
+
+
 class RWLockFileCorruptedError(DvcException):
     def __init__(self, path):
         super().__init__(
@@ -34,20 +42,21 @@ class RWLockFileFormatError(DvcException):
 @contextmanager
 def _edit_rwlock(lock_dir):
     path = os.path.join(lock_dir, "rwlock")
-    try:
-        with open(path) as fobj:
-            lock = SCHEMA(json.load(fobj))
-    except FileNotFoundError:
-        lock = SCHEMA({})
-    except json.JSONDecodeError as exc:
-        raise RWLockFileCorruptedError(path) from exc
-    except Invalid as exc:
-        raise RWLockFileFormatError(path) from exc
-    lock["read"] = defaultdict(list, lock["read"])
-    lock["write"] = defaultdict(dict, lock["write"])
-    yield lock
-    with open(path, "w+") as fobj:
-        json.dump(lock, fobj)
+    with _mutex:
+        try:
+            with open(path) as fobj:
+                lock = SCHEMA(json.load(fobj))
+        except FileNotFoundError:
+            lock = SCHEMA({})
+        except json.JSONDecodeError as exc:
+            raise RWLockFileCorruptedError(path) from exc
+        except Invalid as exc:
+            raise RWLockFileFormatError(path) from exc
+        lock["read"] = defaultdict(list, lock["read"])
+        lock["write"] = defaultdict(dict, lock["write"])
+        yield lock
+        with open(path, "w+") as fobj:
+            json.dump(lock, fobj)
 
 
 def _infos_to_str(infos):
@@ -83,34 +92,32 @@ def _check_blockers(lock, info, *, mode, waiters):
 
 
 def _acquire_read(lock, info, path_infos):
-    changes = []
-
     for path_info in path_infos:
-        url = path_info.url
-
-        readers = lock["read"][url]
-        if info in readers:
-            continue
-
-        changes.append(url)
-        readers.append(info)
-
-    return changes
+        readers = lock["read"][path_info.url]
+        if info not in readers:
+            readers.append(info)
 
 
 def _acquire_write(lock, info, path_infos):
-    changes = []
-
     for path_info in path_infos:
-        url = path_info.url
+        lock["write"][path_info.url] = info
 
-        if lock["write"][url] == info:
-            continue
 
-        changes.append(url)
-        lock["write"][url] = info
+def _hold(lock_dir, mode, path_infos):
+    for path_info in path_infos:
+        _holders[lock_dir, mode, path_info.url] += 1
+
 
-    return changes
+def _unhold(lock_dir, mode, path_infos):
+    """Return urls that are no longer held by any thread."""
+    released = []
+    for path_info in path_infos:
+        key = (lock_dir, mode, path_info.url)
+        _holders[key] -= 1
+        if not _holders[key]:
+            del _holders[key]
+            released.append(path_info.url)
+    return released
 
 
 def _release_write(lock, info, changes):
@@ -137,7 +144,7 @@ def _release_read(lock, info, changes):
 
 @contextmanager
 def rwlock(tmp_dir, cmd, read, write):
-    """Create non-thread-safe RWLock for PathInfos.
+    """Create RWLock for PathInfos.
 
     Args:
         tmp_dir (str): existing directory where to create the rwlock file.
@@ -160,12 +167,14 @@ def rwlock(tmp_dir, cmd, read, write):
         _check_blockers(lock, info, mode="write", waiters=read + write)
         _check_blockers(lock, info, mode="read", waiters=write)
 
-        rchanges = _acquire_read(lock, info, read)
-        wchanges = _acquire_write(lock, info, write)
+        _acquire_read(lock, info, read)
+        _acquire_write(lock, info, write)
+        _hold(tmp_dir, "read", read)
+        _hold(tmp_dir, "write", write)
 
     try:
         yield
     finally:
         with _edit_rwlock(tmp_dir) as lock:
-            _release_write(lock, info, wchanges)
-            _release_read(lock, info, rchanges)
+            _release_write(lock, info, _unhold(tmp_dir, "write", write))
+            _release_read(lock, info, _unhold(tmp_dir, "read", read))
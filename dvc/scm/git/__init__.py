@@ -137,6 +137,20 @@ class Git(Base):
     def ignore_file(self):
         return self.GITIGNORE
 
+    @property
+    def global_ignore_files(self) -> List[str]:
+        """Ignore files which apply to the whole repo besides `.gitignore`
+        files, in order of increasing precedence."""
+        from dulwich.ignore import default_user_ignore_filter_path
+
+        repo = self.dulwich.repo
+        return [
+            os.path.expanduser(
+                default_user_ignore_filter_path(repo.get_config_stack())
+            ),
+            os.path.join(repo.controldir(), "info", "exclude"),
+        ]
+
     def _get_gitignore(self, path):
         ignore_file_dir = os.path.dirname(path)
 
@@ -345,6 +359,12 @@ class Git(Base):
                 pass
         raise NoGitBackendError(name)
 
+    @cached_property
+    def _tree_cache(self):
+        from .objects import GitTreeCache
+
+        return GitTreeCache()
+
     def get_fs(self, rev: str):
         from dvc.fs.git import GitFileSystem
 
@@ -352,7 +372,7 @@ class Git(Base):
 
         resolved = self.resolve_rev(rev)
         tree_obj = self.pygit2.get_tree_obj(rev=resolved)
-        trie = GitTrie(tree_obj, resolved)
+        trie = GitTrie(tree_obj, resolved, tree_cache=self._tree_cache)
         return GitFileSystem(self.root_dir, trie)
 
     is_ignored = partialmethod(_backend_func, "is_ignored")
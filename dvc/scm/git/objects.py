@@ -1,9 +1,9 @@
 import stat
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
-
-from pygtrie import Trie
+from typing import Dict, Iterable, List, Optional
 
 S_IFGITLINK = 0o160000
 
@@ -54,67 +54,106 @@ class GitObject(ABC):
         pass
 
 
+class GitTreeCache:
+    """LRU cache of the (name -> object) entries of expanded git trees.
+
+    Trees are keyed by their SHA, so that identical subtrees which are shared
+    between revisions are only ever expanded once.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, GitObject]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tree: GitObject) -> Dict[str, GitObject]:
+        with self._lock:
+            entries = self._entries.get(tree.sha)
+            if entries is not None:
+                self._entries.move_to_end(tree.sha)
+                return entries
+
+        entries = {obj.name: obj for obj in tree.scandir()}
+        with self._lock:
+            self._entries[tree.sha] = entries
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entries
+
+
 class GitTrie:
-    def __init__(self, tree: GitObject, rev: str):
+    """Lazily expanded view of the tree of a git revision.
+
+    Path components are resolved against git tree objects on demand, nothing
+    is read from git until it is actually accessed.
+    """
+
+    def __init__(
+        self,
+        tree: GitObject,
+        rev: str,
+        tree_cache: Optional[GitTreeCache] = None,
+    ):
         self.tree = tree
         self.rev = rev
-        self.trie = Trie()
-
-        self.trie[()] = tree
-        self._build(tree, ())
+        self.tree_cache = tree_cache or GitTreeCache()
 
-    def _build(self, tree: GitObject, path: tuple):
-        for obj in tree.scandir():
-            obj_path = path + (obj.name,)
-            self.trie[obj_path] = obj
+    def _entries(self, tree: GitObject) -> Dict[str, GitObject]:
+        return self.tree_cache.get(tree)
 
-            if obj.isdir:
-                self._build(obj, obj_path)
+    def _get(self, key: tuple) -> GitObject:
+        obj = self.tree
+        for name in key:
+            if not obj.isdir:
+                raise KeyError(key)
+            obj = self._entries(obj)[name]
+        return obj
 
     def open(
         self,
         key: tuple,
-        mode: Optional[str] = "r",
+        mode: str = "r",
         encoding: Optional[str] = None,
     ):
-        obj = self.trie[key]
+        obj = self._get(key)
         if obj.isdir:
             raise IsADirectoryError
 
         return obj.open(mode=mode, encoding=encoding)
 
     def exists(self, key: tuple) -> bool:
-        return bool(self.trie.has_node(key))
+        try:
+            self._get(key)
+        except KeyError:
+            return False
+        return True
 
     def isdir(self, key: tuple) -> bool:
         try:
-            obj = self.trie[key]
+            obj = self._get(key)
         except KeyError:
             return False
         return obj.isdir
 
     def isfile(self, key: tuple) -> bool:
         try:
-            obj = self.trie[key]
+            obj = self._get(key)
         except KeyError:
             return False
 
         return obj.isfile
 
     def walk(self, top: tuple, topdown: Optional[bool] = True):
+        obj = self._get(top)
+        assert obj.isdir
+
         dirs = []
         nondirs = []
-
-        def node_factory(_, path, children, obj):
-            if path == top:
-                assert obj.isdir
-                list(filter(None, children))
-            elif obj.isdir:
-                dirs.append(obj.name)
+        for entry in self._entries(obj).values():
+            if entry.isdir:
+                dirs.append(entry.name)
             else:
-                nondirs.append(obj.name)
-
-        self.trie.traverse(node_factory, prefix=top)
+                nondirs.append(entry.name)
 
         if topdown:
             yield top, dirs, nondirs
@@ -126,7 +165,7 @@ class GitTrie:
             yield top, dirs, nondirs
 
     def info(self, key: tuple) -> dict:
-        obj = self.trie[key]
+        obj = self._get(key)
         return {
             "size": obj.size,
             "type": "directory" if stat.S_ISDIR(obj.mode) else "file",
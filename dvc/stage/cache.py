@@ -4,7 +4,7 @@ import tempfile
 from contextlib import contextmanager
 from typing import Optional
 
-from funcy import cached_property, first
+from funcy import cached_property
 
 from dvc.exceptions import DvcException
 from dvc.path_info import PathInfo
@@ -74,9 +74,17 @@ class StageCache:
         from dvc.utils.serialize import YAMLFileCorruptedError, load_yaml
 
         path = self._get_cache_path(key, value)
+        # validated entries are kept in the metafile cache, so that they
+        # don't need to be parsed again
+        metafile_cache = self.repo.metafile_cache
+        cache_key = f"run-cache:{path}"
+        if metafile_cache:
+            cache = metafile_cache.get(cache_key)
+            if cache is not None:
+                return cache
 
         try:
-            return COMPILED_LOCK_FILE_STAGE_SCHEMA(load_yaml(path))
+            cache = COMPILED_LOCK_FILE_STAGE_SCHEMA(load_yaml(path))
         except FileNotFoundError:
             return None
         except (YAMLFileCorruptedError, Invalid):
@@ -84,18 +92,34 @@ class StageCache:
             os.unlink(path)
             return None
 
+        if metafile_cache:
+            metafile_cache.set(cache_key, [path], cache)
+        return cache
+
     def _load(self, stage):
         key = _get_stage_hash(stage)
         if not key:
             return None
 
         cache_dir = self._get_cache_dir(key)
+        # the entry found for the key is cached along with the fingerprint
+        # of its directory, which changes as entries are added or removed
+        metafile_cache = self.repo.metafile_cache
+        cache_key = f"run-cache-key:{cache_dir}"
+        if metafile_cache:
+            cache = metafile_cache.get(cache_key)
+            if cache is not None:
+                return cache
+
         if not os.path.exists(cache_dir):
             return None
 
         for value in os.listdir(cache_dir):
             cache = self._load_cache(key, value)
             if cache:
+                if metafile_cache:
+                    paths = [cache_dir, self._get_cache_path(key, value)]
+                    metafile_cache.set(cache_key, paths, cache)
                 return cache
 
         return None
@@ -210,28 +234,54 @@ class StageCache:
         cached_stage.checkout()
 
     @staticmethod
-    def _transfer(func, from_remote, to_remote):
-        ret = []
-
-        runs = from_remote.path_info / "runs"
-        if not from_remote.fs.exists(runs):
+    def _list_runs(odb):
+        """Return run-cache entries as `{(key, value): path_info}`."""
+        runs = odb.path_info / "runs"
+        if not odb.fs.exists(runs):
+            return {}
+
+        entries = {}
+        for path_info in odb.fs.walk_files(runs):
+            rel = path_info.relative_to(runs)
+            if len(rel.parts) == 3:
+                _, key, value = rel.parts
+                entries[(key, value)] = path_info
+        return entries
+
+    @classmethod
+    def _transfer(cls, func, from_remote, to_remote, jobs):
+        from dvc.utils.threadpool import ThreadPoolExecutor
+
+        # NOTE: both sides are listed just once (rather than checking each of
+        # the keys separately), which is what takes most of the time for
+        # remotes with lots of small run-cache entries
+        src_entries = cls._list_runs(from_remote)
+        if not src_entries:
             return []
+        dest_keys = {key for key, _ in cls._list_runs(to_remote)}
 
-        for src in from_remote.fs.walk_files(runs):
+        # only one entry is transferred for each key that doesn't have any
+        # run-cache entries yet
+        missing = {}
+        for (key, value), src in src_entries.items():
+            if key not in dest_keys and key not in missing:
+                missing[key] = (value, src)
+
+        def transfer_entry(item):
+            key, (value, src) = item
             rel = src.relative_to(from_remote.path_info)
-            dst = to_remote.path_info / rel
-            key = dst.parent
-            # check if any build cache already exists for this key
-            if to_remote.fs.exists(key) and first(
-                to_remote.fs.walk_files(key)
-            ):
-                continue
-            func(src, dst)
-            ret.append((src.parent.name, src.name))
+            return key, value, func(src, to_remote.path_info / rel)
 
+        ret = []
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for key, value, failed in executor.imap_unordered(
+                transfer_entry, missing.items()
+            ):
+                if not failed:
+                    ret.append((key, value))
         return ret
 
-    def push(self, remote: Optional[str]):
+    def push(self, remote: Optional[str], jobs: Optional[int] = None):
         from dvc.objects.transfer import _log_exceptions
 
         odb = self.repo.cloud.get_remote_odb(remote)
@@ -239,9 +289,10 @@ class StageCache:
             _log_exceptions(odb.fs.upload),
             self.repo.odb.local,
             odb,
+            jobs or odb.fs.jobs,
         )
 
-    def pull(self, remote: Optional[str]):
+    def pull(self, remote: Optional[str], jobs: Optional[int] = None):
         from dvc.objects.transfer import _log_exceptions
 
         odb = self.repo.cloud.get_remote_odb(remote)
@@ -249,6 +300,7 @@ class StageCache:
             _log_exceptions(odb.fs.download),
             odb,
             self.repo.odb.local,
+            jobs or odb.fs.jobs,
         )
 
     def get_used_objs(self, used_run_cache, *args, **kwargs):
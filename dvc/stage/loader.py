@@ -1,4 +1,5 @@
 import logging
+import os
 from collections.abc import Mapping
 from copy import deepcopy
 from itertools import chain
@@ -6,8 +7,15 @@ from itertools import chain
 from funcy import cached_property, get_in, lcat, once, project
 
 from dvc import dependency, output
+from dvc.exceptions import DvcException
 from dvc.hash_info import HashInfo
-from dvc.parsing import FOREACH_KWD, JOIN, DataResolver, EntryNotFound
+from dvc.parsing import (
+    FOREACH_KWD,
+    JOIN,
+    DataResolver,
+    EntryNotFound,
+    ResolvedData,
+)
 from dvc.parsing.versions import LOCKFILE_VERSION
 from dvc.path_info import PathInfo
 
@@ -36,7 +44,27 @@ class StageLoader(Mapping):
     @cached_property
     def resolver(self):
         wdir = PathInfo(self.dvcfile.path).parent
-        return DataResolver(self.repo, wdir, self.data)
+        cache = self.dvcfile.metafile_cache
+        if not cache:
+            return DataResolver(self.repo, wdir, self.data)
+
+        key = f"resolve:{os.path.abspath(self.dvcfile.path)}"
+        cached = cache.get(key)
+        if cached is not None:
+            return ResolvedData(*cached)
+
+        resolver = DataResolver(self.repo, wdir, self.data)
+        try:
+            resolved = ResolvedData.from_resolver(resolver)
+        except DvcException:
+            # errors are reported when the failing stage is being loaded
+            return resolver
+        cache.set(
+            key,
+            [self.dvcfile.path, *resolver.imports],
+            (resolved.stages, resolved.tracked_vars),
+        )
+        return resolved
 
     @cached_property
     def lockfile_data(self):
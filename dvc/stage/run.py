@@ -14,6 +14,9 @@ from .exceptions import StageCmdFailedError
 
 logger = logging.getLogger(__name__)
 
+# keeps output of commands that are run concurrently from being interleaved
+_output_lock = threading.Lock()
+
 
 def _make_cmd(executable, cmd):
     if executable is None:
@@ -94,9 +97,12 @@ def _run(stage, executable, cmd, checkpoint_func, **kwargs):
 
         if tasks:
             with Monitor(tasks):
-                p.communicate()
+                output, _ = p.communicate()
         else:
-            p.communicate()
+            output, _ = p.communicate()
+
+        if output:
+            _write_output(stage, output)
 
         if p.returncode != 0:
             for t in tasks:
@@ -108,6 +114,14 @@ def _run(stage, executable, cmd, checkpoint_func, **kwargs):
             signal.signal(signal.SIGINT, old_handler)
 
 
+def _write_output(stage, output):
+    from dvc.ui import ui
+
+    with _output_lock:
+        ui.write(f"Output of stage '{stage.addressing}':")
+        ui.write(output.decode(errors="replace"), end="")
+
+
 def _get_monitor_tasks(stage, checkpoint_func, proc):
 
     result = []
@@ -125,12 +139,16 @@ def _get_monitor_tasks(stage, checkpoint_func, proc):
     return result
 
 
-def cmd_run(stage, dry=False, checkpoint_func=None, run_env=None):
+def cmd_run(
+    stage, dry=False, checkpoint_func=None, run_env=None, capture_output=False
+):
     logger.info("Running stage '%s':", stage.addressing)
     commands = _enforce_cmd_list(stage.cmd)
     kwargs = prepare_kwargs(
         stage, checkpoint_func=checkpoint_func, run_env=run_env
     )
+    if capture_output:
+        kwargs.update(stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     executable = get_executable()
 
     if not dry:
@@ -145,7 +163,14 @@ def cmd_run(stage, dry=False, checkpoint_func=None, run_env=None):
 
 
 def run_stage(
-    stage, dry=False, force=False, checkpoint_func=None, run_env=None, **kwargs
+    stage,
+    dry=False,
+    force=False,
+    checkpoint_func=None,
+    run_env=None,
+    capture_output=False,
+    unlock_repo=True,
+    **kwargs,
 ):
     if not (dry or force or checkpoint_func):
         from .cache import RunCacheNotFoundError
@@ -156,5 +181,13 @@ def run_stage(
         except RunCacheNotFoundError:
             stage.save_deps()
 
-    run = cmd_run if dry else unlocked_repo(cmd_run)
-    run(stage, dry=dry, checkpoint_func=checkpoint_func, run_env=run_env)
+    # NOTE: stages that are run concurrently share the repo lock, so it
+    # can't be released while running their commands
+    run = cmd_run if dry or not unlock_repo else unlocked_repo(cmd_run)
+    run(
+        stage,
+        dry=dry,
+        checkpoint_func=checkpoint_func,
+        run_env=run_env,
+        capture_output=capture_output,
+    )
@@ -1,13 +1,24 @@
 """Manages state database used for checksum caching."""
 
+import errno
+import json
 import logging
 import os
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 from dvc.fs.local import LocalFileSystem
 from dvc.hash_info import HashInfo
-from dvc.utils import relpath
-from dvc.utils.fs import get_inode, get_mtime_and_size, remove
+from dvc.utils import bytes_hash, dict_md5, relpath
+from dvc.utils.fs import (
+    get_file_mtime_and_size,
+    get_inode,
+    get_mtime_and_size,
+    remove,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +33,15 @@ class StateBase(ABC):
         pass
 
     @abstractmethod
-    def get(self, path_info, fs):
+    def get(self, path_info, fs, chunked=False):
+        pass
+
+    @abstractmethod
+    def save_many(self, entries, fs, infos=None):
+        pass
+
+    @abstractmethod
+    def get_many(self, path_infos, fs, infos=None, chunked=False):
         pass
 
     @abstractmethod
@@ -37,36 +56,394 @@ class StateNoop(StateBase):
     def save(self, path_info, fs, hash_info):
         pass
 
-    def get(self, path_info, fs):  # pylint: disable=unused-argument
+    def get(
+        self, path_info, fs, chunked=False
+    ):  # pylint: disable=unused-argument
         return None
 
+    def save_many(self, entries, fs, infos=None):
+        pass
+
+    def get_many(
+        self, path_infos, fs, infos=None, chunked=False
+    ):  # pylint: disable=unused-argument
+        for path_info in path_infos:
+            yield path_info, None
+
     def save_link(self, path_info, fs):
         pass
 
 
+class Links:
+    """Read-only view over the links table of the state database."""
+
+    def __init__(self, state):
+        self.state = state
+
+    def __len__(self):
+        with self.state.transaction() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM links").fetchone()
+        return count
+
+    def __iter__(self):
+        with self.state.transaction() as conn:
+            rows = conn.execute("SELECT path FROM links").fetchall()
+        return (path for (path,) in rows)
+
+    def items(self):
+        with self.state.transaction() as conn:
+            rows = conn.execute("SELECT path, inode, mtime FROM links")
+            rows = rows.fetchall()
+        return (
+            (path, (self.state.from_sqlite(inode), mtime))
+            for path, inode, mtime in rows
+        )
+
+
 class State(StateBase):  # pylint: disable=too-many-instance-attributes
-    def __init__(self, root_dir=None, tmp_dir=None, dvcignore=None):
-        from diskcache import Cache
+    """Hash cache stored in a single SQLite database.
+
+    Entries are keyed by inode and are only considered valid as long as
+    the (mtime, size) pair recorded alongside them still matches the file.
+    The database is opened in WAL mode, so that readers (e.g. another dvc
+    process running `status`) don't block on a writer and vice versa, and
+    all writes are meant to go through `save_many` in batches, so that
+    hashing a large directory doesn't result in a transaction per file.
+
+    Directory listings are stored in the database as well, so that
+    computing the (mtime, size) fingerprint of a directory doesn't need to
+    re-list and re-filter (with dvcignore) the subdirectories that haven't
+    changed since the last time. Files still need to be stat'ed, as
+    modifying a file doesn't change the mtime of its parent directory.
+
+    Chunked file hashes (see `dvc.objects.chunked`) are kept apart from the
+    md5s, as the same file has both and only the md5 is a hash of the file
+    contents.
+
+    Hashes and directory listings are evicted least recently used first,
+    once there are more than `MAX_ENTRIES` of them. Their access times are
+    only updated on `close`, so that reading doesn't write to the database
+    (a read transaction can't be upgraded to a write one in WAL mode, once
+    another connection has written in the meantime).
+    """
+
+    STATE_FILE = "state.db"
+    SCHEMA_VERSION = 4
+    MAX_ENTRIES = 10 ** 7
+    # tables with evictable entries, by their keys
+    TABLES = (("md5s", "inode"), ("chunked", "inode"), ("dirs", "path"))
+    # sqlite's INTEGER is a signed 64-bit int, while inodes are unsigned
+    MAX_INT = 2 ** 63 - 1
+    TIMEOUT = 30  # seconds to wait for a lock held by another process
+    # sqlite's default SQLITE_MAX_VARIABLE_NUMBER on older versions
+    MAX_VARIABLES = 999
+    # directories modified less than this long ago are not cached, as their
+    # entries could still change without updating the mtime (e.g. on
+    # filesystems with coarse timestamps)
+    RACY_WINDOW_NS = 2 * 10 ** 9
 
+    def __init__(self, root_dir=None, tmp_dir=None, dvcignore=None):
         super().__init__()
 
         self.tmp_dir = tmp_dir
         self.root_dir = root_dir
         self.dvcignore = dvcignore
 
+        self._conn = None
+        self._lock = threading.RLock()
+        # access times and numbers of added entries, which are written on
+        # `close`, by table
+        self._atimes = {table: {} for table, _ in self.TABLES}
+        self._added = {table: 0 for table, _ in self.TABLES}
+
         if not tmp_dir:
             return
 
-        config = {
-            "eviction_policy": "least-recently-used",
-            "disk_pickle_protocol": 4,
-        }
-        self.links = Cache(directory=os.path.join(tmp_dir, "links"), **config)
-        self.md5s = Cache(directory=os.path.join(tmp_dir, "md5s"), **config)
+        self.state_file = os.path.join(tmp_dir, self.STATE_FILE)
+        self.links = Links(self)
+
+    @classmethod
+    def to_sqlite(cls, num):
+        assert num >= 0
+        assert num < 2 ** 64
+        if num > cls.MAX_INT:
+            return cls.MAX_INT - num
+        return num
+
+    @classmethod
+    def from_sqlite(cls, num):
+        if num < 0:
+            return cls.MAX_INT - num
+        return num
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.state_file,
+            timeout=self.TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != self.SCHEMA_VERSION:
+            for table in ("md5s", "chunked", "links", "dirs", "counts"):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        for table in ("md5s", "chunked"):
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "inode INTEGER PRIMARY KEY, "
+                "mtime TEXT NOT NULL, "
+                "size TEXT NOT NULL, "
+                "md5 TEXT NOT NULL, "
+                "atime REAL NOT NULL)"
+            )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS links ("
+            "path TEXT PRIMARY KEY, "
+            "inode INTEGER NOT NULL, "
+            "mtime TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            "path TEXT PRIMARY KEY, "
+            "mtime TEXT NOT NULL, "
+            "ignore TEXT NOT NULL, "
+            "listing TEXT NOT NULL, "
+            "atime REAL NOT NULL)"
+        )
+        for table, _ in self.TABLES:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_atime ON {table}(atime)"
+            )
+        # NOTE: upper bounds of the numbers of entries, so that tables only
+        # need to be counted once they might have to be evicted from
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS counts ("
+            "name TEXT PRIMARY KEY, "
+            "count INTEGER NOT NULL)"
+        )
+        return conn
+
+    @contextmanager
+    def transaction(self, write=False):
+        """Yield a connection with an open transaction.
+
+        The transaction is committed on exit or rolled back on error. Access
+        to the connection is serialized, since it is shared by the hashing
+        worker threads.
+
+        Transactions which are going to `write` take the write lock right
+        away, waiting for other writers for up to `TIMEOUT` seconds, as
+        (deferred) read transactions can't be upgraded in WAL mode once the
+        database has been written to by another connection.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def close(self):
-        self.md5s.close()
-        self.links.close()
+        with self._lock:
+            if self._conn is None:
+                return
+            if any(self._atimes.values()) or any(self._added.values()):
+                with self.transaction(write=True) as conn:
+                    self._flush(conn)
+            self._conn.close()
+            self._conn = None
+
+    def _flush(self, conn):
+        for table, key in self.TABLES:
+            atimes, self._atimes[table] = self._atimes[table], {}
+            added, self._added[table] = self._added[table], 0
+            conn.executemany(
+                f"UPDATE {table} SET atime = max(atime, ?) WHERE {key} = ?",
+                [(atime, value) for value, atime in atimes.items()],
+            )
+            if not added:
+                continue
+            conn.execute(
+                "INSERT OR IGNORE INTO counts(name, count) VALUES (?, 0)",
+                (table,),
+            )
+            conn.execute(
+                "UPDATE counts SET count = count + ? WHERE name = ?",
+                (added, table),
+            )
+            (count,) = conn.execute(
+                "SELECT count FROM counts WHERE name = ?", (table,)
+            ).fetchone()
+            if count > self.MAX_ENTRIES:
+                self._evict(conn, table, key)
+
+    def _evict(self, conn, table, key):
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        # NOTE: evict a bit more than needed, so that the table doesn't
+        # need to be counted again right after the next few additions
+        keep = self.MAX_ENTRIES - self.MAX_ENTRIES // 10
+        if count > self.MAX_ENTRIES:
+            logger.debug(
+                "evicting %d entries from state '%s'", count - keep, table
+            )
+            conn.execute(
+                f"DELETE FROM {table} WHERE {key} IN "
+                f"(SELECT {key} FROM {table} ORDER BY atime LIMIT ?)",
+                (count - keep,),
+            )
+            count = keep
+        conn.execute(
+            "UPDATE counts SET count = ? WHERE name = ?", (count, table)
+        )
+
+    def _ignore_fingerprint(self, dirname, dnames):
+        if not self.dvcignore:
+            return ""
+        # pylint: disable=protected-access
+        pattern = self.dvcignore._get_trie_pattern(dirname, dnames=dnames)
+        if not pattern:
+            return ""
+        return bytes_hash(
+            f"{pattern.dirname}:{pattern.pattern_list}".encode("utf-8"), "md5"
+        )
+
+    def _list_dir(self, dirname, mtime, cached):
+        """List `dirname` the same way `os.walk` + dvcignore would.
+
+        The raw listing stored in the state database is reused if the
+        directory hasn't changed, and the filtered one if the dvcignore
+        patterns that apply to it haven't changed either. Returns a tuple of
+        (listing, ignore_fingerprint, changed).
+        """
+        if cached and cached[0] == mtime:
+            listing = json.loads(cached[2])
+        else:
+            listing = {"dirs": [], "links": [], "files": []}
+            with os.scandir(dirname) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        listing["files"].append(entry.name)
+                        continue
+                    listing["dirs"].append(entry.name)
+                    if entry.is_symlink():
+                        listing["links"].append(entry.name)
+
+        ignore = self._ignore_fingerprint(dirname, listing["dirs"])
+        if cached and cached[0] == mtime and cached[1] == ignore:
+            return listing, ignore, False
+
+        dirs, files = listing["dirs"], listing["files"]
+        if self.dvcignore:
+            dirs, files = self.dvcignore(dirname, dirs, files)
+        listing["walk_dirs"] = [d for d in dirs if d not in listing["links"]]
+        listing["walk_files"] = files
+        return listing, ignore, True
+
+    def _walk_files(self, top):
+        """Yield all (non-ignored) files under `top`.
+
+        Equivalent to `dvcignore.walk_files`, but using the directory
+        listings cached in the state database.
+        """
+        top = os.path.abspath(top)
+        prefix = os.path.join(top, "")
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "SELECT path, mtime, ignore, listing FROM dirs "
+                "WHERE path = ? OR (path >= ? AND path < ?)",
+                (top, prefix, prefix[:-1] + chr(ord(os.sep) + 1)),
+            ).fetchall()
+        cached = {row[0]: row[1:] for row in rows}
+
+        atime = time.time()
+        changed = []
+        visited = set()
+        racy_after = time.time() * 10 ** 9 - self.RACY_WINDOW_NS
+        stack = [top]
+        while stack:
+            dirname = stack.pop()
+            try:
+                mtime_ns = os.stat(dirname).st_mtime_ns
+                mtime = str(mtime_ns)
+                listing, ignore, listed = self._list_dir(
+                    dirname, mtime, cached.get(dirname)
+                )
+            except OSError:
+                # NOTE: same as os.walk, which ignores errors by default
+                continue
+
+            if dirname in cached:
+                visited.add(dirname)
+            if listed and mtime_ns < racy_after:
+                changed.append(
+                    (dirname, mtime, ignore, json.dumps(listing), atime)
+                )
+
+            for name in listing["walk_files"]:
+                # NOTE: os.path.join is ~5.5 times slower
+                yield f"{dirname}{os.sep}{name}"
+            for name in reversed(listing["walk_dirs"]):
+                stack.append(f"{dirname}{os.sep}{name}")
+
+        stale = [(path,) for path in cached if path not in visited]
+        with self._lock:
+            # NOTE: entries are evicted least recently used first
+            self._atimes["dirs"].update((path, atime) for path in visited)
+        if not (changed or stale):
+            return
+        with self.transaction(write=True) as conn:
+            conn.executemany("DELETE FROM dirs WHERE path = ?", stale)
+            conn.executemany(
+                "REPLACE INTO dirs(path, mtime, ignore, listing, atime) "
+                "VALUES (?, ?, ?, ?, ?)",
+                changed,
+            )
+            self._added["dirs"] += len(changed)
+
+    def _get_dir_mtime_and_size(self, path_info, fs):
+        size = 0
+        files_mtimes = {}
+        for file_path in self._walk_files(path_info):
+            try:
+                # NOTE: same size/mtime as `fs.info()`, which follows
+                # symlinks, but with a single syscall
+                stats = os.stat(file_path)
+            except OSError as exc:
+                # NOTE: broken symlink case.
+                if exc.errno != errno.ENOENT:
+                    raise
+                continue
+            size += stats.st_size
+            files_mtimes[file_path] = stats.st_mtime
+
+        # NOTE: same fingerprint as `get_mtime_and_size`
+        return str(dict_md5(files_mtimes)), size
+
+    def get_mtime_and_size(self, path_info, fs):
+        if fs.isdir(path_info):
+            return self._get_dir_mtime_and_size(path_info, fs)
+        return get_mtime_and_size(path_info, fs, self.dvcignore)
+
+    def _stat(self, path_info, fs, info=None):
+        if info and "ino" in info:
+            mtime, size = get_file_mtime_and_size(info)
+            return info["ino"], mtime, size
+
+        mtime, size = self.get_mtime_and_size(path_info, fs)
+        inode = get_inode(path_info)
+        return inode, mtime, size
 
     def save(self, path_info, fs, hash_info):
         """Save hash for the specified path info.
@@ -75,50 +452,135 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
             path_info (dict): path_info to save hash for.
             hash_info (HashInfo): hash to save.
         """
+        self.save_many([(path_info, hash_info)], fs)
 
+    def save_many(self, entries, fs, infos=None):
+        """Save hashes for multiple path infos in a single transaction.
+
+        Args:
+            entries (iterable): (path_info, hash_info) pairs to save.
+            infos (dict): optional mapping of path infos to the file info
+                (with inode) obtained while walking, so that these files
+                don't need to be stat'ed again.
+        """
         if not isinstance(fs, LocalFileSystem):
             return
 
-        mtime, size = get_mtime_and_size(path_info, fs, self.dvcignore)
-        inode = get_inode(path_info)
-
-        logger.debug(
-            "state save (%s, %s, %s) %s",
-            inode,
-            mtime,
-            str(size),
-            hash_info.value,
-        )
-
-        self.md5s[inode] = (mtime, str(size), hash_info.value)
+        infos = infos or {}
+        rows = []
+        chunked_rows = []
+        for path_info, hash_info in entries:
+            inode, mtime, size = self._stat(
+                path_info, fs, infos.get(path_info)
+            )
+            logger.debug(
+                "state save (%s, %s, %s) %s",
+                inode,
+                mtime,
+                str(size),
+                hash_info.value,
+            )
+            row = (
+                self.to_sqlite(inode),
+                mtime,
+                str(size),
+                hash_info.value,
+                time.time(),
+            )
+            if hash_info.ischunked:
+                chunked_rows.append(row)
+            else:
+                rows.append(row)
+
+        if not (rows or chunked_rows):
+            return
 
-    def get(self, path_info, fs):
+        with self.transaction(write=True) as conn:
+            for table, table_rows in (
+                ("md5s", rows),
+                ("chunked", chunked_rows),
+            ):
+                conn.executemany(
+                    f"REPLACE INTO {table}(inode, mtime, size, md5, atime) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    table_rows,
+                )
+                # NOTE: replaced entries are counted too, see `_connect`
+                self._added[table] += len(table_rows)
+
+    def get(self, path_info, fs, chunked=False):
         """Gets the hash for the specified path info. Hash will be
         retrieved from the state database if available.
 
         Args:
             path_info (dict): path info to get the hash for.
+            chunked (bool): get the chunked file hash rather than the md5.
 
         Returns:
             HashInfo or None: hash for the specified path info or None if it
             doesn't exist in the state database.
         """
-        if not isinstance(fs, LocalFileSystem):
-            return None
+        ((_, hash_info),) = self.get_many([path_info], fs, chunked=chunked)
+        return hash_info
 
-        try:
-            mtime, size = get_mtime_and_size(path_info, fs, self.dvcignore)
-        except FileNotFoundError:
-            return None
+    def get_many(self, path_infos, fs, infos=None, chunked=False):
+        """Gets the hashes for multiple path infos at once.
 
-        inode = get_inode(path_info)
-
-        value = self.md5s.get(inode)
-
-        if not value or value[0] != mtime or value[1] != str(size):
-            return None
+        Args:
+            path_infos (iterable): path infos to get the hashes for.
+            infos (dict): optional mapping of path infos to their file info,
+                see `save_many`.
+            chunked (bool): see `get`.
+
+        Yields:
+            (path_info, hash_info) pairs, where hash_info is None for paths
+            that don't have a valid entry in the state database.
+        """
+        if not isinstance(fs, LocalFileSystem):
+            for path_info in path_infos:
+                yield path_info, None
+            return
 
-        return HashInfo("md5", value[2], size=size)
+        infos = infos or {}
+        stats = []
+        for path_info in path_infos:
+            try:
+                stat = self._stat(path_info, fs, infos.get(path_info))
+                stats.append((path_info, stat))
+            except FileNotFoundError:
+                stats.append((path_info, None))
+
+        table = "chunked" if chunked else "md5s"
+        inodes = [self.to_sqlite(stat[0]) for _, stat in stats if stat]
+        found = {}
+        with self.transaction() as conn:
+            for i in range(0, len(inodes), self.MAX_VARIABLES):
+                chunk = inodes[i : i + self.MAX_VARIABLES]
+                cursor = conn.execute(
+                    f"SELECT inode, mtime, size, md5 FROM {table} "
+                    "WHERE inode IN ({})".format(",".join("?" * len(chunk))),
+                    chunk,
+                )
+                for inode, mtime, size, md5 in cursor:
+                    found[self.from_sqlite(inode)] = (mtime, size, md5)
+            # NOTE: entries are evicted least recently used first
+            atime = time.time()
+            self._atimes[table].update(
+                (self.to_sqlite(inode), atime) for inode in found
+            )
+
+        for path_info, stat in stats:
+            if not stat:
+                yield path_info, None
+                continue
+
+            inode, mtime, size = stat
+            value = found.get(inode)
+            if not value or value[0] != mtime or value[1] != str(size):
+                yield path_info, None
+                continue
+
+            yield path_info, HashInfo("md5", value[2], size=size)
 
     def save_link(self, path_info, fs):
         """Adds the specified path to the list of links created by dvc. This
@@ -131,15 +593,18 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
             return
 
         try:
-            mtime, _ = get_mtime_and_size(path_info, fs, self.dvcignore)
+            mtime, _ = self.get_mtime_and_size(path_info, fs)
         except FileNotFoundError:
             return
 
         inode = get_inode(path_info)
         relative_path = relpath(path_info, self.root_dir)
 
-        with self.links as ref:
-            ref[relative_path] = (inode, mtime)
+        with self.transaction(write=True) as conn:
+            conn.execute(
+                "REPLACE INTO links(path, inode, mtime) VALUES (?, ?, ?)",
+                (relative_path, self.to_sqlite(inode), mtime),
+            )
 
     def get_unused_links(self, used, fs):
         """Removes all saved links except the ones that are used.
@@ -152,19 +617,18 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
 
         unused = []
 
-        with self.links as ref:
-            for relative_path in ref:
-                path = os.path.join(self.root_dir, relative_path)
+        for relative_path, entry in self.links.items():
+            path = os.path.join(self.root_dir, relative_path)
 
-                if path in used or not fs.exists(path):
-                    continue
+            if path in used or not fs.exists(path):
+                continue
 
-                inode = get_inode(path)
-                mtime, _ = get_mtime_and_size(path, fs, self.dvcignore)
+            inode = get_inode(path)
+            mtime, _ = self.get_mtime_and_size(path, fs)
 
-                if ref[relative_path] == (inode, mtime):
-                    logger.debug("Removing '%s' as unused link.", path)
-                    unused.append(relative_path)
+            if entry == (inode, mtime):
+                logger.debug("Removing '%s' as unused link.", path)
+                unused.append(relative_path)
 
         return unused
 
@@ -175,6 +639,8 @@ class State(StateBase):  # pylint: disable=too-many-instance-attributes
         for path in unused:
             remove(os.path.join(self.root_dir, path))
 
-        with self.links as ref:
-            for path in unused:
-                del ref[path]
+        with self.transaction(write=True) as conn:
+            conn.executemany(
+                "DELETE FROM links WHERE path = ?",
+                [(path,) for path in unused],
+            )
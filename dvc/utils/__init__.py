@@ -1,14 +1,17 @@
 """Helpers for other modules."""
 
+import errno
 import hashlib
 import json
 import logging
 import math
+import mmap
 import os
 import re
 import stat
 import sys
 import time
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
 import colorama
@@ -18,6 +21,9 @@ logger = logging.getLogger(__name__)
 LOCAL_CHUNK_SIZE = 2 ** 20  # 1 MB
 LARGE_FILE_SIZE = 2 ** 30  # 1 GB
 LARGE_DIR_SIZE = 100
+# files larger than this are read ahead in a background thread while hashing
+READAHEAD_FILE_SIZE = 2 ** 26  # 64 MB
+READAHEAD_MAX_DEPTH = 16
 TARGET_REGEX = re.compile(r"(?P<path>.*?)(:(?P<name>[^\\/:]*))??$")
 
 
@@ -25,30 +31,122 @@ def dos2unix(data):
     return data.replace(b"\r\n", b"\n")
 
 
-def _fobj_md5(fobj, hash_md5, binary, progress_func=None):
-    while True:
-        data = fobj.read(LOCAL_CHUNK_SIZE)
-        if not data:
-            break
+def update_dos2unix(hasher, data, start=0, end=None):
+    """Update `hasher` with `dos2unix(data[start:end])`, without copying the
+    data, by hashing the slices in between CRLF line endings.
 
+    Returns the length of the normalized data.
+    """
+    if end is None:
+        end = len(data)
+    length = 0
+    with memoryview(data) as view:
+        while start < end:
+            crlf = data.find(b"\r\n", start, end)
+            if crlf == -1:
+                crlf = end
+            # NOTE: "\r" is left out, "\n" is the start of the next slice
+            hasher.update(view[start:crlf])
+            length += crlf - start
+            start = crlf + 1
+    return length
+
+
+def _readahead_depth(size):
+    """Number of chunks to keep in flight when hashing a file of `size`.
+
+    Small files are read synchronously, while larger files get deeper
+    read-ahead queues, so that I/O overlaps with hashing.
+    """
+    if size < READAHEAD_FILE_SIZE:
+        return 0
+    return min(READAHEAD_MAX_DEPTH, max(2, size // READAHEAD_FILE_SIZE))
+
+
+def _fobj_md5(fobj, hash_md5, binary, progress_func=None, readahead_depth=0):
+    if readahead_depth:
+        from dvc.utils.stream import readahead
+
+        chunks = readahead(fobj, LOCAL_CHUNK_SIZE, depth=readahead_depth)
+    else:
+        chunks = iter(partial(fobj.read, LOCAL_CHUNK_SIZE), b"")
+
+    for data in chunks:
         if binary:
-            chunk = data
+            hash_md5.update(data)
         else:
-            chunk = dos2unix(data)
-
-        hash_md5.update(chunk)
+            update_dos2unix(hash_md5, data)
         if progress_func:
             progress_func(len(data))
 
 
-def file_md5(fname, fs):
+def _madvise(mm, advice, *args):
+    # NOTE: mmap.madvise is only available on Python 3.8+ and the advice
+    # constants are platform-specific.
+    advice = getattr(mmap, advice, None)
+    if advice is None or not hasattr(mm, "madvise"):
+        return
+    try:
+        mm.madvise(advice, *args)
+    except (OSError, ValueError):
+        pass
+
+
+def _mmap_md5(mm, fd, size, hash_md5, progress_func=None, readahead_depth=0):
+    """Hash a memory-mapped file.
+
+    Text detection looks at the first block of the same mapping, and CRLF
+    line endings are normalized by hashing the slices of the mapping in
+    between them. Chunk boundaries are the same as in `_fobj_md5`, so the
+    resulting hashes are identical.
+    """
+    from dvc.istextfile import DEFAULT_CHUNK_SIZE, istextblock
+
+    _madvise(mm, "MADV_SEQUENTIAL")
+    binary = not istextblock(mm[:DEFAULT_CHUNK_SIZE])
+    with memoryview(mm) as view:
+        for pos in range(0, size, LOCAL_CHUNK_SIZE):
+            end = min(pos + LOCAL_CHUNK_SIZE, size)
+            ahead = end + (readahead_depth - 1) * LOCAL_CHUNK_SIZE
+            if readahead_depth and ahead < size:
+                _madvise(mm, "MADV_WILLNEED", ahead, LOCAL_CHUNK_SIZE)
+
+            # NOTE: accessing pages past the end of a truncated file would
+            # crash with SIGBUS, which can't be handled.
+            if os.fstat(fd).st_size < end:
+                raise OSError(errno.EIO, "file was truncated while hashing")
+
+            if binary:
+                hash_md5.update(view[pos:end])
+            else:
+                update_dos2unix(hash_md5, mm, pos, end)
+
+            if progress_func:
+                progress_func(end - pos)
+
+
+def _is_read_only(fname):
+    # NOTE: only files that aren't meant to be modified (i.e. protected
+    # cache files) are memory-mapped, since a file that is truncated while
+    # it is being hashed would make the process crash (see `_mmap_md5`),
+    # rather than just result in a wrong hash like reading it would.
+    try:
+        mode = os.stat(fname).st_mode
+    except OSError:
+        return False
+    return not mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def file_md5(fname, fs, size=None):
     """get the (md5 hexdigest, md5 digest) of a file"""
+    from dvc.fs.local import LocalFileSystem
     from dvc.istextfile import istextfile
     from dvc.progress import Tqdm
 
     hash_md5 = hashlib.md5()
-    binary = not istextfile(fname, fs=fs)
-    size = fs.getsize(fname) or 0
+    if size is None:
+        size = fs.getsize(fname)
+    size = size or 0
     no_progress_bar = True
     if size >= LARGE_FILE_SIZE:
         no_progress_bar = False
@@ -65,8 +163,36 @@ def file_md5(fname, fs):
         bytes=True,
         leave=False,
     ) as pbar:
+        if isinstance(fs, LocalFileSystem) and size and _is_read_only(fname):
+            try:
+                with open(fname, "rb") as fobj, mmap.mmap(
+                    fobj.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    _mmap_md5(
+                        mm,
+                        fobj.fileno(),
+                        len(mm),
+                        hash_md5,
+                        pbar.update,
+                        readahead_depth=_readahead_depth(size),
+                    )
+                return hash_md5.hexdigest()
+            except (OSError, ValueError):
+                # NOTE: not every file can be memory-mapped (e.g. on some
+                # network or FUSE filesystems), fall back to reading it.
+                logger.trace("failed to mmap '%s'", fname, exc_info=True)
+                hash_md5 = hashlib.md5()
+                pbar.reset()
+
+        binary = not istextfile(fname, fs=fs)
         with fs.open(fname, "rb") as fobj:
-            _fobj_md5(fobj, hash_md5, binary, pbar.update)
+            _fobj_md5(
+                fobj,
+                hash_md5,
+                binary,
+                pbar.update,
+                readahead_depth=_readahead_depth(size),
+            )
 
     return hash_md5.hexdigest()
 
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 LOCAL_CHUNK_SIZE = 2 ** 20  # 1 MB
+# in-kernel copies are done in ranges of this size to report progress
+KERNEL_COPY_CHUNK_SIZE = 2 ** 24  # 16 MB
 
 umask = os.umask(0)
 os.umask(umask)
@@ -35,9 +37,14 @@ def get_inode(path):
     return inode
 
 
-def get_mtime_and_size(path, fs, dvcignore=None):
+def get_file_mtime_and_size(info):
+    """Return state (mtime, size) of a file from its `fs.info()`."""
     import nanotime
 
+    return str(int(nanotime.timestamp(info["mtime"]))), info["size"]
+
+
+def get_mtime_and_size(path, fs, dvcignore=None):
     if fs.isdir(path):
         size = 0
         files_mtimes = {}
@@ -60,10 +67,7 @@ def get_mtime_and_size(path, fs, dvcignore=None):
         # max(mtime(f) for f in non_ignored_files)
         mtime = dict_md5(files_mtimes)
     else:
-        base_stat = fs.info(path)
-        size = base_stat["size"]
-        mtime = base_stat["mtime"]
-        mtime = int(nanotime.timestamp(mtime))
+        mtime, size = get_file_mtime_and_size(fs.info(path))
 
     return str(mtime), size
 
@@ -193,6 +197,111 @@ def makedirs(path, exist_ok=False, mode=None):
         logger.trace("failed to chmod '%o' '%s'", mode, path, exc_info=True)
 
 
+def _copy_file_range(src_fd, dest_fd, src_offset, dest_offset, count):
+    return os.copy_file_range(  # pylint: disable=no-member
+        src_fd, dest_fd, count, src_offset, dest_offset
+    )
+
+
+def _sendfile(src_fd, dest_fd, src_offset, dest_offset, count):
+    # NOTE: sendfile writes at the current offset of the destination
+    os.lseek(dest_fd, dest_offset, os.SEEK_SET)
+    return os.sendfile(dest_fd, src_fd, src_offset, count)
+
+
+def _kernel_copy_methods():
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(_copy_file_range)
+    # sendfile only supports copying between files on Linux
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        methods.append(_sendfile)
+    return methods
+
+
+def kernel_copy(
+    src_fd, dest_fd, count, src_offset=0, dest_offset=0, update=None
+):
+    """Copy `count` bytes between file descriptors (at the given offsets)
+    without reading them into userspace, with copy_file_range(2) or
+    sendfile(2).
+
+    It avoids copying the data through Python buffers, and could even be
+    done on the server side (e.g. on NFS 4.2) or by sharing the blocks
+    (e.g. on XFS or Btrfs).
+
+    Returns the number of bytes copied, which is less than `count` if
+    neither of them is supported for these files, so that the rest could
+    still be copied the usual way.
+    """
+    copied = 0
+    for method in _kernel_copy_methods():
+        try:
+            while copied < count:
+                ret = method(
+                    src_fd,
+                    dest_fd,
+                    src_offset + copied,
+                    dest_offset + copied,
+                    min(KERNEL_COPY_CHUNK_SIZE, count - copied),
+                )
+                if not ret:
+                    # the file was truncated in the meantime
+                    return copied
+                copied += ret
+                if update:
+                    update(ret)
+            return copied
+        except OSError as exc:
+            # NOTE: EBADF is raised by copy_file_range if the destination is
+            # opened with O_APPEND
+            if exc.errno not in (
+                errno.EBADF,
+                errno.ENOSYS,
+                errno.EXDEV,
+                errno.EINVAL,
+                errno.EOPNOTSUPP,
+                errno.ENOTSUP,
+            ):
+                raise
+            logger.trace(  # type: ignore[attr-defined]
+                "'%s' is not supported: %s", method.__name__, exc
+            )
+    return copied
+
+
+def copyfileobj(fsrc, fdest):
+    """Copy the rest of fsrc into fdest, like `shutil.copyfileobj`, but
+    in the kernel if both of them are regular files (see `kernel_copy`).
+    """
+    try:
+        src_fd, dest_fd = fsrc.fileno(), fdest.fileno()
+    except (AttributeError, OSError, ValueError):
+        src_fd = dest_fd = None
+
+    if src_fd is not None and stat.S_ISREG(os.fstat(src_fd).st_mode):
+        fdest.flush()
+        src_offset, dest_offset = fsrc.tell(), fdest.tell()
+        count = os.fstat(src_fd).st_size - src_offset
+        copied = kernel_copy(src_fd, dest_fd, count, src_offset, dest_offset)
+        fsrc.seek(src_offset + copied)
+        fdest.seek(dest_offset + copied)
+
+    shutil.copyfileobj(fsrc, fdest)
+
+
+@contextmanager
+def _copy_progress(total, callback=None, **pbar_kwargs):
+    if callback:
+        yield callback.relative_update
+        return
+
+    from dvc.progress import Tqdm
+
+    with Tqdm(total=total, bytes=True, **pbar_kwargs) as pbar:
+        yield pbar.update
+
+
 def copyfile(src, dest, callback=None, no_progress_bar=False, name=None):
     """Copy file with progress bar"""
     name = name if name else os.path.basename(dest)
@@ -207,22 +316,21 @@ def copyfile(src, dest, callback=None, no_progress_bar=False, name=None):
     try:
         System.reflink(src, dest)
     except DvcException:
-        from dvc.progress import tdqm_or_callback_wrapped
-
         with open(src, "rb") as fsrc, open(dest, "wb+") as fdest:
-            with tdqm_or_callback_wrapped(
-                fdest,
-                "write",
-                total,
-                callback=callback,
-                disable=no_progress_bar,
-                desc=name,
-            ) as wrapped:
+            with _copy_progress(
+                total, callback, disable=no_progress_bar, desc=name
+            ) as update:
+                copied = kernel_copy(
+                    fsrc.fileno(), fdest.fileno(), total, update=update
+                )
+                fsrc.seek(copied)
+                fdest.seek(copied)
                 while True:
                     buf = fsrc.read(LOCAL_CHUNK_SIZE)
                     if not buf:
                         break
-                    wrapped.write(buf)
+                    fdest.write(buf)
+                    update(len(buf))
 
     if callback:
         callback.absolute_update(total)
@@ -1,11 +1,13 @@
 import hashlib
 import io
+import queue
+import threading
 
 from funcy import cached_property
 
 from dvc.hash_info import HashInfo
 from dvc.istextfile import DEFAULT_CHUNK_SIZE, istextblock
-from dvc.utils import dos2unix
+from dvc.utils import update_dos2unix
 
 
 class HashedStreamReader(io.IOBase):
@@ -37,11 +39,10 @@ class HashedStreamReader(io.IOBase):
             self.is_text_file = istextblock(chunk[:DEFAULT_CHUNK_SIZE])
 
         if self.is_text_file:
-            data = dos2unix(chunk)
+            self.total_read += update_dos2unix(self.md5, chunk)
         else:
-            data = chunk
-        self.md5.update(data)
-        self.total_read += len(data)
+            self.md5.update(chunk)
+            self.total_read += len(chunk)
 
         return chunk
 
@@ -50,3 +51,43 @@ class HashedStreamReader(io.IOBase):
         return HashInfo(
             self.PARAM_CHECKSUM, self.md5.hexdigest(), size=self.total_read
         )
+
+
+def readahead(fobj, chunk_size, depth=2):
+    """Iterate over chunks read from `fobj` by a background thread.
+
+    Up to `depth` chunks are read ahead of the consumer, so that reading the
+    next chunks overlaps with processing the current one (e.g. hashing, as
+    `hashlib` releases the GIL for large updates).
+    """
+    chunks: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _read():
+        try:
+            while not stop.is_set():
+                data = fobj.read(chunk_size)
+                chunks.put(data)
+                if not data:
+                    break
+        except BaseException as exc:  # pylint: disable=broad-except
+            chunks.put(exc)
+
+    reader = threading.Thread(target=_read, daemon=True)
+    reader.start()
+    try:
+        while True:
+            data = chunks.get()
+            if isinstance(data, BaseException):
+                raise data
+            if not data:
+                break
+            yield data
+    finally:
+        stop.set()
+        # unblock the reader if it is waiting for a free slot in the queue
+        while reader.is_alive():
+            try:
+                chunks.get_nowait()
+            except queue.Empty:
+                reader.join(0.01)
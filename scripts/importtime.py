@@ -0,0 +1,59 @@
+"""Measure how long it takes to import everything that DVC CLI needs.
+
+Runs `python -X importtime -m dvc <args>` and reports the total import time
+along with the slowest imports, e.g.:
+
+    python scripts/importtime.py --help
+    python scripts/importtime.py --max-ms 300 version
+
+Exits with an error if the total exceeds `--max-ms`, so that it can be used
+to catch regressions in CI.
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def importtime(args):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "dvc", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=False,
+    )
+    imports = []
+    for line in proc.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            imports.append((name, len(indent), int(cumulative)))
+    return imports
+
+
+def main():
+    # `--help` is passed on to dvc
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--max-ms", type=float, help="Maximum total time.")
+    parser.add_argument("--top", type=int, default=15)
+    opts, args = parser.parse_known_args()
+
+    imports = importtime(args)
+    # top level imports (i.e. without indentation) include nested ones
+    total = sum(us for _, level, us in imports if level == 1) / 1000
+    slowest = sorted(imports, key=lambda item: item[2], reverse=True)
+    for name, _, us in slowest[: opts.top]:
+        print(f"{us / 1000:10.1f} ms  {name}")
+    print(f"{total:10.1f} ms  total (dvc {' '.join(args)})")
+
+    if opts.max_ms is not None and total > opts.max_ms:
+        print(f"exceeds {opts.max_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from PyInstaller.utils.hooks import (  # pylint:disable=import-error
+    collect_submodules,
     copy_metadata,
 )
 
@@ -19,3 +20,6 @@ datas += copy_metadata("aiohttp_retry")
 
 # https://github.com/pypa/setuptools/issues/1963
 hiddenimports = ["pkg_resources.py2_warn"]
+
+# commands are imported lazily by `dvc.cli`
+hiddenimports += collect_submodules("dvc.command")
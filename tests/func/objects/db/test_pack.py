@@ -0,0 +1,150 @@
+import hashlib
+import os
+
+from dvc.hash_info import HashInfo
+from dvc.objects.db.pack import INDEX_SUFFIX, PACK_DIR, PACK_SUFFIX
+from dvc.utils.fs import remove
+
+DATA = {f"{i:03}": f"content {i}" for i in range(20)}
+
+
+def _pack_files(path):
+    packs = os.path.join(path, PACK_DIR)
+    if not os.path.exists(packs):
+        return []
+    return sorted(os.listdir(packs))
+
+
+def _loose_files(path):
+    return [
+        os.path.join(root, fname)
+        for root, _, files in os.walk(path)
+        for fname in files
+        if os.path.basename(root) != PACK_DIR
+    ]
+
+
+def test_push_pull_packed(tmp_dir, dvc, local_cloud):
+    tmp_dir.add_remote(config={**local_cloud.config, "pack_threshold": 10})
+    dvc.odb.local.pack_threshold = 10
+    (stage,) = tmp_dir.dvc_gen({"dir": DATA})
+    dir_hash = stage.outs[0].hash_info.value
+
+    assert dvc.push() == len(DATA) + 1
+    (index, pack) = _pack_files(local_cloud.url)
+    assert index.endswith(INDEX_SUFFIX)
+    assert pack.endswith(PACK_SUFFIX)
+    # only the .dir file is stored on its own
+    (loose,) = _loose_files(local_cloud.url)
+    assert loose.endswith(dir_hash[2:])
+
+    assert dvc.status(cloud=True) == {}
+    assert dvc.push() == 0
+
+    remove(dvc.odb.local.cache_dir)
+    remove("dir")
+    dvc.odb.local._packs = None  # pylint: disable=protected-access
+    dvc.pull()
+    assert (tmp_dir / "dir").read_text() == DATA
+    # whole pack is fetched, rather than each object on its own
+    assert _pack_files(dvc.odb.local.cache_dir) == [index, pack]
+
+
+def test_pull_packed_unpacks(tmp_dir, dvc, local_cloud):
+    tmp_dir.add_remote(config={**local_cloud.config, "pack_threshold": 10})
+    tmp_dir.dvc_gen({"dir": DATA})
+    assert dvc.push() == len(DATA) + 1
+
+    remove(dvc.odb.local.cache_dir)
+    remove("dir")
+    dvc.pull()
+    assert (tmp_dir / "dir").read_text() == DATA
+    # packs are not read from the cache without packing enabled
+    assert _pack_files(dvc.odb.local.cache_dir) == []
+    assert len(_loose_files(dvc.odb.local.cache_dir)) == len(DATA) + 1
+
+
+def test_read_packed(tmp_dir, scm, dvc, local_cloud):
+    from dvc import api
+
+    tmp_dir.add_remote(config={**local_cloud.config, "pack_threshold": 2})
+    dvc.odb.local.pack_threshold = 2
+    tmp_dir.dvc_gen({"dir": DATA}, commit="add dir")
+    dvc.push()
+
+    remove(dvc.odb.local.cache_dir)
+    dvc.odb.local._packs = None  # pylint: disable=protected-access
+    dvc.pull()
+    assert _pack_files(dvc.odb.local.cache_dir)
+    remove("dir")
+    assert api.read(os.path.join("dir", "001")) == DATA["001"]
+
+    # straight from the remote
+    remove(dvc.odb.local.cache_dir)
+    assert api.read(os.path.join("dir", "002")) == DATA["002"]
+
+
+def test_packs_found_without_threshold(tmp_dir, dvc, local_cloud):
+    tmp_dir.add_remote(config={**local_cloud.config, "pack_threshold": 10})
+    tmp_dir.dvc_gen({"dir": DATA})
+    dvc.push()
+    assert _pack_files(local_cloud.url)
+
+    # a client which doesn't pack itself still sees the packed objects
+    tmp_dir.add_remote(config=local_cloud.config)
+    assert not dvc.cloud.get_remote_odb("upstream").pack_threshold
+    assert dvc.status(cloud=True) == {}
+    remove(dvc.odb.local.cache_dir)
+    remove("dir")
+    dvc.pull()
+    assert (tmp_dir / "dir").read_text() == DATA
+
+
+def test_packs_not_listed_until_missing(tmp_dir, dvc, mocker):
+    odb = dvc.odb.local
+    tmp_dir.gen("foo", "foo")
+    (stage,) = dvc.add("foo")
+    odb._packs = None  # pylint: disable=protected-access
+    spy = mocker.spy(odb, "_load_packs")
+    assert odb.exists(stage.outs[0].hash_info)
+    assert odb.hashes_exist([stage.outs[0].hash_info.value])
+    assert not spy.called
+
+    assert not odb.exists(HashInfo("md5", "0" * 32))
+    assert spy.call_count == 1
+    assert not odb.hashes_exist(["1" * 32])
+    assert spy.call_count == 1
+
+
+def test_pull_packs_skips_corrupted(tmp_dir, dvc, local_cloud, mocker):
+    from dvc.objects.transfer import transfer
+
+    tmp_dir.add_remote(config=local_cloud.config)
+    remote_odb = dvc.cloud.get_remote_odb("upstream")
+    hash_infos = set()
+    for content in DATA.values():
+        data = content.encode()
+        hash_info = HashInfo(
+            "md5", hashlib.md5(data).hexdigest(), size=len(data)
+        )
+        remote_odb.add_bytes(data, hash_info)
+        hash_infos.add(hash_info)
+
+    corrupted_hash = hashlib.md5(DATA["000"].encode()).hexdigest()
+    corrupted = remote_odb.hash_to_path_info(corrupted_hash)
+    os.chmod(corrupted, 0o644)
+    with open(corrupted, "w") as fobj:
+        fobj.write("garbage")
+    # read-only cache files are assumed to be unchanged
+    os.chmod(corrupted, 0o444)
+
+    dvc.odb.local.pack_threshold = 10
+    spy = mocker.spy(dvc.odb.local, "add")
+    transfer(remote_odb, dvc.odb.local, hash_infos, verify=True)
+    (index,) = dvc.odb.local.packs.values()
+    assert len(index) == len(DATA) - 1
+    assert corrupted_hash not in index
+    # the object that failed verification is transferred on its own
+    (call,) = spy.call_args_list
+    assert call[0][2].value == corrupted_hash
+    assert not dvc.odb.local.exists(call[0][2])
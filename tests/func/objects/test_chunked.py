@@ -0,0 +1,152 @@
+import random
+
+import pytest
+
+from dvc.objects import load
+from dvc.objects.chunked import ChunkedFile
+from dvc.utils.fs import remove
+
+
+@pytest.fixture
+def chunking(dvc, mocker):
+    mocker.patch("dvc.objects.chunked.CHUNK_MIN_SIZE", 256)
+    mocker.patch("dvc.objects.chunked.CHUNK_AVG_SIZE", 1024)
+    mocker.patch("dvc.objects.chunked.CHUNK_MAX_SIZE", 4096)
+    with dvc.config.edit() as conf:
+        conf["cache"]["chunking"] = True
+    dvc.odb.local.chunking = True
+
+
+def _random_bytes(size, seed=0):
+    rnd = random.Random(seed)
+    return bytes(rnd.getrandbits(8) for _ in range(size))
+
+
+def _cache_files(dvc):
+    return set(dvc.odb.local.all())
+
+
+def test_add_chunked(tmp_dir, dvc, chunking):
+    data = _random_bytes(50000)
+    tmp_dir.gen({"large": data, "small": "small"})
+    (stage,) = dvc.add("large")
+    (small_stage,) = dvc.add("small")
+
+    out = stage.outs[0]
+    assert out.hash_info.ischunked
+    assert out.hash_info.size == len(data)
+    assert not small_stage.outs[0].hash_info.ischunked
+
+    obj = load(dvc.odb.local, out.hash_info)
+    assert isinstance(obj, ChunkedFile)
+    chunk_hashes = {entry.hash_info.value for _, entry in obj}
+    assert len(chunk_hashes) > 1
+    assert chunk_hashes < _cache_files(dvc)
+    assert (tmp_dir / "large").read_bytes() == data
+    assert dvc.status() == {}
+
+    remove("large")
+    dvc.checkout("large")
+    assert (tmp_dir / "large").read_bytes() == data
+    assert dvc.status() == {}
+
+
+def test_add_chunked_appended(tmp_dir, dvc, chunking):
+    data = _random_bytes(50000)
+    tmp_dir.gen("large", data)
+    dvc.add("large")
+    before = _cache_files(dvc)
+
+    tmp_dir.gen("large", data + _random_bytes(2000, seed=1))
+    dvc.add("large")
+    # new manifest and the chunks at the end of the file
+    assert len(_cache_files(dvc) - before) <= 4
+
+
+def test_push_pull_gc_chunked(tmp_dir, dvc, chunking, local_remote):
+    data = _random_bytes(50000)
+    (stage,) = tmp_dir.dvc_gen("large", data)
+    obj = load(dvc.odb.local, stage.outs[0].hash_info)
+    expected = {entry.hash_info.value for _, entry in obj} | {
+        obj.hash_info.value
+    }
+
+    assert dvc.push() == len(expected)
+    remote_odb = dvc.cloud.get_remote_odb("upstream")
+    assert set(remote_odb.all()) == expected
+
+    tmp_dir.gen("garbage", "garbage")
+    garbage = dvc.add("garbage")[0].outs[0].hash_info.value
+    dvc.remove("garbage.dvc")
+    dvc.gc(workspace=True, force=True)
+    assert garbage not in _cache_files(dvc)
+    assert _cache_files(dvc) == expected
+
+    remove(dvc.odb.local.cache_dir)
+    remove("large")
+    dvc.pull()
+    assert _cache_files(dvc) == expected
+    assert (tmp_dir / "large").read_bytes() == data
+
+
+def test_chunked_hash_not_used_as_md5(tmp_dir, dvc, chunking, run_copy):
+    from dvc.objects.stage import get_file_hash
+    from dvc.utils import file_md5
+
+    data = _random_bytes(50000)
+    tmp_dir.gen("large", data)
+    (stage,) = dvc.add("large")
+    assert stage.outs[0].hash_info.ischunked
+
+    md5 = file_md5(tmp_dir / "large", dvc.fs)
+    hash_info = get_file_hash(
+        tmp_dir / "large", dvc.fs, "md5", state=dvc.odb.local.state
+    )
+    assert hash_info.value == md5
+
+    run_copy("large", "copy", name="copy")
+    lock = (tmp_dir / "dvc.lock").parse()
+    deps = {dep["path"]: dep for dep in lock["stages"]["copy"]["deps"]}
+    assert deps["large"]["md5"] == md5
+    assert (tmp_dir / "copy").read_bytes() == data
+
+
+def test_stage_chunked_references(tmp_dir, dvc, chunking):
+    from dvc.objects.stage import stage
+    from dvc.objects.transfer import transfer
+
+    data = _random_bytes(50000)
+    tmp_dir.gen("large", data)
+    odb = dvc.odb.local
+
+    # a dry run only stages the manifest, without the chunks
+    _, obj = stage(odb, tmp_dir / "large", dvc.fs, "md5", dry_run=True)
+    assert obj.hash_info.ischunked
+    staging, obj = stage(odb, tmp_dir / "large", dvc.fs, "md5")
+    chunk_hashes = {entry.hash_info.value for _, entry in obj}
+    assert not chunk_hashes & _cache_files(dvc)
+
+    transfer(staging, odb, {obj.hash_info}, shallow=False, move=True)
+    assert chunk_hashes < _cache_files(dvc)
+    assert (tmp_dir / "large").read_bytes() == data
+
+
+def test_api_read_chunked(tmp_dir, scm, dvc, chunking, local_remote):
+    import os
+
+    from dvc import api
+    from dvc.repo import Repo
+
+    data = _random_bytes(50000)
+    tmp_dir.dvc_gen("large", data, commit="add large")
+    dvc.push()
+    remove("large")
+
+    assert api.read("large", repo=os.fspath(tmp_dir), mode="rb") == data
+
+    # chunks are streamed from the remote, if they are not in cache
+    remove(dvc.odb.local.cache_dir)
+    assert api.read("large", repo=os.fspath(tmp_dir), mode="rb") == data
+
+    Repo.get(os.fspath(tmp_dir), "large", "copy")
+    assert (tmp_dir / "copy").read_bytes() == data
@@ -1001,3 +1001,26 @@ def test_checkout_dir_compat(tmp_dir, dvc):
     remove("data")
     dvc.checkout()
     assert (tmp_dir / "data").read_text() == {"foo": "foo"}
+
+
+def test_checkout_dir_in_batches(tmp_dir, dvc, mocker):
+    from dvc.objects import checkout as ocheckout
+
+    mocker.patch.object(ocheckout, "BATCH_SIZE", 2)
+    files = {f"file{i}": str(i) for i in range(5)}
+    tmp_dir.gen({"dir": {"a": files, "b": {"c": files}}})
+    dvc.add("dir")
+    remove(tmp_dir / "dir")
+
+    makedirs = mocker.spy(dvc.odb.local, "makedirs")
+    save_many = mocker.spy(dvc.state, "save_many")
+    stats = dvc.checkout("dir")
+
+    assert stats["added"] == ["dir" + os.sep]
+    assert (tmp_dir / "dir" / "a").read_text() == files
+    assert (tmp_dir / "dir" / "b" / "c").read_text() == files
+    # each of the directories is created once, rather than for each file
+    assert sorted(
+        relpath(call.args[0]) for call in makedirs.call_args_list
+    ) == ["dir", os.path.join("dir", "a"), os.path.join("dir", "b", "c")]
+    assert len(save_many.call_args_list[0].args[0]) == 10
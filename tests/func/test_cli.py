@@ -1,6 +1,12 @@
+import argparse
 import os
+import subprocess
+import sys
 
-from dvc.cli import parse_args
+import pytest
+from funcy import first
+
+from dvc.cli import COMMANDS, _find_command, get_main_parser, parse_args
 from dvc.command.add import CmdAdd
 from dvc.command.base import CmdBase
 from dvc.command.checkout import CmdCheckout
@@ -261,3 +267,45 @@ def test_unknown_subcommand_help(capsys):
     captured = capsys.readouterr()
     help_output = captured.out
     assert output == help_output
+
+
+def test_commands_registry():
+    parser = get_main_parser()
+    # pylint: disable=protected-access
+    subparsers = first(
+        action
+        for action in parser._actions
+        if isinstance(action, argparse._SubParsersAction)
+    )
+    assert list(subparsers.choices) == [
+        cmd for cmds in COMMANDS.values() for cmd in cmds
+    ]
+
+
+@pytest.mark.parametrize(
+    "argv, cmd",
+    [
+        ([], None),
+        (["-v"], None),
+        (["version"], "version"),
+        (["-q", "--cd", "add", "status", "-c"], "status"),
+        (["--cd=add", "push"], "push"),
+        (["--cprofile", "--cprofile-dump", "dump", "pull"], "pull"),
+        (["--cprofile-d", "dump", "exp", "show"], "exp"),
+    ],
+)
+def test_find_command(argv, cmd):
+    assert _find_command(get_main_parser(), argv) == cmd
+
+
+def test_parse_args_imports_only_command():
+    code = (
+        "import sys; from dvc.cli import parse_args; parse_args(['push']); "
+        "print(' '.join(sys.modules))"
+    )
+    modules = subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    ).split()
+    assert "dvc.command.data_sync" in modules
+    assert "dvc.command.experiments" not in modules
+    assert "fsspec" not in modules
@@ -570,6 +570,30 @@ def test_pull_partial(tmp_dir, dvc, local_remote):
     assert (tmp_dir / "foo").read_text() == {"bar": {"baz": "baz"}}
 
 
+def test_refresh_listing(tmp_dir, dvc, local_cloud):
+    tmp_dir.add_remote(config={**local_cloud.config, "listing_ttl": 60})
+    tmp_dir.dvc_gen("foo", "foo")
+
+    def _cache_listing():
+        listing_cache = dvc.cloud.get_remote_odb().listing_cache
+        listing_cache.set(None, ["acbd18db4cc2f85cedef654fccc4a4d8"])
+        return listing_cache
+
+    listing_cache = _cache_listing()
+    assert dvc.status(cloud=True) == {"foo": "new"}
+    assert listing_cache.get() is not None
+    assert dvc.status(cloud=True, refresh_listing=True) == {"foo": "new"}
+    assert listing_cache.get() is None
+
+    _cache_listing()
+    assert dvc.push(refresh_listing=True) == 1
+    assert listing_cache.get() is None
+
+    _cache_listing()
+    dvc.fetch(refresh_listing=True)
+    assert listing_cache.get() is None
+
+
 @pytest.mark.parametrize("remote", full_clouds, indirect=True)
 def test_pull_00_prefix(tmp_dir, dvc, remote, monkeypatch):
     # Related: https://github.com/iterative/dvc/issues/6089
@@ -682,3 +706,19 @@ def test_target_remote(tmp_dir, dvc, make_remote):
         "6b18131dc289fd37006705affe961ef8.dir",
         "b8a9f715dbb64fd5c56e7783c6820a61",
     }
+
+
+def test_pull_async(tmp_dir, dvc, http, mocker):
+    from dvc.fs.fsspec_wrapper import FSSpecWrapper
+
+    tmp_dir.add_remote(config=http.config)
+    tmp_dir.dvc_gen({"dir": {"foo": "foo", "bar": "bar"}, "baz": "baz"})
+    dvc.push()
+
+    clean(["dir", "baz"], dvc)
+    # all objects should be downloaded through the async filesystem
+    mocker.patch.object(FSSpecWrapper, "get_file", side_effect=AssertionError)
+    dvc.pull()
+    assert (tmp_dir / "dir").read_text() == {"foo": "foo", "bar": "bar"}
+    assert (tmp_dir / "baz").read_text() == "baz"
+    assert dvc.status() == {}
@@ -193,6 +193,24 @@ class TestWalkInGit(AssertWalkEqualMixin, TestGit):
         )
 
 
+def test_walk_files_detail(tmp_dir, dvc):
+    tmp_dir.gen({"dir": {"foo": "foo", "subdir": {"bar": "barbar"}}})
+    (tmp_dir / "dir" / "link").symlink_to("foo")
+    (tmp_dir / "dir" / "broken").symlink_to("missing")
+    fs = LocalFileSystem()
+    path_info = PathInfo(tmp_dir / "dir")
+
+    infos = dict(fs.walk_files(path_info, detail=True))
+    assert set(infos) == set(fs.walk_files(path_info)) - {path_info / "broken"}
+    for file_info, info in infos.items():
+        expected = fs.info(file_info)
+        assert info["size"] == expected["size"]
+        assert info["mtime"] == expected["mtime"]
+        assert info["ino"] == os.lstat(file_info).st_ino
+
+    assert dict(dvc.dvcignore.walk_files(fs, path_info, detail=True)) == infos
+
+
 def test_cleanfs_subrepo(tmp_dir, dvc, scm, monkeypatch):
     tmp_dir.gen({"subdir": {}})
     subrepo_dir = tmp_dir / "subdir"
@@ -295,3 +295,74 @@ def test_used_objs(tmp_dir, scm, dvc, run_copy, rev):
     assert index.used_objs("copy-foo-bar", with_deps=True) == {
         None: {expected_objs[0]}
     }
+
+
+def test_used_objs_cached_by_metafile(tmp_dir, scm, dvc, mocker):
+    from dvc.repo.stage import StageLoad
+
+    tmp_dir.dvc_gen({"dir": {"file": "file"}, "foo": "foo"}, commit="init")
+    first = scm.get_rev()
+    tmp_dir.dvc_gen("foo", "modified", commit="modify foo")
+
+    expected = Index(dvc).used_objs()
+    load_file = mocker.spy(StageLoad, "load_file")
+
+    def _collect(rev):
+        brancher = dvc.brancher(revs=[rev])
+        assert next(brancher) == "workspace"
+        next(brancher)
+        return Index(dvc).used_objs()
+
+    assert _collect(first) != expected
+    assert load_file.call_count == 2
+    load_file.reset_mock()
+
+    # only the modified foo.dvc needs to be loaded
+    assert _collect("HEAD") == expected
+    assert load_file.call_count == 1
+    load_file.reset_mock()
+
+    assert _collect(first) != expected
+    assert _collect("HEAD") == expected
+    assert load_file.call_count == 0
+
+
+def test_used_objs_cache_checks_imports(tmp_dir, scm, dvc):
+    from dvc.utils.serialize import dump_yaml
+
+    dump_yaml("params.yaml", {"items": ["a", "b"]})
+    dump_yaml(
+        "dvc.yaml",
+        {
+            "stages": {
+                "build": {
+                    "foreach": "${items}",
+                    "do": {
+                        "cmd": "echo ${item} > ${item}",
+                        "outs": ["${item}"],
+                    },
+                }
+            }
+        },
+    )
+    dvc.reproduce()
+    scm.add(["params.yaml", "dvc.yaml", "dvc.lock", ".gitignore"])
+    scm.commit("both")
+    both = scm.get_rev()
+
+    # dvc.yaml and dvc.lock are unchanged, only the params are
+    dump_yaml("params.yaml", {"items": ["a"]})
+    scm.add(["params.yaml"])
+    scm.commit("one")
+
+    def _collect(rev):
+        brancher = dvc.brancher(revs=[rev])
+        assert next(brancher) == "workspace"
+        next(brancher)
+        return {
+            hash_info.obj_name for hash_info in Index(dvc).used_objs()[None]
+        }
+
+    assert _collect(both) == {"a", "b"}
+    assert _collect("HEAD") == {"a"}
+    assert _collect(both) == {"a", "b"}
@@ -1251,5 +1251,9 @@ def test_repro_when_cmd_changes(tmp_dir, dvc, run_copy, mocker):
     }
     assert dvc.reproduce(stage.addressing)[0] == stage
     m.assert_called_once_with(
-        stage, checkpoint_func=None, dry=False, run_env=None
+        stage,
+        checkpoint_func=None,
+        dry=False,
+        run_env=None,
+        capture_output=False,
     )
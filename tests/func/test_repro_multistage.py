@@ -6,7 +6,12 @@ import pytest
 from funcy import lsplit
 
 from dvc.dvcfile import PIPELINE_FILE, PIPELINE_LOCK
-from dvc.exceptions import CyclicGraphError, ReproductionError
+from dvc.exceptions import (
+    CyclicGraphError,
+    DvcException,
+    FailedStagesError,
+    ReproductionError,
+)
 from dvc.main import main
 from dvc.stage import PipelineStage
 from tests.func import test_repro
@@ -296,7 +301,11 @@ def test_repro_when_cmd_changes(tmp_dir, dvc, run_copy, mocker):
     assert dvc.status([target]) == {target: ["changed command"]}
     assert dvc.reproduce(target)[0] == stage
     m.assert_called_once_with(
-        stage, checkpoint_func=None, dry=False, run_env=None
+        stage,
+        checkpoint_func=None,
+        dry=False,
+        run_env=None,
+        capture_output=False,
     )
 
 
@@ -564,3 +573,112 @@ def test_repro_list_of_commands_raise_and_stops_after_failure(
         dvc.reproduce(targets=["multi"])
     assert (tmp_dir / "foo").read_text() == "foo\n"
     assert not (tmp_dir / "bar").exists()
+
+
+def test_repro_jobs(tmp_dir, dvc, capsys):
+    # each of the stages waits for the other one to start
+    tmp_dir.gen(
+        "wait.py",
+        dedent(
+            """\
+            import os, sys, time
+
+            open(sys.argv[1], "w").close()
+            deadline = time.time() + 30
+            while not os.path.exists(sys.argv[2]):
+                if time.time() > deadline:
+                    sys.exit(1)
+                time.sleep(0.01)
+            """
+        ),
+    )
+    (tmp_dir / "dvc.yaml").dump(
+        {
+            "stages": {
+                "a": {"cmd": "python wait.py a b", "outs": ["a"]},
+                "b": {"cmd": "python wait.py b a", "outs": ["b"]},
+                "c": {
+                    "cmd": "echo c>c && echo done",
+                    "deps": ["a", "b"],
+                    "outs": ["c"],
+                },
+            }
+        }
+    )
+
+    stages = dvc.reproduce(jobs=2)
+    assert {stage.addressing for stage in stages} == {"a", "b", "c"}
+    assert stages[-1].addressing == "c"
+    assert (tmp_dir / PIPELINE_LOCK).parse()["stages"].keys() == {
+        "a",
+        "b",
+        "c",
+    }
+    assert "Output of stage 'c':\ndone" in capsys.readouterr().out
+    assert not dvc.reproduce(jobs=2)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize(
+    "keep_going, error",
+    [(True, "failed to reproduce 'fail'"), (False, "'dvc.yaml'")],
+)
+def test_repro_keep_going(tmp_dir, dvc, jobs, keep_going, error):
+    (tmp_dir / "dvc.yaml").dump(
+        {
+            "stages": {
+                "fail": {"cmd": "failed_command", "outs": ["fail"]},
+                "after": {
+                    "cmd": "echo after>after",
+                    "deps": ["fail"],
+                    "outs": ["after"],
+                },
+                "ok": {"cmd": "echo ok>ok", "outs": ["ok"]},
+            }
+        }
+    )
+
+    with pytest.raises(DvcException, match=error):
+        dvc.reproduce(["after", "ok"], jobs=jobs, keep_going=keep_going)
+    assert not (tmp_dir / "after").exists()
+    if keep_going:
+        assert (tmp_dir / "ok").read_text() == "ok\n"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_repro_keep_going_skips_dependents(tmp_dir, dvc, caplog, jobs):
+    (tmp_dir / "dvc.yaml").dump(
+        {
+            "stages": {
+                "fail": {"cmd": "failed_command", "outs": ["fail"]},
+                "mid": {
+                    "cmd": "echo mid>mid",
+                    "deps": ["fail"],
+                    "outs": ["mid"],
+                },
+                "after": {
+                    "cmd": "echo after>after",
+                    "deps": ["mid"],
+                    "outs": ["after"],
+                },
+                "ok": {"cmd": "echo ok>ok", "outs": ["ok"]},
+            }
+        }
+    )
+
+    with pytest.raises(FailedStagesError) as exc_info:
+        dvc.reproduce(jobs=jobs, keep_going=True)
+    assert isinstance(exc_info.value, ReproductionError)
+    assert [stage.addressing for stage in exc_info.value.stages] == ["fail"]
+    assert (tmp_dir / "ok").read_text() == "ok\n"
+    assert not (tmp_dir / "mid").exists()
+    assert not (tmp_dir / "after").exists()
+    skipped = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Skipping")
+    ]
+    assert skipped == [
+        f"Skipping '{name}' as its dependencies failed to reproduce"
+        for name in ("mid", "after")
+    ]
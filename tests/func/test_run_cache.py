@@ -173,3 +173,58 @@ def test_restore_pull(tmp_dir, dvc, run_copy, mocker, local_remote):
     assert mock_checkout.call_count == 2
     assert (tmp_dir / "bar").exists() and not (tmp_dir / "foo").unlink()
     assert (tmp_dir / PIPELINE_LOCK).exists()
+
+
+def test_push_pull_lists_runs_once(
+    tmp_dir, dvc, erepo_dir, run_copy, local_remote, mocker
+):
+    from dvc.fs.local import LocalFileSystem
+
+    tmp_dir.gen({"foo": "foo", "bar": "bar"})
+    run_copy("foo", "foo1", name="copy-foo")
+    run_copy("bar", "bar1", name="copy-bar")
+
+    exists = mocker.spy(LocalFileSystem, "exists")
+    walk_files = mocker.spy(LocalFileSystem, "walk_files")
+    pushed = dvc.stage_cache.push(None)
+    assert len(pushed) == 2
+
+    exists.reset_mock()
+    walk_files.reset_mock()
+    assert dvc.stage_cache.push(None) == []
+    # `runs` is listed once in the cache and once in the remote
+    assert walk_files.call_count == 2
+    assert exists.call_count == 2
+
+    erepo_dir.add_remote(config=local_remote.config)
+    with erepo_dir.chdir():
+        assert sorted(erepo_dir.dvc.stage_cache.pull(None)) == sorted(pushed)
+        assert erepo_dir.dvc.stage_cache.pull(None) == []
+
+
+def test_load_cached_entries(tmp_dir, dvc, run_copy, mocker):
+    import time
+
+    from dvc.stage.cache import _get_stage_hash
+    from dvc.utils import serialize
+
+    tmp_dir.gen("foo", "foo")
+    stage = run_copy("foo", "bar", name="copy-foo-bar")
+
+    # recently modified files are not cached
+    mtime = time.time() - 10
+    for root, dirs, files in os.walk(dvc.stage_cache.cache_dir):
+        for name in dirs + files:
+            os.utime(os.path.join(root, name), (mtime, mtime))
+
+    load_yaml = mocker.spy(serialize, "load_yaml")
+    expected = dvc.stage_cache._load(stage)
+    assert load_yaml.call_count == 1
+    assert dvc.stage_cache._load(stage) == expected
+    assert load_yaml.call_count == 1
+
+    # entries are loaded again once they change
+    key = _get_stage_hash(stage)
+    (value,) = os.listdir(dvc.stage_cache._get_cache_dir(key))
+    remove(dvc.stage_cache._get_cache_path(key, value))
+    assert not dvc.stage_cache._load(stage)
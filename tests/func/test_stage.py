@@ -319,5 +319,9 @@ def test_stage_run_checkpoint(tmp_dir, dvc, mocker, checkpoint):
     with lock_repo(dvc):
         run_stage(stage, checkpoint_func=callback)
     mock_cmd_run.assert_called_with(
-        stage, checkpoint_func=callback, dry=False, run_env=None
+        stage,
+        checkpoint_func=callback,
+        dry=False,
+        run_env=None,
+        capture_output=False,
     )
@@ -1,4 +1,5 @@
 import os
+import time
 from operator import itemgetter
 
 import pytest
@@ -464,6 +465,23 @@ def test_gitignored_collect_repo(tmp_dir, dvc, scm):
     assert not dvc.stage.collect_repo()
 
 
+def test_gitignored_collect_repo_negated_patterns(tmp_dir, dvc, scm, mocker):
+    tmp_dir.gen(
+        {
+            ".gitignore": "data/**\n!data/**/\n!data/**/*.dvc",
+            "sub": {".gitignore": "/ignored.dvc\n"},
+        }
+    )
+    (stage,) = tmp_dir.dvc_gen({"data/raw/tracked.csv": "5,6,7,8"})
+    tmp_dir.gen({"data": {"raw": {PIPELINE_FILE: "stages: {}"}}})
+    tmp_dir.gen({"sub": {"ignored.dvc": "outs: []"}})
+    spy = mocker.spy(scm, "is_ignored")
+
+    assert dvc.stage.collect_repo() == [stage]
+    # only the collected file is checked again, when it's being loaded
+    assert {call.args[0] for call in spy.call_args_list} == {stage.path}
+
+
 def test_gitignored_file_try_collect_granular_for_data_files(
     tmp_dir, dvc, scm
 ):
@@ -493,3 +511,36 @@ def test_gitignored_file_try_collect_granular_for_dvc_yaml_files(
 
     with pytest.raises(FileIsGitIgnored):
         dvc.stage.collect_granular("bar")
+
+
+def test_collect_repo_cached_metafiles(tmp_dir, dvc, mocker):
+    from dvc.utils import strictyaml
+
+    def backdate(*paths):
+        # recently modified files are not cached
+        mtime = time.time() - 10
+        for path in paths:
+            os.utime(path, (mtime, mtime))
+
+    tmp_dir.dvc_gen("foo", "foo")
+    tmp_dir.gen("params.yaml", "cmd: echo foo")
+    tmp_dir.gen(PIPELINE_FILE, "stages:\n  build:\n    cmd: ${cmd}\n")
+    backdate("params.yaml", PIPELINE_FILE, "foo.dvc")
+    assert {stage.addressing for stage in dvc.stage.collect_repo()} == {
+        "foo.dvc",
+        "build",
+    }
+
+    load = mocker.spy(strictyaml, "load")
+    stages = {stage.addressing: stage for stage in dvc.stage.collect_repo()}
+    assert not load.called
+    assert stages["build"].cmd == "echo foo"
+    assert stages["foo.dvc"].outs[0].hash_info.value == (
+        "acbd18db4cc2f85cedef654fccc4a4d8"
+    )
+
+    tmp_dir.gen("params.yaml", "cmd: echo bar")
+    backdate("params.yaml")
+    stages = {stage.addressing: stage for stage in dvc.stage.collect_repo()}
+    assert not load.called
+    assert stages["build"].cmd == "echo bar"
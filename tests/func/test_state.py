@@ -43,6 +43,49 @@ def test_state_overflow(tmp_dir, dvc):
     dvc.add("dir")
 
 
+def test_state_eviction(tmp_dir, dvc, mocker):
+    mocker.patch.object(State, "MAX_ENTRIES", 2)
+    tmp_dir.gen({"foo": "foo", "bar": "bar", "baz": "baz"})
+    path_infos = [PathInfo(tmp_dir / name) for name in ("foo", "bar", "baz")]
+    hash_infos = [
+        HashInfo("md5", file_md5(path_info, dvc.fs))
+        for path_info in path_infos
+    ]
+
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    mocker.patch("time.time", side_effect=range(100))
+    state.save_many(zip(path_infos[:2], hash_infos[:2]), dvc.fs)
+    # reading "foo" makes "bar" the least recently used entry
+    assert state.get(path_infos[0], dvc.fs) == hash_infos[0]
+    state.save(path_infos[2], dvc.fs, hash_infos[2])
+    state.close()
+
+    assert dict(state.get_many(path_infos, dvc.fs)) == {
+        path_infos[0]: hash_infos[0],
+        path_infos[1]: None,
+        path_infos[2]: hash_infos[2],
+    }
+
+
+def test_state_read_while_writing(tmp_dir, dvc, mocker):
+    mocker.patch.object(State, "TIMEOUT", 0.1)
+    tmp_dir.gen("foo", "foo content")
+    path_info = PathInfo(tmp_dir / "foo")
+    hash_info = HashInfo("md5", file_md5(path_info, dvc.fs))
+
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    state.save(path_info, dvc.fs, hash_info)
+    state.close()
+
+    # reading doesn't need the write lock, which another process could hold
+    other = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    with other.transaction(write=True) as conn:
+        conn.execute("DELETE FROM links")
+        assert state.get(path_info, dvc.fs) == hash_info
+    state.close()
+    other.close()
+
+
 def mock_get_inode(inode):
     def get_inode_mocked(_):
         return inode
@@ -93,3 +136,58 @@ def test_state_dir_config(make_tmp_dir, dvc):
         r"^test_state_dir_config0-([0-9a-f]+)$",
         os.path.basename(repo.state.tmp_dir),
     )
+
+
+def test_state_many(tmp_dir, dvc):
+    tmp_dir.gen({"foo": "foo content", "bar": "bar content"})
+    foo, bar = PathInfo(tmp_dir / "foo"), PathInfo(tmp_dir / "bar")
+    foo_hash = HashInfo("md5", file_md5(foo, dvc.fs))
+
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+    state.save_many([(foo, foo_hash)], dvc.fs)
+
+    assert list(state.get_many([foo, bar, tmp_dir / "missing"], dvc.fs)) == [
+        (foo, foo_hash),
+        (bar, None),
+        (tmp_dir / "missing", None),
+    ]
+    state.close()
+
+    # connection is reopened on demand after closing
+    assert state.get(foo, dvc.fs) == foo_hash
+
+
+def test_state_dir_listing_cache(tmp_dir, dvc, mocker):
+    from dvc.utils.fs import get_mtime_and_size
+
+    tmp_dir.gen({"dir": {"foo": "foo", "sub": {"bar": "bar"}}})
+    path_info = PathInfo(tmp_dir / "dir")
+    mocker.patch.object(State, "RACY_WINDOW_NS", -(10 ** 10))
+    state = State(dvc.root_dir, dvc.tmp_dir, dvc.dvcignore)
+
+    expected = get_mtime_and_size(path_info, dvc.fs, dvc.dvcignore)
+    assert state.get_mtime_and_size(path_info, dvc.fs) == expected
+
+    scandir = mocker.spy(os, "scandir")
+    assert state.get_mtime_and_size(path_info, dvc.fs) == expected
+    assert scandir.call_count == 0
+
+    (tmp_dir / "dir" / "sub" / "baz").write_text("baz")
+    expected = get_mtime_and_size(path_info, dvc.fs, dvc.dvcignore)
+    scandir.reset_mock()
+    assert state.get_mtime_and_size(path_info, dvc.fs) == expected
+    assert scandir.call_count == 1
+
+    (tmp_dir / "dir" / "foo").write_text("modified")
+    expected = get_mtime_and_size(path_info, dvc.fs, dvc.dvcignore)
+    scandir.reset_mock()
+    assert state.get_mtime_and_size(path_info, dvc.fs) == expected
+    assert scandir.call_count == 0
+
+    tmp_dir.gen(".dvcignore", "baz")
+    dvc._reset()  # pylint: disable=protected-access
+    state.dvcignore = dvc.dvcignore
+    expected = get_mtime_and_size(path_info, dvc.fs, dvc.dvcignore)
+    scandir.reset_mock()
+    assert state.get_mtime_and_size(path_info, dvc.fs) == expected
+    assert scandir.call_count == 0
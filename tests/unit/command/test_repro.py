@@ -17,6 +17,7 @@ default_arguments = {
     "glob": False,
     "targets": [],
 }
+repro_arguments = {**default_arguments, "jobs": 1, "keep_going": False}
 
 
 def test_default_arguments(dvc, mocker):
@@ -24,14 +25,24 @@ def test_default_arguments(dvc, mocker):
     mocker.patch.object(cmd.repo, "reproduce")
     cmd.run()
     # pylint: disable=no-member
-    cmd.repo.reproduce.assert_called_with(**default_arguments)
+    cmd.repo.reproduce.assert_called_with(**repro_arguments)
 
 
 def test_downstream(dvc, mocker):
     cmd = CmdRepro(parse_args(["repro", "--downstream"]))
     mocker.patch.object(cmd.repo, "reproduce")
     cmd.run()
-    arguments = default_arguments.copy()
+    arguments = repro_arguments.copy()
     arguments.update({"downstream": True})
     # pylint: disable=no-member
     cmd.repo.reproduce.assert_called_with(**arguments)
+
+
+def test_jobs_keep_going(dvc, mocker):
+    cmd = CmdRepro(parse_args(["repro", "-j", "4", "--keep-going"]))
+    mocker.patch.object(cmd.repo, "reproduce")
+    cmd.run()
+    arguments = repro_arguments.copy()
+    arguments.update({"jobs": 4, "keep_going": True})
+    # pylint: disable=no-member
+    cmd.repo.reproduce.assert_called_with(**arguments)
@@ -22,6 +22,7 @@ def test_cloud_status(tmp_dir, dvc, mocker):
             "--all-commits",
             "--with-deps",
             "--recursive",
+            "--refresh-listing",
         ]
     )
     assert cli_args.func == CmdDataStatus
@@ -41,6 +42,7 @@ def test_cloud_status(tmp_dir, dvc, mocker):
         all_commits=True,
         with_deps=True,
         recursive=True,
+        refresh_listing=True,
     )
 
 
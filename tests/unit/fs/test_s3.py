@@ -216,3 +216,17 @@ def test_s3_aws_config_different_profile(tmp_dir, dvc, s3, monkeypatch):
 
     transfer_config = fs._transfer_config
     assert transfer_config.multipart_threshold == 2 * GB
+
+
+def test_find_skips_directory_markers(dvc, s3):
+    (s3 / "data" / "").write_bytes(b"")
+    (s3 / "data" / "foo").write_bytes(b"foo")
+    (s3 / "data" / "sub" / "").write_bytes(b"")
+    (s3 / "data" / "sub" / "bar").write_bytes(b"bar")
+
+    fs = S3FileSystem(**s3.config)
+
+    assert set(fs.find(s3 / "data")) == {
+        (s3 / "data" / "foo").path,
+        (s3 / "data" / "sub" / "bar").path,
+    }
@@ -0,0 +1,33 @@
+from dvc.objects.db.listing import ObjectDBListingCache
+
+
+def test_listing_cache(tmp_dir, mocker):
+    time = mocker.patch("dvc.objects.db.listing.time.time", return_value=100)
+    cache = ObjectDBListingCache(tmp_dir, "remote", ttl=10)
+    assert cache.get("00") is None
+
+    cache.set("00", ["00aa", "00bb"])
+    cache.set("01", [])
+    assert cache.get("00") == ["00aa", "00bb"]
+
+    assert cache.lookup(["00aa", "00cc", "01aa", "02aa"], 2) == (
+        {"00aa"},
+        {"02aa"},
+    )
+
+    cache.update(["00cc", "02aa"])
+    assert sorted(cache.get("00")) == ["00aa", "00bb", "00cc"]
+    assert cache.get("02") is None
+
+    time.return_value = 111
+    assert cache.get("00") is None
+    assert cache.lookup(["00aa"], 2) == (set(), {"00aa"})
+
+
+def test_listing_cache_clear(tmp_dir):
+    cache = ObjectDBListingCache(tmp_dir, "remote", ttl=10)
+    cache.set(None, ["00aa"])
+    assert cache.lookup(["00aa", "01aa"], 2) == ({"00aa"}, set())
+
+    cache.clear()
+    assert cache.get(None) is None
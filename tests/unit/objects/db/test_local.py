@@ -137,3 +137,67 @@ def test_staging_dir(tmp_dir, dvc):
 
     path_info = local_odb.hash_to_path_info(obj.hash_info.value)
     assert fs.exists(path_info)
+
+
+def test_staging_references(tmp_dir, dvc, mocker):
+    from dvc.fs.memory import MemoryFileSystem
+    from dvc.objects.stage import _get_staging, stage
+    from dvc.objects.transfer import transfer
+
+    tmp_dir.gen({"dir": {"foo": "foo", "bar": "bar"}})
+    fs = LocalFileSystem()
+    local_odb = dvc.odb.local
+    upload = mocker.spy(MemoryFileSystem, "upload")
+
+    staging_odb, obj = stage(local_odb, tmp_dir / "dir", fs, "md5")
+    entries = [entry.hash_info for _, entry in obj]
+    # only the .dir object is stored in memfs
+    assert upload.call_count == 0
+    assert all(_get_staging(local_odb).exists(hi) for hi in entries)
+
+    transfer(staging_odb, local_odb, {obj.hash_info}, shallow=False, move=True)
+    assert not any(_get_staging(local_odb).exists(hi) for hi in entries)
+
+
+def test_staging_same_contents(tmp_dir, dvc):
+    from dvc.objects.stage import stage
+    from dvc.objects.transfer import transfer
+
+    tmp_dir.gen({"foo": "content", "bar": "content"})
+    fs = LocalFileSystem()
+    local_odb = dvc.odb.local
+
+    foo_staging, foo_obj = stage(local_odb, tmp_dir / "foo", fs, "md5")
+    bar_staging, bar_obj = stage(local_odb, tmp_dir / "bar", fs, "md5")
+    assert foo_obj.hash_info == bar_obj.hash_info
+    assert foo_staging.get(foo_obj.hash_info).path_info == tmp_dir / "foo"
+    assert bar_staging.get(bar_obj.hash_info).path_info == tmp_dir / "bar"
+
+    transfer(bar_staging, local_odb, {bar_obj.hash_info}, move=True)
+    assert (tmp_dir / "foo").exists()
+    assert not (tmp_dir / "bar").exists()
+
+
+def test_staging_tree_references(tmp_dir, dvc, mocker):
+    from dvc.objects.db.reference import ReferenceObjectDB
+    from dvc.objects.stage import _get_staging, stage
+
+    tmp_dir.gen({"dir": {"foo": "foo", "bar": "bar"}})
+    fs = LocalFileSystem()
+    local_odb = dvc.odb.local
+
+    _, obj = stage(local_odb, tmp_dir / "dir", fs, "md5")
+    local_odb.staged_refs.clear()
+
+    # staged tree is loaded again, files are only referenced once looked up
+    add_file = mocker.spy(ReferenceObjectDB, "_add_file")
+    staging_odb, obj = stage(local_odb, tmp_dir / "dir", fs, "md5")
+    assert add_file.call_count == 0
+
+    foo = obj.get(("foo",))
+    assert staging_odb.get(foo.hash_info).path_info == tmp_dir / "dir" / "foo"
+    assert add_file.call_count == 2
+
+    # references are kept by the ODB they have been staged for
+    other_odb = LocalObjectDB(fs, local_odb.path_info)
+    assert not _get_staging(other_odb).exists(foo.hash_info)
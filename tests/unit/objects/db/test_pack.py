@@ -0,0 +1,83 @@
+import hashlib
+
+import pytest
+
+from dvc.hash_info import HashInfo
+from dvc.objects.db.pack import PackIndex, PackIndexes, is_packable
+from dvc.objects.errors import ObjectFormatError
+
+
+def _md5(data):
+    return hashlib.md5(data).hexdigest()
+
+
+@pytest.fixture
+def index():
+    return PackIndex.build(
+        [
+            (_md5(b"foo"), 0, 3),
+            (_md5(b"bar"), 3, 3),
+            (_md5(b"lorem"), 6, 5),
+        ]
+    )
+
+
+def test_pack_index_find(index):
+    assert len(index) == 3
+    assert index.find(_md5(b"foo")) == (0, 3)
+    assert index.find(_md5(b"bar")) == (3, 3)
+    assert index.find(_md5(b"lorem")) == (6, 5)
+    assert index.find(_md5(b"ipsum")) is None
+    assert index.find("123.dir") is None
+    assert _md5(b"foo") in index
+
+
+def test_pack_index_hashes(index):
+    hashes = sorted(_md5(data) for data in (b"foo", b"bar", b"lorem"))
+    assert list(index.hashes()) == hashes
+    for hash_ in hashes:
+        assert list(index.hashes(hash_[:3])) == [hash_]
+    assert list(index.hashes("fff")) == []
+
+
+def test_pack_index_bytes(index):
+    loaded = PackIndex.from_bytes(index.name, index.to_bytes())
+    assert list(loaded.hashes()) == list(index.hashes())
+    assert PackIndex.build([]).name != index.name
+
+    with pytest.raises(ObjectFormatError):
+        PackIndex.from_bytes(index.name, b"garbage")
+    with pytest.raises(ObjectFormatError):
+        PackIndex.from_bytes(index.name, index.to_bytes()[:-1])
+
+
+def test_pack_indexes(index):
+    other = PackIndex.build([(_md5(b"ipsum"), 0, 5), (_md5(b"foo"), 5, 3)])
+    indexes = PackIndexes([index])
+    assert indexes.find(_md5(b"bar")) == (index, 3, 3)
+    assert not indexes.has(_md5(b"ipsum"))
+    assert not indexes.has("123.dir")
+
+    indexes.add(other)
+    assert set(indexes) == {index.name, other.name}
+    assert indexes.find(_md5(b"ipsum")) == (other, 0, 5)
+    assert indexes.has(_md5(b"foo"))
+
+    indexes.remove(index.name)
+    assert indexes.find(_md5(b"foo")) == (other, 5, 3)
+    assert not indexes.has(_md5(b"bar"))
+    assert dict(indexes) == {other.name: other}
+
+
+@pytest.mark.parametrize(
+    "hash_info, size, expected",
+    [
+        (HashInfo("md5", _md5(b"foo")), 3, True),
+        (HashInfo("md5", _md5(b"foo")), None, False),
+        (HashInfo("md5", _md5(b"foo")), 2 ** 30, False),
+        (HashInfo("md5", _md5(b"foo") + ".dir"), 3, False),
+        (HashInfo("etag", _md5(b"foo")), 3, False),
+    ],
+)
+def test_is_packable(hash_info, size, expected):
+    assert is_packable(hash_info, size) == expected
@@ -0,0 +1,81 @@
+import io
+import random
+
+import pytest
+
+from dvc.hash_info import HashInfo
+from dvc.objects.chunked import ChunkedFile, iter_chunks
+from dvc.objects.errors import ObjectFormatError
+from dvc.objects.file import HashFile
+
+SIZES = {"min_size": 256, "avg_size": 1024, "max_size": 4096}
+
+
+def _random_bytes(size, seed=0):
+    rnd = random.Random(seed)
+    return bytes(rnd.getrandbits(8) for _ in range(size))
+
+
+def _chunks(data):
+    return list(iter_chunks(io.BytesIO(data), **SIZES))
+
+
+@pytest.mark.parametrize("size", [0, 1, 256, 4096, 50000])
+def test_iter_chunks(size):
+    data = _random_bytes(size)
+    chunks = _chunks(data)
+
+    assert b"".join(chunks) == data
+    assert all(len(chunk) <= SIZES["max_size"] for chunk in chunks)
+    assert all(len(chunk) >= SIZES["min_size"] for chunk in chunks[:-1])
+    assert chunks == _chunks(data)
+
+
+def test_iter_chunks_no_cut_points():
+    chunks = _chunks(bytes(10000))
+    assert [len(chunk) for chunk in chunks] == [4096, 4096, 1808]
+
+
+def test_iter_chunks_content_defined():
+    data = _random_bytes(50000)
+    chunks = _chunks(data)
+
+    appended = _chunks(data + _random_bytes(1000, seed=1))
+    assert appended[: len(chunks) - 1] == chunks[:-1]
+
+    # only chunks around the insertion point are affected
+    inserted = _chunks(_random_bytes(100, seed=2) + data)
+    assert len(set(chunks) - set(inserted)) <= 2
+
+
+def test_chunked_file_list_roundtrip():
+    chunked = ChunkedFile(None, None, None)
+    chunked.add(HashFile(None, None, HashInfo("md5", "123", size=3)))
+    chunked.add(HashFile(None, None, HashInfo("md5", "456", size=5)))
+    chunked.digest()
+
+    assert chunked.hash_info.value.endswith(".chunks")
+    assert chunked.hash_info.ischunked
+    assert chunked.hash_info.size == 8
+    assert [(offset, obj.hash_info.value) for offset, obj in chunked] == [
+        (0, "123"),
+        (3, "456"),
+    ]
+
+    loaded = ChunkedFile.from_list(chunked.as_list())
+    assert [obj.hash_info for _, obj in loaded] == [
+        obj.hash_info for _, obj in chunked
+    ]
+
+
+def test_chunked_file_load_corrupted(tmp_dir, dvc):
+    odb = dvc.odb.local
+    hash_info = HashInfo("md5", "123456.chunks")
+    tmp_dir.gen(
+        {
+            odb.hash_to_path(hash_info.value): '[{"md5": "abc"}]',
+        }
+    )
+
+    with pytest.raises(ObjectFormatError):
+        ChunkedFile.load(odb, hash_info)
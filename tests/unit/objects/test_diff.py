@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+from dvc.hash_info import HashInfo
+from dvc.objects.diff import ROOT, diff
+from dvc.objects.file import HashFile
+from dvc.objects.tree import Tree
+
+
+def _tree(hash_value, entries):
+    tree = Tree(None, None, HashInfo("md5", hash_value))
+    for key, value in entries.items():
+        tree.add(key, HashFile(None, None, HashInfo("md5", value)))
+    return tree
+
+
+def _cache(missing=()):
+    def check(hash_info, **kwargs):
+        if hash_info.value in missing:
+            raise FileNotFoundError
+
+    return Mock(fs=Mock(jobs=4), check=Mock(side_effect=check))
+
+
+def _keys(changes):
+    return sorted(change.new.key or change.old.key for change in changes)
+
+
+def test_diff():
+    old = _tree(
+        "old.dir",
+        {("a",): "1", ("b",): "2", ("dir", "c"): "3", ("d",): "4"},
+    )
+    new = _tree(
+        "new.dir",
+        {("a",): "1", ("b",): "5", ("dir", "c"): "3", ("e",): "6"},
+    )
+    cache = _cache(missing={"3"})
+
+    result = diff(old, new, cache)
+
+    assert result
+    assert _keys(result.added) == [("e",)]
+    assert _keys(result.deleted) == [("d",)]
+    # unchanged entries that are missing from cache are checked out again
+    assert _keys(result.modified) == [ROOT, ("b",), ("dir", "c")]
+    assert _keys(result.unchanged) == [("a",)]
+
+    (change,) = result.unchanged
+    assert change.old.in_cache and change.new.in_cache
+    assert change.old == change.new
+    (change,) = [c for c in result.modified if c.new.key == ("dir", "c")]
+    assert not change.new.in_cache
+
+
+def test_diff_checks_each_object_once():
+    old = _tree("old.dir", {("a",): "1", ("b",): "1"})
+    new = _tree("new.dir", {("a",): "1", ("b",): "1", ("c",): "1"})
+    cache = _cache()
+
+    result = diff(old, new, cache)
+
+    assert _keys(result.added) == [("c",)]
+    assert _keys(result.unchanged) == [("a",), ("b",)]
+    assert [call.args[0].value for call in cache.check.call_args_list] == ["1"]
+
+
+def test_diff_unchanged_tree():
+    tree = _tree("tree.dir", {("a",): "1"})
+    cache = _cache(missing={"1"})
+
+    result = diff(tree, tree, cache)
+
+    assert result
+    assert _keys(result.unchanged) == [ROOT]
+    assert _keys(result.modified) == [("a",)]
+
+
+def test_diff_none():
+    assert not diff(None, None, _cache())
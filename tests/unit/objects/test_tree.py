@@ -59,7 +59,7 @@ from dvc.objects.tree import Tree, _merge
 )
 def test_list(lst, trie_dict):
     tree = Tree.from_list(lst)
-    assert tree._dict == trie_dict
+    assert tree.as_dict() == trie_dict
     assert tree.as_list() == sorted(lst, key=itemgetter("relpath"))
 
 
@@ -223,3 +223,73 @@ def test_items(trie_dict):
 def test_merge(ancestor_dict, our_dict, their_dict, merged_dict):
     actual = _merge(ancestor_dict, our_dict, their_dict)
     assert actual == merged_dict
+
+
+def _md5(value):
+    import hashlib
+
+    return hashlib.md5(value.encode()).hexdigest()
+
+
+COMPACT_LIST = [
+    {"md5": _md5("a"), "relpath": "a"},
+    {"md5": _md5("b"), "relpath": "dir/b"},
+    {"md5": _md5("c"), "relpath": "dir/subdir/c"},
+    {"md5": _md5("d"), "relpath": "dir.txt"},
+    {"md5": _md5("e"), "relpath": "dir2/e"},
+]
+
+
+def test_compact():
+    from dvc.path_info import PathInfo
+
+    tree = Tree.from_list(COMPACT_LIST)
+    assert tree._entries.digests is not None
+    assert not tree._dict
+    assert len(tree) == 5
+    assert tree.as_list() == sorted(COMPACT_LIST, key=itemgetter("relpath"))
+
+    tree.set_entries_location("fs", PathInfo("root"))
+    obj = tree.get_entry(("dir", "b"))
+    assert obj.hash_info == HashInfo("md5", _md5("b"))
+    assert obj.fs == "fs"
+    assert obj.path_info == PathInfo("root") / "dir" / "b"
+    assert tree.get_entry(("dir",)) is None
+
+    filtered = tree.filter(("dir",))
+    assert [key for key, _ in filtered] == [
+        ("dir", "b"),
+        ("dir", "subdir", "c"),
+    ]
+    assert tree.filter(("missing",)).as_dict() == {}
+
+    subtree = tree.get(("dir",))
+    assert subtree.as_list() == [
+        {"md5": _md5("b"), "relpath": "b"},
+        {"md5": _md5("c"), "relpath": "subdir/c"},
+    ]
+    ((_, obj), _) = subtree
+    assert obj.path_info == PathInfo("root") / "dir" / "b"
+    assert tree.get(("missing",)) is None
+
+    tree.add(("f",), HashFile(None, None, HashInfo("md5", _md5("f"))))
+    assert tree._entries is None
+    assert len(tree._dict) == 6
+
+
+def test_compact_as_bytes():
+    tree = Tree.from_list(COMPACT_LIST)
+    expected = Tree(None, None, None)
+    for key, obj in tree:
+        expected.add(key, obj)
+    assert tree.as_bytes() == expected.as_bytes()
+
+
+@pytest.mark.parametrize(
+    "value", [_md5("a").upper(), _md5("a")[:-1], "abc.dir", "xyz" * 11]
+)
+def test_compact_unpacked_values(value):
+    lst = [{"md5": value, "relpath": "a"}, {"md5": _md5("b"), "relpath": "b"}]
+    tree = Tree.from_list(lst)
+    assert tree._entries.digests is None
+    assert tree.as_list() == lst
@@ -83,6 +83,119 @@ def test_hashes_exist(object_exists, traverse, dvc):
         )
 
 
+def test_hashes_exist_traverse_streams(dvc):
+    odb = ObjectDB(BaseFileSystem(), None)
+    odb.fs.CAN_TRAVERSE = True
+    odb.fs._ALWAYS_TRAVERSE = True
+
+    def _traverse(*args, **kwargs):
+        yield from (f"{i:032x}" for i in range(0, 1000, 2))
+
+    with mock.patch.object(
+        odb, "_estimate_remote_size", return_value=(1000, set())
+    ), mock.patch.object(odb, "list_hashes_traverse", side_effect=_traverse):
+        hashes = [f"{i:032x}" for i in range(10)]
+        assert sorted(odb.hashes_exist(hashes)) == hashes[::2]
+
+
+def test_hashes_exist_listing_cache(tmp_dir, dvc):
+    odb = ObjectDB(
+        BaseFileSystem(), PathInfo("foo"), tmp_dir=tmp_dir, listing_ttl=60
+    )
+    odb.fs.CAN_TRAVERSE = True
+    odb.fs._ALWAYS_TRAVERSE = True
+    listing = [f"{i:032x}" for i in range(0, 10, 2)]
+
+    with mock.patch.object(
+        odb, "list_hashes", return_value=listing
+    ) as list_hashes:
+        hashes = [f"{i:032x}" for i in range(10)]
+        assert sorted(odb.hashes_exist(hashes)) == listing
+        assert list_hashes.called
+
+        list_hashes.reset_mock()
+        assert sorted(odb.hashes_exist(hashes)) == listing
+        list_hashes.assert_not_called()
+
+
+def test_list_hashes_exists_batches(dvc):
+    odb = ObjectDB(BaseFileSystem(), PathInfo("foo"))
+    hashes = [f"{i:032x}" for i in range(100)]
+
+    def _exists_many(path_infos, **kwargs):
+        return [int(path_info.name, 16) % 2 == 0 for path_info in path_infos]
+
+    with mock.patch.object(
+        odb.fs, "exists_many", side_effect=_exists_many
+    ) as exists_many, mock.patch("time.perf_counter", side_effect=range(100)):
+        assert odb.list_hashes_exists(hashes, jobs=4) == hashes[::2]
+
+    # the first batch measures how long querying takes (i.e. 1/4 second
+    # per hash here), the following ones are sized to take about a second
+    sizes = [len(call[0][0]) for call in exists_many.call_args_list]
+    assert sizes == [4] * 25
+    assert odb._exists_time == 1 / 4
+
+    # batches grow as querying gets faster (i.e. 1/40 second per hash)
+    odb.EXISTS_BATCH_TIME = 10
+    with mock.patch.object(
+        odb.fs, "exists_many", side_effect=_exists_many
+    ) as exists_many, mock.patch("time.perf_counter", side_effect=range(100)):
+        assert odb.list_hashes_exists(hashes, jobs=4) == hashes[::2]
+    sizes = [len(call[0][0]) for call in exists_many.call_args_list]
+    assert sizes == [40, 60]
+    assert odb._exists_time == 1 / 60
+
+
+def test_hashes_exist_measured_times(dvc):
+    odb = ObjectDB(BaseFileSystem(), None)
+    odb.fs.CAN_TRAVERSE = True
+    hashes = set(range(1000))
+
+    with mock.patch.object(
+        odb, "_estimate_remote_size", return_value=(1000000, set())
+    ), mock.patch.object(
+        odb, "list_hashes_exists", return_value=[]
+    ) as object_exists, mock.patch.object(
+        odb, "list_hashes_traverse", return_value=[]
+    ) as traverse:
+        # 1000 pages listed on 10 jobs take as long as 1000 queried hashes
+        odb._list_time = 0.1
+        odb._exists_time = 0.01
+        odb.hashes_exist(hashes, jobs=10)
+        traverse.assert_called_once()
+        object_exists.assert_not_called()
+
+        traverse.reset_mock()
+        odb._exists_time = 0.001
+        odb.hashes_exist(hashes, jobs=10)
+        traverse.assert_not_called()
+        object_exists.assert_called_once_with(hashes, 10, None)
+
+
+def test_measured_times_are_saved(tmp_dir, dvc):
+    odb = ObjectDB(BaseFileSystem(), PathInfo("foo"), tmp_dir=tmp_dir)
+    hashes = [f"{i:032x}" for i in range(8)]
+
+    with mock.patch.object(
+        odb.fs, "exists_many", return_value=[True] * 4
+    ), mock.patch("time.perf_counter", side_effect=range(100)):
+        odb.list_hashes_exists(hashes, jobs=4)
+    assert odb._exists_time == 1 / 4
+
+    # another run starts out with the times measured by the previous one
+    odb = ObjectDB(BaseFileSystem(), PathInfo("foo"), tmp_dir=tmp_dir)
+    with mock.patch.object(
+        odb.fs, "exists_many", return_value=[True] * 8
+    ) as exists_many:
+        odb.list_hashes_exists(hashes, jobs=2)
+    assert [len(call[0][0]) for call in exists_many.call_args_list] == [4, 4]
+
+    other = ObjectDB(BaseFileSystem(), PathInfo("bar"), tmp_dir=tmp_dir)
+    other._load_times()
+    assert other._exists_time is None
+
+
 @mock.patch.object(ObjectDB, "list_hashes", return_value=[])
 @mock.patch.object(ObjectDB, "_path_to_hash", side_effect=lambda x: x)
 def test_list_hashes_traverse(_path_to_hash, list_hashes, dvc):
@@ -115,7 +228,7 @@ def test_list_hashes(dvc):
     odb.path_info = PathInfo("foo")
 
     with mock.patch.object(
-        odb, "_list_paths", return_value=["12/3456", "bar"]
+        odb, "_list_paths", return_value=["12/3456", "bar", "12/"]
     ):
         hashes = list(odb.list_hashes())
         assert hashes == ["123456"]
@@ -135,6 +248,35 @@ def test_list_paths(dvc):
         walk_mock.assert_called_with(path_info / "00" / "0", prefix=True)
 
 
+def test_list_paths_find_pages(dvc):
+    from dvc.fs.fsspec_wrapper import ObjectFSWrapper
+    from dvc.path_info import CloudURLInfo
+
+    pages = [
+        ["bucket/cache/00/0000", "bucket/cache/00/0001"],
+        ["bucket/cache/01/0100"],
+    ]
+    listed = []
+
+    def find_pages(path, prefix=None):
+        assert path == "bucket/cache"
+        assert prefix is None
+        for page in pages:
+            listed.append(page)
+            yield page
+
+    fs = ObjectFSWrapper()
+    fs.PATH_CLS = CloudURLInfo
+    odb = ObjectDB(fs, CloudURLInfo("s3://bucket/cache"))
+    with mock.patch.object(fs, "_find_pages", side_effect=find_pages):
+        hashes = odb.list_hashes()
+        # pages are only listed as they are needed
+        assert next(hashes) == "000000"
+        assert listed == pages[:1]
+        assert list(hashes) == ["000001", "010100"]
+        assert listed == pages
+
+
 @pytest.mark.parametrize(
     "hash_, result",
     [(None, False), ("", False), ("3456.dir", True), ("3456", False)],
@@ -74,6 +74,37 @@ def test_walk_onerror(tmp_dir, scm):
             pass
 
 
+def test_get_fs_shares_trees(tmp_dir, scm, mocker):
+    from dvc.scm.git.objects import GitTreeCache
+
+    tmp_dir.scm_gen(
+        {"dir": {"foo": "foo", "sub": {"bar": "bar"}}, "baz": "baz"},
+        commit="init",
+    )
+    first_rev = scm.get_rev()
+    tmp_dir.scm_gen("baz", "changed", commit="change baz")
+
+    spy = mocker.spy(GitTreeCache, "get")
+    fs = scm.get_fs(first_rev)
+    assert fs.isfile(os.path.join("dir", "sub", "bar"))
+    assert not fs.exists(os.path.join("dir", "missing"))
+    assert not fs.exists(os.path.join("baz", "foo"))
+    with fs.open("baz") as fobj:
+        assert fobj.read() == "baz"
+
+    # only the trees on the way to the requested paths are expanded
+    expanded = {call.args[1].sha for call in spy.call_args_list}
+    assert len(expanded) == 3
+    scandir = mocker.spy(type(fs.trie.tree), "scandir")
+
+    # "dir" is the same tree in both revisions, so it isn't expanded again
+    fs = scm.get_fs("HEAD")
+    assert fs.isfile(os.path.join("dir", "sub", "bar"))
+    with fs.open("baz") as fobj:
+        assert fobj.read() == "changed"
+    assert scandir.call_count == 1
+
+
 def test_is_tracked(tmp_dir, scm):
     tmp_dir.scm_gen(
         {
@@ -83,7 +83,7 @@ def test_stage_update(mocker):
 )
 def test_stage_run_ignore_sigint(dvc, mocker):
     proc = mocker.Mock()
-    communicate = mocker.Mock()
+    communicate = mocker.Mock(return_value=(None, None))
     proc.configure_mock(returncode=0, communicate=communicate)
     popen = mocker.patch.object(subprocess, "Popen", return_value=proc)
     signal_mock = mocker.patch("signal.signal")
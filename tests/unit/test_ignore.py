@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
-from dvc.ignore import DvcIgnorePatterns
+from dvc.ignore import DvcIgnorePatterns, GitIgnorePatterns
 
 
 def mock_dvcignore(dvcignore_path, patterns):
@@ -209,3 +209,55 @@ def test_should_ignore_dir(omit_dir, sub_dir):
 
     assert set(new_dirs) == {"dir1", "dir2"}
     assert set(new_files) == {"file1", "file2", omit_dir}
+
+
+@pytest.mark.parametrize(
+    "path, is_dir, patterns, expected_match",
+    [
+        ("data", True, ["data/"], True),
+        ("data", False, ["data/"], False),
+        (os.path.join("sub", "data"), True, ["data/"], True),
+        (os.path.join("sub", "data"), True, ["/data/"], False),
+        # contents of ignored directories are not matched, they are never
+        # walked into
+        (os.path.join("data", "file"), False, ["data/"], False),
+        (os.path.join("data", "file"), False, ["data"], False),
+        (os.path.join("data", "file"), False, ["data/**"], True),
+        ("data", True, ["data/**"], False),
+        (os.path.join("data", "sub"), True, ["data/**/"], True),
+        (os.path.join("data", "file"), False, ["data/**/"], False),
+        ("data", True, ["data/**/"], False),
+        # negation
+        ("file.txt", False, ["*.txt", "!file.txt"], False),
+        ("other.txt", False, ["*.txt", "!file.txt"], True),
+        ("file.txt", False, ["!file.txt", "*.txt"], True),
+        (
+            os.path.join("data", "sub"),
+            True,
+            ["data/**", "!data/**/"],
+            False,
+        ),
+        (
+            os.path.join("data", "sub", "file.dvc"),
+            False,
+            ["data/**", "!data/**/", "!data/**/*.dvc"],
+            False,
+        ),
+        (
+            os.path.join("data", "sub", "file.csv"),
+            False,
+            ["data/**", "!data/**/", "!data/**/*.dvc"],
+            True,
+        ),
+        # negated dir-only patterns don't match files
+        ("data", False, ["data", "!data/"], True),
+        ("data", True, ["data", "!data/"], False),
+        ("!file", False, ["\\!file"], True),
+        ("ab", False, ["[!a]b"], False),
+        ("bb", False, ["[!a]b"], True),
+    ],
+)
+def test_gitignore_patterns_match(path, is_dir, patterns, expected_match):
+    root = os.path.join(os.path.sep, "walk", "root")
+    ignore = GitIgnorePatterns(patterns, root)
+    assert ignore.matches(root, path, is_dir) == expected_match
@@ -93,3 +93,23 @@ def test_broken_rwlock(tmp_path):
     with pytest.raises(RWLockFileCorruptedError):
         with _edit_rwlock(dir_path):
             pass
+
+
+def test_rwlock_released_by_last_holder(tmp_path):
+    path = os.fspath(tmp_path)
+    foo = PathInfo("foo")
+
+    # e.g. stages that are being reproduced concurrently, both reading foo
+    first = rwlock(path, "cmd1", [foo], [])
+    second = rwlock(path, "cmd1", [foo], [])
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+
+    with pytest.raises(LockError):
+        with rwlock(path, "cmd2", [], [foo]):
+            pass
+
+    second.__exit__(None, None, None)
+    with rwlock(path, "cmd2", [], [foo]):
+        pass
@@ -15,6 +15,7 @@ from dvc.utils.fs import (
     contains_symlink_up_to,
     copy_fobj_to_file,
     copyfile,
+    copyfileobj,
     get_inode,
     get_mtime_and_size,
     makedirs,
@@ -283,6 +284,47 @@ def test_copyfile(path, tmp_dir):
         assert filecmp.cmp(src_info, dest_info, shallow=False)
 
 
+@pytest.mark.parametrize("supported", [["copy_file_range"], ["sendfile"], []])
+def test_copyfile_kernel_copy(tmp_dir, mocker, supported):
+    import errno
+
+    content = os.urandom(1000)
+    tmp_dir.gen("foo", content)
+    mocker.patch.object(dvc.utils.fs, "KERNEL_COPY_CHUNK_SIZE", 300)
+    mocker.patch.object(
+        System,
+        "reflink",
+        side_effect=dvc.exceptions.DvcException("reflink is not supported"),
+    )
+    for name in ["copy_file_range", "sendfile"]:
+        if hasattr(os, name) and name not in supported:
+            mocker.patch.object(
+                os, name, side_effect=OSError(errno.ENOSYS, "")
+            )
+    callback = mocker.Mock()
+
+    copyfile("foo", "bar", callback=callback)
+    assert (tmp_dir / "bar").read_bytes() == content
+    callback.absolute_update.assert_called_once_with(1000)
+    if supported and hasattr(os, supported[0]):
+        updates = callback.relative_update.call_args_list
+        assert [call.args[0] for call in updates] == [
+            300,
+            300,
+            300,
+            100,
+        ]
+
+
+def test_copyfileobj(tmp_dir):
+    tmp_dir.gen({"foo": "foo content", "bar": "bar"})
+
+    with open("foo", "rb") as fsrc, open("bar", "ab") as fdest:
+        fsrc.read(4)
+        copyfileobj(fsrc, fdest)
+    assert (tmp_dir / "bar").read_text() == "barcontent"
+
+
 def test_copy_fobj_to_file(tmp_dir):
     tmp_dir.gen({"foo": "foo content"})
     src = tmp_dir / "foo"
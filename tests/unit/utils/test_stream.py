@@ -1,9 +1,10 @@
 import pytest
 
+import dvc.utils.stream
 from dvc.fs.local import LocalFileSystem
 from dvc.istextfile import DEFAULT_CHUNK_SIZE, istextfile
 from dvc.utils import file_md5
-from dvc.utils.stream import HashedStreamReader
+from dvc.utils.stream import HashedStreamReader, readahead
 
 
 def test_hashed_stream_reader(tmp_dir):
@@ -72,3 +73,45 @@ def test_hashed_stream_reader_compatibility(tmp_dir, contents):
 
     assert stream_reader.is_text_file is istextfile(data, local_fs)
     assert stream_reader.hash_info.value == hex_digest
+
+
+def test_readahead(tmp_dir):
+    tmp_dir.gen({"foo": b"0123456789" * 10})
+
+    with open(tmp_dir / "foo", "rb") as fobj:
+        chunks = list(readahead(fobj, 16, depth=2))
+
+    assert [len(chunk) for chunk in chunks] == [16] * 6 + [4]
+    assert b"".join(chunks) == b"0123456789" * 10
+
+
+def test_readahead_early_exit(tmp_dir):
+    tmp_dir.gen({"foo": b"0123456789" * 10})
+
+    with open(tmp_dir / "foo", "rb") as fobj:
+        chunks = readahead(fobj, 1, depth=2)
+        assert next(chunks) == b"0"
+        chunks.close()
+
+
+def test_readahead_error():
+    class BrokenFile:
+        def read(self, _size):
+            raise OSError("broken")
+
+    with pytest.raises(OSError, match="broken"):
+        list(readahead(BrokenFile(), 16))
+
+
+def test_file_md5_readahead(tmp_dir, mocker):
+    tmp_dir.gen({"foo": b"foo \x00" * 1024, "bar": "foo\r\nbar\r\n" * 1024})
+    fs = LocalFileSystem()
+    expected = {name: file_md5(tmp_dir / name, fs) for name in ("foo", "bar")}
+
+    mocker.patch("dvc.utils.READAHEAD_FILE_SIZE", 1)
+    mocker.patch("dvc.utils.LOCAL_CHUNK_SIZE", 80)
+    spy = mocker.spy(dvc.utils.stream, "readahead")
+    for name, md5 in expected.items():
+        assert file_md5(tmp_dir / name, fs) == md5
+    # NOTE: workspace files are read rather than memory-mapped
+    assert spy.call_count == 2
@@ -1,8 +1,10 @@
 import os
 import re
+from hashlib import md5
 
 import pytest
 
+import dvc.utils
 from dvc.fs.local import LocalFileSystem
 from dvc.path_info import PathInfo
 from dvc.utils import (
@@ -91,6 +93,53 @@ def test_file_md5(tmp_dir):
     assert file_md5("foo", fs) == file_md5(PathInfo("foo"), fs)
 
 
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        b"foo \x00" * 100,
+        b"foo\nbar\n" * 100,
+        b"foo\r\nbar\r\n" * 100,
+        # CRLF split across the chunk boundary is not normalized
+        b"x" * 63 + b"\r\n" + b"foo\r\n" * 20,
+    ],
+)
+def test_file_md5_mmap(tmp_dir, mocker, contents):
+    tmp_dir.gen("foo", contents)
+    os.chmod("foo", 0o444)
+    fs = LocalFileSystem()
+    mocker.patch("dvc.utils.LOCAL_CHUNK_SIZE", 64)
+
+    md5 = file_md5("foo", fs)
+    mocker.patch("dvc.utils.mmap.mmap", side_effect=ValueError)
+    assert file_md5("foo", fs) == md5
+
+
+def test_file_md5_mmap_only_read_only(tmp_dir, mocker):
+    tmp_dir.gen({"foo": "foo", "bar": "bar"})
+    os.chmod("bar", 0o444)
+    fs = LocalFileSystem()
+    spy = mocker.spy(dvc.utils, "_mmap_md5")
+
+    file_md5("foo", fs)
+    assert not spy.called
+    file_md5("bar", fs)
+    assert spy.called
+
+
+def test_file_md5_mmap_truncated(tmp_dir, mocker):
+    tmp_dir.gen("foo", b"foo \x00" * 100)
+    os.chmod("foo", 0o444)
+    fs = LocalFileSystem()
+    mocker.patch("dvc.utils.LOCAL_CHUNK_SIZE", 64)
+    mocker.patch("dvc.utils.os.fstat", return_value=os.stat_result((0,) * 10))
+    read = mocker.spy(dvc.utils, "_fobj_md5")
+
+    # falls back to reading the file, rather than accessing the mapping
+    assert file_md5("foo", fs) == md5(b"foo \x00" * 100).hexdigest()
+    assert read.called
+
+
 def test_tmp_fname():
     file_path = os.path.join("path", "to", "file")
     file_path_info = PathInfo(file_path)